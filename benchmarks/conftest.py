@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks fixtures."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from invenio_cli.helpers.process import ProcessResponse
+
+PIPFILE = """\
+[[source]]
+url = "https://pypi.org/simple"
+verify_ssl = true
+name = "pypi"
+
+[dev-packages]
+check-manifest = ">=0.25"
+
+[packages]
+invenio-app-rdm = {extras = ["opensearch2"], version = "~=13.0.0"}
+uwsgi = ">=2.0"
+uwsgitop = ">=0.11"
+uwsgi-tools = ">=1.1.1"
+
+[requires]
+python = "3.12"
+"""
+
+PYPROJECT = """\
+[project]
+name = "my-site"
+version = "1.0.0"
+requires-python = ">=3.12"
+dependencies = [
+    "invenio-app-rdm[opensearch2]~=13.0.0",
+    "uwsgi>=2.0",
+    "uwsgitop>=0.11",
+    "uwsgi-tools>=1.1.1",
+]
+"""
+
+
+def _write_config(project_dir):
+    """Write the CLI configuration files of a generated project."""
+    (project_dir / ".invenio").write_text(
+        "[cli]\n"
+        "flavour = RDM\n"
+        f"logfile = {project_dir}/logs/invenio-cli.log\n"
+        "python_package_manager = pipenv\n"
+        "\n[cookiecutter]\n"
+        "project_name = My Site\n"
+        "project_shortname = my-site\n"
+        "package_name = my_site\n"
+        "database = postgresql\n"
+        "search = opensearch2\n"
+        "file_storage = local\n"
+        "\n[files]\n" + "".join(f"file{i} = {'0' * 32}\n" for i in range(50))
+    )
+    (project_dir / ".invenio.private").write_text(
+        "[cli]\n"
+        f"project_dir = {project_dir}\n"
+        f"instance_path = {project_dir}/.venv/var/instance\n"
+        "services_setup = True\n"
+    )
+
+
+@pytest.fixture()
+def project_dir(tmp_path, monkeypatch):
+    """A generated project (Pipfile flavour), set as current directory."""
+    _write_config(tmp_path)
+    (tmp_path / "Pipfile").write_text(PIPFILE)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture()
+def uv_project_dir(tmp_path, monkeypatch):
+    """A generated project (pyproject.toml flavour), set as current directory."""
+    _write_config(tmp_path)
+    (tmp_path / "pyproject.toml").write_text(PYPROJECT)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def make_tree(root, dirs, files_per_dir, depth, file_size=2048):
+    """Create a synthetic source tree, ``dirs`` folders wide per level."""
+    for i in range(files_per_dir):
+        (root / f"file{i}.py").write_bytes(bytes([i % 256]) * file_size)
+    if depth == 0:
+        return
+    for i in range(dirs):
+        subdir = root / f"dir{i}"
+        subdir.mkdir()
+        make_tree(subdir, dirs, files_per_dir, depth - 1, file_size)
+
+
+@pytest.fixture(
+    params=[(4, 10, 2), (6, 20, 3)],
+    ids=["small", "large"],
+    scope="session",
+)
+def source_tree(request, tmp_path_factory):
+    """Synthetic trees of ~200 and ~5000 files."""
+    root = tmp_path_factory.mktemp("tree")
+    make_tree(root, *request.param)
+    return root
+
+
+class FakeContainer(object):
+    """Container as returned by the docker SDK."""
+
+    def __init__(self, name, project, service):
+        """Constructor."""
+        self.name = name
+        self.labels = {
+            "com.docker.compose.project": project,
+            "com.docker.compose.service": service,
+        }
+        self.status = "running"
+
+
+@pytest.fixture()
+def fake_docker():
+    """Docker SDK client listing the containers of a few projects.
+
+    The containers of ``my-site`` are also named the legacy compose way.
+    """
+    client = Mock()
+    services = ("db", "cache", "search", "mq", "pgadmin", "opensearch-dashboards")
+    containers = [
+        FakeContainer(f"{project}-{service}-1", project, service)
+        for project in ("my-site", "other-site", "third-site")
+        for service in services
+    ] + [
+        FakeContainer(f"mysite_{service}_1", "mysite", service) for service in services
+    ]
+    client.containers.list.return_value = containers
+    with patch(
+        "invenio_cli.helpers.docker_helper.docker.from_env", return_value=client
+    ):
+        yield client
+
+
+@pytest.fixture(params=["v2.27.0", "1.20.1"], ids=["compose-v2", "compose-legacy"])
+def compose_version(request):
+    """Stub ``docker compose version`` answering the given version."""
+    response = ProcessResponse(
+        output=f"Docker Compose version {request.param}\n", status_code=0
+    )
+    with patch(
+        "invenio_cli.helpers.docker_helper.run_cmd", return_value=response
+    ) as stub:
+        yield stub
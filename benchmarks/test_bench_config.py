@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Configuration and project introspection benchmarks."""
+
+import pytest
+
+from invenio_cli.helpers.cli_config import CLIConfig
+from invenio_cli.helpers.docker_helper import DockerHelper
+from invenio_cli.helpers.filesystem import get_created_files
+from invenio_cli.helpers.versions import rdm_version
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_cli_config(benchmark, project_dir):
+    """Loading the configuration of a project."""
+    config = benchmark(CLIConfig, project_dir)
+    assert config.get_project_shortname() == "my-site"
+
+
+def test_cli_config_package_manager(benchmark, project_dir):
+    """Loading the configuration and its Python package manager."""
+
+    def _load():
+        return CLIConfig(project_dir).python_package_manager
+
+    assert benchmark(_load).name == "pipenv"
+
+
+def test_docker_helper_init(benchmark, fake_docker, compose_version):
+    """Creating the Docker helper, which detects the compose version."""
+    helper = benchmark(DockerHelper, "my-site", local=True)
+    assert helper.container_prefix in ("my-site", "mysite")
+
+
+def test_docker_helper_container_lookup(benchmark, fake_docker, compose_version):
+    """Finding the container of a service among other projects'."""
+    helper = DockerHelper("my-site", local=True)
+    container = benchmark(helper._get_container_from_service, "search")
+    assert container.name.startswith(helper.container_prefix)
+
+
+def test_get_created_files(benchmark, source_tree):
+    """Hashing the files of a project tree."""
+    files = benchmark(get_created_files, source_tree)
+    assert "dir0" in files
+
+
+def test_rdm_version_pipfile(benchmark, project_dir):
+    """Reading the RDM version from a Pipfile."""
+    assert benchmark(rdm_version) == [13, 0, 0]
+
+
+def test_rdm_version_pyproject(benchmark, uv_project_dir):
+    """Reading the RDM version from a pyproject.toml."""
+    assert benchmark(rdm_version) == [13, 0, 0]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Step engine and health checks benchmarks."""
+
+from unittest.mock import patch
+
+import pytest
+
+from invenio_cli.cli.utils import run_steps
+from invenio_cli.commands.services_health import ServicesHealthCommands
+from invenio_cli.commands.steps import CommandStep, FunctionStep, ParallelStep
+from invenio_cli.helpers.process import ProcessResponse, run_cmd
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _noop():
+    return ProcessResponse(output="done", status_code=0)
+
+
+def test_run_steps_overhead(benchmark):
+    """Overhead of running 100 no-op function steps."""
+    steps = [FunctionStep(func=_noop, message=f"Step {i}...") for i in range(100)]
+    benchmark(run_steps, steps, "Failed.", "Done.")
+
+
+def test_command_step(benchmark):
+    """Running a command step, a subprocess doing nothing."""
+    step = CommandStep(cmd=["true"], message="Running true...")
+    assert benchmark(step.execute).status_code == 0
+
+
+def test_parallel_step(benchmark):
+    """Running four command steps in parallel."""
+    step = ParallelStep(
+        steps=[CommandStep(cmd=["true"]) for _ in range(4)], message="Parallel..."
+    )
+    assert benchmark(step.execute).status_code == 0
+
+
+@pytest.mark.parametrize("service", ["postgresql", "redis", "search"])
+def test_healthcheck_latency(benchmark, service):
+    """Latency of a successful health check, the command being stubbed."""
+    with patch(
+        "invenio_cli.commands.services_health.run_cmd",
+        side_effect=lambda cmd: run_cmd(["true"]),
+    ):
+        ready = benchmark(
+            ServicesHealthCommands.wait_for_service,
+            service,
+            "my-site",
+            print_func=print,
+        )
+    assert ready
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio module to ease the creation and management of applications."""
+
+import click
+
+from ..commands import BenchCommands
+from .utils import handle_process_response, pass_cli_config
+
+
+def _parse_endpoints(ctx, param, value):
+    """Parse the repeated ``NAME=PATH`` endpoint options."""
+    endpoints = {}
+    for definition in value:
+        name, sep, path = definition.partition("=")
+        if not sep or not name or not path.startswith("/"):
+            raise click.BadParameter(
+                f"Expected NAME=PATH (e.g. search=/api/records), got '{definition}'."
+            )
+        accept = "application/json" if path.startswith("/api/") else "text/html"
+        endpoints[name] = (path, accept)
+    return endpoints or None
+
+
+@click.group()
+def bench():
+    """Commands to benchmark a running instance."""
+
+
+@bench.command()
+@click.option(
+    "--host",
+    "-h",
+    default=None,
+    help="Host of the instance. The default is defined in the CLIConfig.",
+)
+@click.option(
+    "--port",
+    "-p",
+    default=None,
+    help="Port of the instance. The default is defined in the CLIConfig.",
+)
+@click.option(
+    "--endpoint",
+    "-e",
+    "endpoints",
+    multiple=True,
+    metavar="NAME=PATH",
+    callback=_parse_endpoints,
+    help="Endpoint to benchmark, can be repeated. '{record_id}' is replaced by "
+    + "the id of a published record (default: records search, a record landing "
+    + "page and the communities list).",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=10,
+    help="Number of concurrent connections (default: 10).",
+)
+@click.option(
+    "--duration",
+    "-d",
+    type=click.FloatRange(min=0, min_open=True),
+    default=30,
+    help="Duration of the run in seconds (default: 30).",
+)
+@click.option(
+    "--requests",
+    "-n",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop after this many requests instead of after --duration.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=30,
+    help="Timeout of a request in seconds (default: 30).",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w"),
+    default=None,
+    help="Write the JSON report to this file instead of the standard output.",
+)
+@pass_cli_config
+def http(
+    cli_config, host, port, endpoints, concurrency, duration, requests, timeout, output
+):
+    """Measure the throughput and latency of the instance's HTTP endpoints.
+
+    The report contains the requests per second and the p50/p95/p99
+    latencies, overall and per endpoint, along with the project's current
+    git commit so that runs can be compared.
+    """
+    host = host or cli_config.get_web_host()
+    port = port or cli_config.get_web_port()
+
+    click.secho(
+        f"Benchmarking https://{host}:{port} with {concurrency} connections...",
+        fg="green",
+        err=True,
+    )
+    response = BenchCommands(cli_config).http(
+        host,
+        port,
+        endpoints=endpoints,
+        concurrency=concurrency,
+        duration=None if requests else duration,
+        requests=requests,
+        timeout=timeout,
+    )
+    if response.status_code > 0:
+        handle_process_response(response, fail_message="Benchmark failed.")
+    click.echo(response.output, file=output)
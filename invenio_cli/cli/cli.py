@@ -11,6 +11,7 @@
 """Invenio module to ease the creation and management of applications."""
 
 import os
+import sys
 from pathlib import Path
 
 import click
@@ -23,10 +24,15 @@ from ..commands import (
     ServicesCommands,
     UpgradeCommands,
 )
+from ..commands.local import parse_queue_pool
+from ..helpers import fingerprints, log, profiling, tracing
 from ..helpers.cli_config import CLIConfig
 from ..helpers.cookiecutter_wrapper import CookiecutterWrapper
 from .assets import assets
+from .bench import bench
 from .containers import containers
+from .daemon import daemon
+from .doctor import doctor
 from .install import install
 from .packages import packages
 from .services import services
@@ -38,16 +44,113 @@ from .utils import (
     run_steps,
 )
 
-
-@click.group()
+COMMAND_NAME_KEY = "invenio_cli.command_name"
+"""Key of the full name of the invoked command in the context's meta."""
+
+
+def _command_name(ctx, name, command, args):
+    """Return the full name of a subcommand invoked with ``args``.
+
+    The options of the intermediate groups are parsed by click, the name
+    is e.g. ``invenio-cli services setup``.
+    """
+    names = [ctx.command_path, name]
+    while isinstance(command, click.Group) and args:
+        ctx = click.Context(command, info_name=name, parent=ctx)
+        try:
+            _, args, _ = command.make_parser(ctx).parse_args(args)
+            if not args:
+                break
+            name, command, args = command.resolve_command(ctx, args)
+        except click.UsageError:
+            break  # reported by click when the group is invoked
+        names.append(name)
+    return " ".join(names)
+
+
+class TracedGroup(click.Group):
+    """Group whose invoked command is traced in a span, if enabled."""
+
+    def resolve_command(self, ctx, args):
+        """Name the span of the command before the group callback runs."""
+        name, command, args = super().resolve_command(ctx, args)
+        if command is not None:
+            ctx.meta[COMMAND_NAME_KEY] = _command_name(ctx, name, command, args)
+        return name, command, args
+
+    def invoke(self, ctx):
+        """Mark the span of the command as failed if it did not succeed."""
+        try:
+            return super().invoke(ctx)
+        except BaseException as e:
+            span = tracing.current_span()
+            if span:
+                span.set_exception(e)
+            raise
+
+
+@click.group(cls=TracedGroup)
 @click.version_option()
+@click.option(
+    "--trace",
+    "trace_file",
+    type=click.Path(dir_okay=False),
+    envvar="INVENIO_CLI_TRACE_FILE",
+    default=None,
+    help="Append OTLP/JSON spans of the command, its steps and subprocesses "
+    + "to this file.",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False),
+    envvar="INVENIO_CLI_PROFILE_DIR",
+    default=None,
+    help="Profile the invenio commands run by the CLI, writing one py-spy "
+    + "(speedscope) or cProfile file per command, named after its step, to "
+    + "this directory.",
+)
+@click.option(
+    "--no-cache",
+    default=False,
+    is_flag=True,
+    envvar="INVENIO_CLI_NO_CACHE",
+    help="Run the steps even if their outputs are up to date.",
+)
 @click.pass_context
-def invenio_cli(ctx):
+def invenio_cli(ctx, trace_file, profile_dir, no_cache):
     """Initialize CLI context."""
+    if profile_dir:
+        profiling.configure(profile_dir)
+    if Path(CLIConfig.CONFIG_FILENAME).is_file():
+        # in a project, log to the configured file; the configuration passed
+        # to the commands is only created (with its private file) if needed
+        cli_config = CLIConfig(write_private=False)
+        fingerprints.configure(cli_config.get_cache_dir(), force=no_cache)
+        log_file = cli_config.get_log_file()
+        if log_file:
+            log.setup(
+                log_file,
+                max_bytes=cli_config.get_log_max_bytes(),
+                backup_count=cli_config.get_log_backup_count(),
+            )
+            ctx.call_on_close(log.shutdown)
+    if trace_file:
+        tracing.configure(trace_file)
+        # the command span ends before the spans are written
+        ctx.call_on_close(tracing.flush)
+        ctx.with_resource(
+            tracing.span(
+                ctx.meta.get(COMMAND_NAME_KEY, ctx.command_path),
+                **{"process.command_args": sys.argv},
+            )
+        )
 
 
 invenio_cli.add_command(assets)
+invenio_cli.add_command(bench)
 invenio_cli.add_command(containers)
+invenio_cli.add_command(daemon)
+invenio_cli.add_command(doctor)
 invenio_cli.add_command(install)
 invenio_cli.add_command(packages)
 invenio_cli.add_command(services)
@@ -87,10 +190,18 @@ def shell(cli_config):
     is_flag=True,
     help="Enable Flask development mode (default: disabled).",
 )
+@click.option(
+    "--attach",
+    default=False,
+    is_flag=True,
+    help="Start the shell in the warm application of the daemon.",
+)
 @pass_cli_config
-def pyshell(cli_config, debug):
+def pyshell(cli_config, debug, attach):
     """Python shell command."""
-    Commands(cli_config).pyshell(debug=debug)
+    response = Commands(cli_config).pyshell(debug=debug, attach=attach)
+    if response.error:
+        handle_process_response(response)
 
 
 @invenio_cli.command()
@@ -185,6 +296,26 @@ web_options = combine_decorators(
         is_flag=True,
         help="Enable/disable debug mode including auto-reloading (default: enabled).",
     ),
+    click.option(
+        "--server",
+        type=click.Choice(["flask", "gunicorn", "uwsgi"]),
+        default="flask",
+        help="Web server: the Flask development server, or gunicorn/uwsgi "
+        + "with preloaded worker processes (default: flask).",
+    ),
+    click.option(
+        "--workers",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Number of gunicorn/uwsgi worker processes "
+        + "(default: 2 * CPU cores + 1).",
+    ),
+    click.option(
+        "--threads",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Number of threads per gunicorn/uwsgi worker (default: none).",
+    ),
 )
 
 
@@ -192,8 +323,13 @@ web_options = combine_decorators(
 @services_option
 @web_options
 @pass_cli_config
-def run_web(cli_config, host, port, debug, services):
-    """Starts the local development web server."""
+def run_web(cli_config, host, port, debug, services, server, workers, threads):
+    """Starts the local web server.
+
+    The Flask development server is used by default, ``--server`` runs the
+    application with gunicorn or uwsgi instead (to be installed in the
+    virtual environment), e.g. for load testing. Debug mode is then off.
+    """
     if services:
         cmds = ServicesCommands(cli_config)
         response = cmds.ensure_containers_running()
@@ -204,11 +340,39 @@ def run_web(cli_config, host, port, debug, services):
     port = port or cli_config.get_web_port()
 
     commands = LocalCommands(cli_config)
-    processes = commands.run_web(host=host, port=str(port), debug=debug)
+    processes = commands.run_web(
+        host=host,
+        port=str(port),
+        debug=debug,
+        server=server,
+        workers=workers,
+        threads=threads,
+    )
     for proc in processes:
         proc.wait()
 
 
+def _parse_autoscale(ctx, param, value):
+    """Parse the ``MIN,MAX`` autoscale option."""
+    if value is None:
+        return None
+    try:
+        minimum, maximum = (int(v) for v in value.split(","))
+    except ValueError:
+        raise click.BadParameter("Expected MIN,MAX, e.g. '2,8'.")
+    if not 0 <= minimum <= maximum or maximum < 1:
+        raise click.BadParameter("Expected 0 <= MIN <= MAX and MAX >= 1.")
+    return minimum, maximum
+
+
+def _parse_queue_pools(ctx, param, value):
+    """Parse the repeated ``QUEUE[,QUEUE][:CONCURRENCY]`` pool options."""
+    try:
+        return [parse_queue_pool(v) for v in value]
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
 worker_options = combine_decorators(
     click.option(
         "--celery-log-file",
@@ -225,6 +389,43 @@ worker_options = combine_decorators(
         default=True,
         help="Enable/disable separate jobs scheduler (default: enabled)",
     ),
+    click.option(
+        "--concurrency",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Number of worker processes/threads per pool (default: the CPU "
+        + "cores, shared by the pools, for the prefork and solo pools; the "
+        + "Celery default for the others).",
+    ),
+    click.option(
+        "--autoscale",
+        default=None,
+        metavar="MIN,MAX",
+        callback=_parse_autoscale,
+        help="Scale the worker pools between MIN and MAX processes with the load "
+        + "(prefork pool only).",
+    ),
+    click.option(
+        "--pool",
+        type=click.Choice(["prefork", "threads", "gevent", "eventlet", "solo"]),
+        default=None,
+        help="Celery execution pool (default: prefork).",
+    ),
+    click.option(
+        "--queue-pool",
+        "queue_pools",
+        multiple=True,
+        metavar="QUEUE[,QUEUE][:CONCURRENCY]",
+        callback=_parse_queue_pools,
+        help="Consume the given queues in a dedicated worker, e.g. 'low:2'. "
+        + "Can be repeated.",
+    ),
+    click.option(
+        "--separate-beat/--embedded-beat",
+        default=False,
+        help="Run the periodic tasks scheduler in its own process instead of "
+        + "in the worker (default: embedded).",
+    ),
 )
 
 
@@ -232,8 +433,20 @@ worker_options = combine_decorators(
 @services_option
 @worker_options
 @pass_cli_config
-def run_worker(cli_config, services, celery_log_file, celery_log_level, jobs_scheduler):
-    """Starts the local development server."""
+def run_worker(
+    cli_config,
+    services,
+    celery_log_file,
+    celery_log_level,
+    jobs_scheduler,
+    **worker_scaling,
+):
+    """Starts the local development server.
+
+    By default a single worker consumes all queues with one process per CPU
+    core. Busy queues can be given their own worker with ``--queue-pool``,
+    the CPU cores being shared by the pools.
+    """
     if services:
         cmds = ServicesCommands(cli_config)
         response = cmds.ensure_containers_running()
@@ -245,6 +458,7 @@ def run_worker(cli_config, services, celery_log_file, celery_log_level, jobs_sch
         celery_log_file=celery_log_file,
         celery_log_level=celery_log_level,
         jobs_scheduler=jobs_scheduler,
+        **worker_scaling,
     )
     for proc in processes:
         proc.wait()
@@ -254,6 +468,12 @@ def run_worker(cli_config, services, celery_log_file, celery_log_level, jobs_sch
 @services_option
 @web_options
 @worker_options
+@click.option(
+    "--max-restarts",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Give up after a process crashed this many times (default: never).",
+)
 @pass_cli_config
 def run_all(
     cli_config,
@@ -264,8 +484,17 @@ def run_all(
     celery_log_file,
     celery_log_level,
     jobs_scheduler,
+    max_restarts,
+    server,
+    workers,
+    threads,
+    **worker_scaling,
 ):
-    """Starts web and worker development servers."""
+    """Starts web and worker development servers.
+
+    The processes are supervised: crashed ones are restarted with backoff
+    and their output is prefixed with the process name.
+    """
     if services:
         cmds = ServicesCommands(cli_config)
         response = cmds.ensure_containers_running()
@@ -276,7 +505,7 @@ def run_all(
     port = port or cli_config.get_web_port()
 
     commands = LocalCommands(cli_config)
-    processes = commands.run_all(
+    exit_code = commands.run_all(
         host=host,
         port=str(port),
         debug=debug,
@@ -284,9 +513,13 @@ def run_all(
         celery_log_file=celery_log_file,
         celery_log_level=celery_log_level,
         jobs_scheduler=jobs_scheduler,
+        max_restarts=max_restarts,
+        server=server,
+        workers=workers,
+        threads=threads,
+        **worker_scaling,
     )
-    for proc in processes:
-        proc.wait()
+    exit(exit_code)
 
 
 @invenio_cli.command()
@@ -309,10 +542,34 @@ def destroy(cli_config):
 
 @invenio_cli.command()
 @click.option("--script", required=True, help="The path of custom migration script.")
+@click.option(
+    "--parallel/--sequential",
+    default=True,
+    is_flag=True,
+    help="Rebuild the independent indices at the same time (default: parallel).",
+)
+@click.option(
+    "--index-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of concurrent bulk indexing processes (default: half the CPUs).",
+)
+@click.option(
+    "--zero-downtime",
+    default=False,
+    is_flag=True,
+    help="Rebuild the indices under a new name while the current ones keep serving "
+    + "and switch to them once done. The celery workers must be stopped meanwhile.",
+)
 @pass_cli_config
-def upgrade(cli_config, script):
+def upgrade(cli_config, script, parallel, index_workers, zero_downtime):
     """Upgrades the current instance to a newer version."""
-    steps = UpgradeCommands(cli_config).upgrade(script)
+    steps = UpgradeCommands(cli_config).upgrade(
+        script,
+        parallel=parallel,
+        index_workers=index_workers,
+        zero_downtime=zero_downtime,
+    )
     on_fail = "Upgrade failed."
     on_success = "Upgrade sucessfull."
 
@@ -11,8 +11,15 @@
 import click
 
 from ..commands import ContainersCommands
+from ..helpers.process import ProcessResponse
 from .services import status as services_status_cmd
-from .utils import pass_cli_config, run_steps
+from .utils import (
+    combine_decorators,
+    handle_process_response,
+    pass_cli_config,
+    print_steps,
+    run_steps,
+)
 
 
 @click.group()
@@ -33,14 +40,27 @@ def containers():
     is_flag=True,
     help="Disable cache (default=False).",
 )
+@click.option(
+    "--layer-cache",
+    "layer_cache_dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Import and export the BuildKit layer cache from and to this "
+    + "directory, e.g. cached by CI. Requires a buildx builder with the "
+    + "docker-container driver.",
+)
 @pass_cli_config
-def build(cli_config, pull, cache):
-    """Build application and service images."""
+def build(cli_config, pull, cache, layer_cache_dir):
+    """Build application and service images.
+
+    The images whose build context and configuration did not change since
+    they were built are not built again, unless --no-cache is given.
+    """
     commands = ContainersCommands(cli_config)
     click.secho(
         f"Building images... Pull newer versions {pull}, use cache {cache}", fg="green"
     )
-    steps = commands.build(pull, cache)
+    steps = commands.build(pull, cache, layer_cache_dir)
     on_fail = "Failed to build images."
     on_success = "Images built successfully."
 
@@ -72,19 +92,28 @@ def build(cli_config, pull, cache):
     is_flag=True,
     help="Enable/disable dockerized services (default: enabled).",
 )
+@click.option(
+    "--dry-run",
+    default=False,
+    is_flag=True,
+    help="Print the steps of the setup without running them.",
+)
 @pass_cli_config
-def setup(cli_config, force, no_demo_data, stop_services, services):
+def setup(cli_config, force, no_demo_data, stop_services, services, dry_run):
     """Setup containerized services."""
     # no_demo_data = False (default) means "YES to demo_data"
     demo_data = not no_demo_data
     commands = ContainersCommands(cli_config)
+    steps = commands.setup(force, demo_data, stop_services, services)
+    if dry_run:
+        print_steps(steps)
+        return
+
     click.secho(
         f"Setting up services with force {force}, demo data {demo_data} "
         + f"and stop after setup {stop_services}...",
         fg="green",
     )
-
-    steps = commands.setup(force, demo_data, stop_services, services)
     on_fail = "Failed to setup services."
     on_success = "Services setup successfully."
 
@@ -176,3 +205,45 @@ def destroy(cli_config):
     on_success = "Instance' containers destroyed."
 
     run_steps(steps, on_fail, on_success)
+
+
+@containers.group("image-cache")
+def image_cache():
+    """Images of the project saved as compressed archives, e.g. for CI.
+
+    The images are saved with "docker save" compressed by zstd, in
+    .invenio.cache/images by default. Only the images whose id changed are
+    saved or loaded again.
+    """
+
+
+_image_cache_options = combine_decorators(
+    click.option(
+        "--directory",
+        "-d",
+        type=click.Path(file_okay=False),
+        default=None,
+        help="The cache directory (default: .invenio.cache/images).",
+    ),
+    pass_cli_config,
+)
+
+
+@image_cache.command("save")
+@_image_cache_options
+def image_cache_save(cli_config, directory):
+    """Save the built and pulled images of the project."""
+    try:
+        steps = ContainersCommands(cli_config).image_cache("save", directory)
+    except RuntimeError as e:
+        handle_process_response(ProcessResponse(error=str(e), status_code=1))
+        return
+    run_steps(steps, "Failed to save the images.", "Images saved.")
+
+
+@image_cache.command("load")
+@_image_cache_options
+def image_cache_load(cli_config, directory):
+    """Load the saved images of the project."""
+    steps = ContainersCommands(cli_config).image_cache("load", directory)
+    run_steps(steps, "Failed to load the images.", "Images loaded.")
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio module to ease the creation and management of applications."""
+
+import click
+
+from ..commands import DaemonCommands
+from .utils import handle_process_response, pass_cli_config
+
+
+@click.group()
+def daemon():
+    """Commands to run the invenio commands in a warm application.
+
+    The daemon creates the application once and runs the invenio commands
+    of the other invenio-cli commands in forks of it, e.g. the fixtures
+    and index commands of 'services setup'. It reloads when invenio.cfg,
+    .env, the virtualenv's packages or the Python modules of the editable
+    packages change; run 'daemon restart' after other changes. 'invenio
+    run' and 'invenio celery' always run in their own process.
+    """
+
+
+@daemon.command()
+@click.option(
+    "--timeout",
+    default=300,
+    show_default=True,
+    help="Seconds to wait for the application to be created.",
+)
+@pass_cli_config
+def start(cli_config, timeout):
+    """Start the daemon in the background."""
+    click.secho("Starting the daemon...", fg="green")
+    response = DaemonCommands(cli_config).start(timeout=timeout)
+    handle_process_response(response)
+    click.secho(response.output, fg="green")
+
+
+@daemon.command()
+@pass_cli_config
+def stop(cli_config):
+    """Stop the daemon."""
+    response = DaemonCommands(cli_config).stop()
+    handle_process_response(response)
+    click.secho(response.output, fg="green")
+
+
+@daemon.command()
+@click.option(
+    "--timeout",
+    default=300,
+    show_default=True,
+    help="Seconds to wait for the application to be created.",
+)
+@pass_cli_config
+def restart(cli_config, timeout):
+    """Restart the daemon, creating the application again."""
+    click.secho("Restarting the daemon...", fg="green")
+    response = DaemonCommands(cli_config).restart(timeout=timeout)
+    handle_process_response(response)
+    click.secho(response.output, fg="green")
+
+
+@daemon.command()
+@pass_cli_config
+def status(cli_config):
+    """Show whether the daemon is running."""
+    response = DaemonCommands(cli_config).status()
+    handle_process_response(response)
+    click.secho(response.output, fg="green")
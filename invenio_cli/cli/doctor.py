@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio module to ease the creation and management of applications."""
+
+import json
+
+import click
+
+from ..commands import DoctorCommands
+from ..helpers.doctor import OK, WARNING
+from .utils import pass_cli_config
+
+STATUS_COLORS = {OK: "green", WARNING: "yellow"}
+
+
+@click.group()
+def doctor():
+    """Commands to diagnose the host."""
+
+
+@doctor.command()
+@click.option(
+    "--json",
+    "as_json",
+    default=False,
+    is_flag=True,
+    help="Print the results as JSON, e.g. for CI.",
+)
+@pass_cli_config
+def perf(cli_config, as_json):
+    """Check the host resources the performance depends on.
+
+    It measures vm.max_map_count, the memory and CPUs of Docker, the free
+    space and write throughput of the disks of the instance and of Docker,
+    and the CPUs available to celery. Exits with 1 if a check warns.
+    """
+    if not as_json:
+        click.secho("Measuring the host resources...", fg="green", err=True)
+    checks = DoctorCommands(cli_config).perf()
+    warnings = [check for check in checks if check.status == WARNING]
+
+    if as_json:
+        click.echo(
+            json.dumps(
+                {
+                    "ok": not warnings,
+                    "checks": [check._asdict() for check in checks],
+                },
+                indent=2,
+            )
+        )
+    else:
+        for check in checks:
+            click.secho(
+                f"[{check.status}] {check.name}: {check.message}",
+                fg=STATUS_COLORS.get(check.status),
+            )
+            if check.recommendation:
+                click.echo(f"    -> {check.recommendation}")
+        if warnings:
+            click.secho(f"{len(warnings)} check(s) with warnings.", fg="yellow")
+        else:
+            click.secho("No performance issue found.", fg="green")
+
+    if warnings:
+        exit(1)
@@ -8,10 +8,22 @@
 """Invenio module to ease the creation and management of applications."""
 
 
+import json
+import shlex
+
 import click
 
-from ..commands import ServicesCommands
-from .utils import pass_cli_config, run_steps
+from ..commands import PoolCommands, ServicesCommands
+from ..helpers.compose import PROFILES
+from ..helpers.process import ProcessResponse
+from ..helpers.search import SearchError
+from .utils import (
+    combine_decorators,
+    handle_process_response,
+    pass_cli_config,
+    print_steps,
+    run_steps,
+)
 
 
 @click.group()
@@ -19,13 +31,24 @@ def services():
     """Commands for services management."""
 
 
+_profile_option = click.option(
+    "--profile",
+    type=click.Choice(PROFILES),
+    default=None,
+    help="fast: no fsync, in-memory database, no cache persistence, search "
+    + "heap sized from the host memory (for throwaway dev/CI services); "
+    + "durable: the compose files as is. Kept for the next runs.",
+)
+
+
 @services.command()
+@_profile_option
 @pass_cli_config
-def start(cli_config):
+def start(cli_config, profile):
     """Start local services."""
     click.secho("Starting containers...", fg="green")
     commands = ServicesCommands(cli_config)
-    steps = commands.start()
+    steps = commands.start(profile)
     on_fail = "Failed to start services."
     on_success = "Services started successfully."
 
@@ -57,19 +80,60 @@ def start(cli_config):
     is_flag=True,
     help="Enable/disable dockerized services (default: enabled).",
 )
+@click.option(
+    "--dry-run",
+    default=False,
+    is_flag=True,
+    help="Print the steps of the setup without running them.",
+)
+@_profile_option
 @pass_cli_config
-def setup(cli_config, force, no_demo_data, stop_services, services):
+def setup(cli_config, force, no_demo_data, stop_services, services, dry_run, profile):
     """Setup local services."""
     # no_demo_data = False (default) means "YES to demo_data"
     demo_data = not no_demo_data
     commands = ServicesCommands(cli_config)
-    steps = commands.setup(force, demo_data, stop_services, services)
+    steps = commands.setup(force, demo_data, stop_services, services, profile)
+    if dry_run:
+        print_steps(steps)
+        return
+
     on_fail = "Failed to setup services."
     on_success = "Successfully setup all services."
 
     run_steps(steps, on_fail, on_success)
 
 
+@services.command()
+@click.option(
+    "--services/--no-services",
+    "-s/-n",
+    default=True,
+    is_flag=True,
+    help="Enable/disable dockerized services (default: enabled).",
+)
+@click.option(
+    "--dry-run",
+    default=False,
+    is_flag=True,
+    help="Print the steps of the reset without running them.",
+)
+@pass_cli_config
+def reset(cli_config, services, dry_run):
+    """Reset local services to their state right after the setup.
+
+    The database is restored from the template database kept by the setup
+    (PostgreSQL only), which is much faster than a forced setup.
+    """
+    commands = ServicesCommands(cli_config)
+    steps = commands.reset(services)
+    if dry_run:
+        print_steps(steps)
+        return
+
+    run_steps(steps, "Failed to reset services.", "Services reset successfully.")
+
+
 @services.command()
 @click.option(
     "-v",
@@ -128,3 +192,162 @@ def destroy(cli_config):
     on_success = "Services' containers destroyed."
 
     run_steps(steps, on_fail, on_success)
+
+
+@services.group("search-snapshot")
+def search_snapshot():
+    """Snapshots of the search indices, for fast restores.
+
+    The snapshots are stored in .invenio.cache/search-snapshots, mounted in
+    the search container as a "fs" snapshot repository.
+    """
+
+
+_snapshot_options = combine_decorators(
+    click.argument("name", default="default"),
+    click.option(
+        "--services/--no-services",
+        "-s/-n",
+        default=True,
+        is_flag=True,
+        help="Enable/disable dockerized services (default: enabled).",
+    ),
+    click.option(
+        "--recreate-search",
+        default=False,
+        is_flag=True,
+        help="Recreate the search container to mount the snapshot repository, "
+        + "losing the data it does not keep in a volume.",
+    ),
+    pass_cli_config,
+)
+
+
+@search_snapshot.command("create")
+@_snapshot_options
+def search_snapshot_create(cli_config, name, services, recreate_search):
+    """Snapshot the search indices as NAME (default: "default")."""
+    steps = ServicesCommands(cli_config).search_snapshot(
+        "create", name, services, recreate=recreate_search
+    )
+    run_steps(steps, "Failed to create the snapshot.", "Snapshot created.")
+
+
+@search_snapshot.command("restore")
+@_snapshot_options
+def search_snapshot_restore(cli_config, name, services, recreate_search):
+    """Restore the search indices from the snapshot NAME."""
+    steps = ServicesCommands(cli_config).search_snapshot(
+        "restore", name, services, recreate=recreate_search
+    )
+    run_steps(steps, "Failed to restore the snapshot.", "Snapshot restored.")
+
+
+@search_snapshot.command("list")
+@pass_cli_config
+def search_snapshot_list(cli_config):
+    """List the snapshots of the search indices."""
+    try:
+        snapshots = ServicesCommands(cli_config).search_snapshots()
+    except SearchError as e:
+        handle_process_response(ProcessResponse(error=str(e), status_code=1))
+        return
+
+    for snapshot in snapshots:
+        click.secho(
+            f"{snapshot['snapshot']}: {len(snapshot['indices'])} indices, "
+            + f"{snapshot.get('start_time', '')} ({snapshot['state']})",
+            fg="green" if snapshot["state"] == "SUCCESS" else "yellow",
+        )
+
+
+@services.group()
+def pool():
+    """Pool of pre-seeded services stacks, for test runs.
+
+    Each stack is a compose project of its own, with its own ports. A stack
+    is leased with "services lease", and reset in the background once
+    released with "services release".
+    """
+
+
+@pool.command("init")
+@click.argument("size", type=click.IntRange(min=1))
+@pass_cli_config
+def pool_init(cli_config, size):
+    """Create stacks until the pool has SIZE of them."""
+    response = PoolCommands(cli_config).init(size)
+    handle_process_response(response, fail_message="Failed to create the pool.")
+
+
+@pool.command("status")
+@pass_cli_config
+def pool_status(cli_config):
+    """Show the stacks of the pool."""
+    colors = {"ready": "green", "leased": "yellow", "failed": "red"}
+    for name, status, ports in PoolCommands(cli_config).status():
+        published = ", ".join(
+            f"{service} {host_port}"
+            for service, mapping in sorted(ports.items())
+            for host_port in mapping.values()
+        )
+        click.secho(f"{name}: {status} ({published})", fg=colors.get(status))
+
+
+@pool.command("reset", hidden=True)
+@click.argument("name")
+@pass_cli_config
+def pool_reset(cli_config, name):
+    """Reset a stack of the pool (run in background on release)."""
+    steps = PoolCommands(cli_config).reset(name)
+    run_steps(steps, f"Failed to reset {name}.", f"Stack {name} reset.")
+
+
+@pool.command("destroy")
+@pass_cli_config
+def pool_destroy(cli_config):
+    """Destroy all the stacks of the pool."""
+    steps = PoolCommands(cli_config).destroy()
+    run_steps(steps, "Failed to destroy the pool.", "Pool destroyed.")
+
+
+@services.command()
+@click.option(
+    "--wait",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Seconds to wait for a stack to be ready (default: 0).",
+)
+@click.option("--json", "as_json", default=False, is_flag=True, help="Output as JSON.")
+@pass_cli_config
+def lease(cli_config, wait, as_json):
+    """Lease a ready stack of the services pool.
+
+    Prints the environment variables pointing the instance to the stack,
+    e.g. eval "$(invenio-cli services lease)".
+    """
+    commands = PoolCommands(cli_config)
+    response = commands.lease(wait=wait)
+    if response.status_code > 0:
+        handle_process_response(response, fail_message="Failed to lease a stack.")
+
+    name = response.output
+    env = commands.member(name).env()
+    if as_json:
+        click.echo(json.dumps({"name": name, "env": env}, indent=2))
+    else:
+        for variable, value in env.items():
+            click.echo(f"export {variable}={shlex.quote(value)}")
+    click.secho(f"Leased {name}.", fg="green", err=True)
+
+
+@services.command()
+@click.argument("name", envvar="INVENIO_CLI_POOL_MEMBER")
+@pass_cli_config
+def release(cli_config, name):
+    """Release a leased stack, which is reset in the background.
+
+    NAME defaults to the INVENIO_CLI_POOL_MEMBER environment variable.
+    """
+    response = PoolCommands(cli_config).release(name)
+    handle_process_response(response, fail_message="Failed to release the stack.")
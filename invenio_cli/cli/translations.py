@@ -27,8 +27,14 @@ def translations():
     default="translations/babel.ini",
     help="Relative path to babel.ini (including filename).",
 )
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    is_flag=True,
+    help="Only parse files changed since the last extraction (default: enabled).",
+)
 @pass_cli_config
-def extract(cli_config, babel_ini):
+def extract(cli_config, babel_ini, cache):
     """Extract messages for i18n support (translations)."""
     click.secho("Extracting messages...", fg="green")
     steps = TranslationsCommands(cli_config).extract(
@@ -37,6 +43,7 @@ def extract(cli_config, babel_ini):
         babel_file=cli_config.get_project_dir() / Path("translations/babel.ini"),
         output_file=cli_config.get_project_dir() / Path("translations/messages.pot"),
         input_dirs=cli_config.get_project_dir(),
+        cache=cache,
     )
     on_fail = "Failed to extract messages."
     on_success = "Messages extracted successfully."
@@ -9,6 +9,7 @@
 
 import click
 
+from ..commands.steps import execute_step
 from ..helpers.cli_config import CLIConfig
 
 pass_cli_config = click.make_pass_decorator(CLIConfig, ensure=True)
@@ -17,13 +18,28 @@ pass_cli_config = click.make_pass_decorator(CLIConfig, ensure=True)
 def run_steps(steps, fail_message, success_message):
     """Run a series of steps."""
     for step in steps:
+        if step.is_up_to_date():
+            click.secho(message=f"{step.message} (up to date)", fg="green")
+            continue
         click.secho(message=step.message, fg="green")
-        response = step.execute()
+        response = execute_step(step)
         handle_process_response(response, fail_message=fail_message)
+        if not response.warning:
+            step.record()
     else:
         click.secho(message=success_message, fg="green")
 
 
+def print_steps(steps):
+    """Print a series of steps without running them."""
+    for index, step in enumerate(steps, start=1):
+        up_to_date = " (up to date)" if step.is_up_to_date() else ""
+        click.secho(f"{index:>3}. {step.message}{up_to_date}", fg="green")
+        description = step.describe()
+        for line in description.splitlines():
+            click.echo(f"     {line}")
+
+
 def handle_process_response(response, fail_message=None):
     """Handle the `ProcessResponse` obj after cmd execution."""
     msg = ""
@@ -8,11 +8,15 @@
 """Invenio module to ease the creation and management of applications."""
 
 from .assets import AssetsCommands
+from .bench import BenchCommands
 from .commands import Commands
 from .containers import ContainersCommands
+from .daemon import DaemonCommands
+from .doctor import DoctorCommands
 from .install import InstallCommands
 from .local import LocalCommands
 from .packages import PackagesCommands
+from .pool import PoolCommands
 from .requirements import RequirementsCommands
 from .services import ServicesCommands
 from .translations import TranslationsCommands
@@ -20,11 +24,15 @@ from .upgrade import UpgradeCommands
 
 __all__ = (
     "AssetsCommands",
+    "BenchCommands",
     "Commands",
     "ContainersCommands",
+    "DaemonCommands",
+    "DoctorCommands",
     "InstallCommands",
     "LocalCommands",
     "PackagesCommands",
+    "PoolCommands",
     "RequirementsCommands",
     "ServicesCommands",
     "TranslationsCommands",
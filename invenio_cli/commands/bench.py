@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio module to ease the creation and management of applications."""
+
+import json
+from datetime import datetime, timezone
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+import click
+
+from ..helpers.bench import run_benchmark, unverified_ssl_context
+from ..helpers.process import ProcessResponse, run_cmd
+
+DEFAULT_ENDPOINTS = {
+    "records-search": ("/api/records?q=&size=10", "application/json"),
+    "record-landing-page": ("/records/{record_id}", "text/html"),
+    "communities-list": ("/api/communities?q=&size=10", "application/json"),
+}
+"""Benchmarked endpoints, as name to ``(path, accept mimetype)``."""
+
+
+class BenchCommands(object):
+    """Benchmark CLI commands."""
+
+    def __init__(self, cli_config):
+        """Constructor."""
+        self.cli_config = cli_config
+
+    def _record_id(self, host, port):
+        """Return the id of a published record, ``None`` if there is none."""
+        request = Request(
+            f"https://{host}:{port}/api/records?size=1",
+            headers={"Accept": "application/json"},
+        )
+        try:
+            with urlopen(request, context=unverified_ssl_context(), timeout=30) as r:
+                hits = json.load(r)["hits"]["hits"]
+        except (URLError, OSError, ValueError, KeyError):
+            return None
+        return hits[0]["id"] if hits else None
+
+    def _commit(self):
+        """Return the current git commit of the project, if any."""
+        project_dir = self.cli_config.get_project_dir()
+        try:
+            result = run_cmd(["git", "-C", str(project_dir), "rev-parse", "HEAD"])
+        except OSError:
+            return None
+        return result.output.strip() if result.status_code == 0 else None
+
+    def _endpoints(self, host, port, endpoints):
+        """Resolve the placeholders of the endpoints' paths."""
+        if not any("{record_id}" in path for path, _ in endpoints.values()):
+            return endpoints
+
+        record_id = self._record_id(host, port)
+        resolved = {}
+        for name, (path, accept) in endpoints.items():
+            if "{record_id}" in path:
+                if record_id is None:
+                    click.secho(
+                        f"No record found, skipping the '{name}' endpoint.",
+                        fg="yellow",
+                        err=True,
+                    )
+                    continue
+                path = path.format(record_id=record_id)
+            resolved[name] = (path, accept)
+        return resolved
+
+    def http(
+        self,
+        host,
+        port,
+        endpoints=None,
+        concurrency=10,
+        duration=None,
+        requests=None,
+        timeout=30,
+    ):
+        """Benchmark the HTTP endpoints of the running instance.
+
+        :param endpoints: Dict of name to ``(path, accept mimetype)``, the
+                          ``{record_id}`` placeholder is replaced by the id
+                          of a published record. Defaults to
+                          ``DEFAULT_ENDPOINTS``.
+        :returns: A ProcessResponse whose output is the JSON report.
+        """
+        endpoints = self._endpoints(host, port, endpoints or DEFAULT_ENDPOINTS)
+        if not endpoints:
+            return ProcessResponse(error="No endpoint to benchmark.", status_code=1)
+
+        started_at = datetime.now(timezone.utc).isoformat()
+        results = run_benchmark(
+            host,
+            port,
+            endpoints,
+            concurrency=concurrency,
+            duration=duration,
+            requests=requests,
+            timeout=timeout,
+        )
+        report = {
+            "commit": self._commit(),
+            "started_at": started_at,
+            "url": f"https://{host}:{port}",
+            **results,
+        }
+        if results["total"]["requests"] == results["total"]["errors"]:
+            return ProcessResponse(
+                error="All requests failed, is the instance running?",
+                status_code=1,
+            )
+        return ProcessResponse(output=json.dumps(report, indent=2), status_code=0)
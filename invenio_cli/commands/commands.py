@@ -8,9 +8,10 @@
 """Invenio module to ease the creation and management of applications."""
 
 
+from ..helpers import daemon
 from ..helpers.cli_config import CLIConfig
 from ..helpers.env import env
-from ..helpers.process import run_interactive
+from ..helpers.process import ProcessResponse, run_interactive
 from .steps import CommandStep
 
 
@@ -29,11 +30,26 @@ class Commands(object):
         command = self.cli_config.python_package_manager.start_activated_subshell()
         return run_interactive(command, env={"PIPENV_VERBOSITY": "-1"})
 
-    def pyshell(self, debug=False):
-        """Start a Python shell."""
+    def pyshell(self, debug=False, attach=False):
+        """Start a Python shell.
+
+        :param attach: Start it in the warm application of the daemon.
+        """
+        if attach:
+            cache_dir = self.cli_config.get_cache_dir()
+            if not daemon.is_running(cache_dir):
+                return ProcessResponse(
+                    error="The daemon is not running, start it with "
+                    + "'invenio-cli daemon start'.",
+                    status_code=1,
+                )
+            command = daemon.attach_command(cache_dir, ["invenio", "shell"])
+            # the warm application is only reused with the same environment
+            return run_interactive(command, env={"FLASK_DEBUG": "1"} if debug else None)
+
         pkg_man = self.cli_config.python_package_manager
         with env(FLASK_DEBUG="1" if debug else "0"):
-            command = pkg_man.run_command("invenio", "shell")
+            command = pkg_man.run_command("invenio", "shell", warm=False)
             return run_interactive(command, env={"PIPENV_VERBOSITY": "-1"})
 
     def destroy(self):
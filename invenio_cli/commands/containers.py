@@ -8,12 +8,15 @@
 
 """Invenio module to ease the creation and management of applications."""
 
+import os
+
+from ..helpers.compose import built_services, write_build_override
 from ..helpers.docker_helper import DockerHelper
-from ..helpers.versions import rdm_version
+from ..helpers.images import FINGERPRINT_LABEL, ImageCache, build_fingerprint
+from ..helpers.process import ProcessResponse
 from .packages import PackagesCommands
 from .services import ServicesCommands
 from .steps import FunctionStep
-from .translations import TranslationsCommands
 
 
 class ContainersCommands(ServicesCommands):
@@ -22,16 +25,61 @@ class ContainersCommands(ServicesCommands):
     def __init__(self, cli_config, docker_helper=None):
         """Constructor."""
         docker_helper = docker_helper or DockerHelper(
-            cli_config.get_project_shortname(), local=False
+            cli_config.get_project_shortname(),
+            local=False,
+            override_files=cli_config.get_compose_override_files(),
         )
 
         super().__init__(cli_config, docker_helper)
 
-    def build(self, pull=True, cache=True):
+    def build_images(self, pull=True, cache=True, layer_cache_dir=None):
+        """Build the images whose build context or configuration changed.
+
+        The images are labelled with the fingerprint of what they are built
+        from, the ones with the current fingerprint are not built again.
+
+        :param layer_cache_dir: Directory of the BuildKit layer cache, used
+                                and updated by the build.
+        """
+        compose_files = self.docker_helper.compose_files("docker-compose.full.yml")
+        try:
+            services = built_services(compose_files)
+        except RuntimeError as e:
+            return ProcessResponse(error=str(e), status_code=1)
+
+        fingerprints = {
+            name: build_fingerprint(service["build"])
+            for name, service in services.items()
+        }
+        outdated = [
+            name
+            for name, service in services.items()
+            if not cache
+            or self.docker_helper.image_labels(service["image"]).get(FINGERPRINT_LABEL)
+            != fingerprints[name]
+        ]
+        if not outdated:
+            return ProcessResponse(
+                output="The images are up to date, nothing to build.", status_code=0
+            )
+
+        # not among the compose override files, only used by the build
+        build_file = self.cli_config.get_cache_dir() / "build.yml"
+        write_build_override(
+            build_file,
+            {name: {FINGERPRINT_LABEL: fingerprints[name]} for name in outdated},
+            layer_cache_dir=layer_cache_dir and os.path.abspath(layer_cache_dir),
+        )
+        return self.docker_helper.build_images(
+            pull=pull, cache=cache, services=outdated, build_files=[build_file]
+        )
+
+    def build(self, pull=True, cache=True, layer_cache_dir=None):
         """Return the steps to build images.
 
         :param pull: Attempt to pull newer versions of the images.
         :param cache: Use cached images and layers.
+        :param layer_cache_dir: Directory of the BuildKit layer cache.
         """
         steps = [
             FunctionStep(
@@ -39,220 +87,128 @@ class ContainersCommands(ServicesCommands):
                 message="Checking if dependencies are locked.",
             ),
             FunctionStep(
-                func=self.docker_helper.build_images,
-                args={"pull": pull, "cache": cache},
+                func=self.build_images,
+                args={"pull": pull, "cache": cache, "layer_cache_dir": layer_cache_dir},
                 message="Building images...",
             ),
         ]
 
         return steps
 
-    def _cleanup(self, project_shortname="/opt/var/instance/"):
-        """Steps to cleanup commands."""
-        steps = [
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio shell --no-term-title -c \"import redis; redis.StrictRedis.from_url(app.config['CACHE_REDIS_URL']).flushall(); print('Cache cleared')\"",  # noqa
-                },
-                message="Flushing redis cache...",
-            ),
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio db destroy --yes-i-know",
-                },
-                message="Deleting database...",
-            ),
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio index destroy --force --yes-i-know",
-                },
-                message="Deleting indices...",
-            ),
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio index queue init purge",
-                },
-                message="Purging queues...",
-            ),
-            FunctionStep(
-                func=self.cli_config.update_services_setup,
-                args={"is_setup": False},
-                message="Updating service setup status (False)...",
-            ),
-        ]
-
-        return steps
+    def _save_image(self, image_cache, image):
+        """Save an image to the cache, unless it is saved with the same id."""
+        image_id = self.docker_helper.image_id(image)
+        if image_id is None:
+            return ProcessResponse(
+                output=f"{image} is not present, build or pull it first.",
+                status_code=0,
+                warning=True,
+            )
+        if image_cache.is_saved(image, image_id):
+            return ProcessResponse(output=f"{image} is up to date.", status_code=0)
+        return image_cache.save(image, image_id)
+
+    def _load_image(self, image_cache, image):
+        """Load an image from the cache, unless it is present with the same id."""
+        if self.docker_helper.image_id(image) == image_cache.manifest()[image]["id"]:
+            return ProcessResponse(output=f"{image} is up to date.", status_code=0)
+        return image_cache.load(image)
+
+    def image_cache(self, action, directory=None):
+        """Return the steps to save or load the images of the project.
+
+        :param action: ``save`` the images to the cache, or ``load`` them.
+        :param directory: The cache directory, ``.invenio.cache/images`` by
+                          default.
+        """
+        image_cache = ImageCache(
+            directory or self.cli_config.get_cache_dir() / "images"
+        )
+        if action == "save":
+            images, func = self.docker_helper.project_images(), self._save_image
+            verb = "Saving"
+        else:
+            images, func = sorted(image_cache.manifest()), self._load_image
+            verb = "Loading"
 
-    def _setup(self, project_shortname="/opt/var/instance/"):
-        """Steps to initialize services."""
         steps = [
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio db init create",
-                },
-                message="Creating database...",
-            ),
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio files location create --default default-location ${INVENIO_INSTANCE_PATH}/data",  # noqa
-                },
-                message="Creating files location...",
-            ),
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio roles create admin",
-                },
-                message="Creating admin role...",
-            ),
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio access allow superuser-access role admin",
-                },
-                message="Assigning superuser access to admin role...",
-            ),
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio index init",
-                },
-                message="Creating indices...",
-            ),
-            FunctionStep(
-                func=self.cli_config.update_services_setup,
-                args={"is_setup": True},
-                message="Updating service setup status (True)...",
-            ),
+            FunctionStep(func=image_cache.check_zstd, message="Checking for zstd...")
         ]
-
-        if rdm_version()[0] >= 10:
-            steps.extend(
-                [
-                    FunctionStep(
-                        func=self.docker_helper.execute_cli_command,
-                        args={
-                            "project_shortname": project_shortname,
-                            "command": "invenio rdm-records custom-fields init",
-                        },
-                        message="Creating custom fields for records...",
-                    ),
-                    FunctionStep(
-                        func=self.docker_helper.execute_cli_command,
-                        args={
-                            "project_shortname": project_shortname,
-                            "command": "invenio communities custom-fields init",
-                        },
-                        message="Creating custom fields for communities...",
-                    ),
-                ]
+        steps.extend(
+            FunctionStep(
+                func=func,
+                args={"image_cache": image_cache, "image": image},
+                message=f"{verb} {image}...",
             )
-
-        if rdm_version()[0] >= 11:
-            steps.extend(self.rdm_fixtures(project_shortname))
-            steps.extend(self.translations(project_shortname))
-
-        if rdm_version()[0] >= 12:
-            steps.extend(self.declare_queues(project_shortname))
-
+            for image in images
+        )
         return steps
 
-    def demo(self, project_shortname):
-        """Steps to demo records into the instance."""
-        steps = [
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio rdm-records demo",
-                },
-                message="Creating demo records...",
-            )
-        ]
+    def _plan_params(self):
+        """Values of the placeholders of the plans' commands."""
+        # INVENIO_INSTANCE_PATH is set in the Dockerfile
+        return {"default_location": "${INVENIO_INSTANCE_PATH}/data"}
+
+    def _command_step(self, plan_step, params, project_shortname=None):
+        """Step running the command of a plan step in the web-ui container."""
+        return FunctionStep(
+            func=self.docker_helper.execute_cli_command,
+            args={
+                "project_shortname": project_shortname
+                or self.cli_config.get_project_shortname(),
+                "command": plan_step.command_line(params),
+            },
+            message=plan_step.message,
+            skippable=plan_step.skippable,
+        )
 
-        return steps
+    def _builtin_expect_not_setup(self, plan_step):
+        """Steps checking the setup status, not done for the containers.
+
+        The status is shared with the local services, which may be set up.
+        """
+        return []
 
-    def declare_queues(self, project_shortname):
+    def declare_queues(self, project_shortname=None):
         """Steps to declare the MQ queues required for statistics, etc."""
-        steps = [
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio queues declare",
-                },
-                message="Declaring queues...",
-            )
-        ]
-        return steps
+        return self._single_command(
+            "invenio queues declare",
+            "Declaring queues...",
+            project_shortname=project_shortname,
+        )
 
-    def fixtures(self, project_shortname):
+    def fixtures(self, project_shortname=None):
         """Steps to set up the required fixtures for the instance."""
-        steps = [
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio rdm-records fixtures",
-                },
-                message="Creating records fixtures...",
-            )
-        ]
-
-        return steps
+        return self._single_command(
+            "invenio rdm-records fixtures",
+            "Creating records fixtures...",
+            project_shortname=project_shortname,
+        )
 
-    def rdm_fixtures(self, project_shortname):
+    def rdm_fixtures(self, project_shortname=None):
         """Steps to set up the rdm fixtures for the instance."""
-        steps = [
-            FunctionStep(
-                func=self.docker_helper.execute_cli_command,
-                args={
-                    "project_shortname": project_shortname,
-                    "command": "invenio rdm fixtures",
-                },
-                message="Creating rdm fixtures...",
-            )
-        ]
+        return self._single_command(
+            "invenio rdm fixtures",
+            "Creating rdm fixtures...",
+            project_shortname=project_shortname,
+        )
 
-        return steps
+    def translations(self, fuzzy=False):
+        """Steps to compile translations for the instance.
 
-    def translations(self, project_shortname):
-        """Steps to compile translations for the instance."""
-        commands = TranslationsCommands(
-            self.cli_config,
-            project_path=self.cli_config.get_project_dir(),
-            # we use INVENIO_INSTANCE_PATH that is set in the Dockerfile as
-            # config.instance_path is set only in development `install` command
-            instance_path="${INVENIO_INSTANCE_PATH}",
-        )
-        cmd = commands.compile(
-            # instance path inside the container
-            directory="${INVENIO_INSTANCE_PATH}/translations",
-            symlink=False,
-        )
-        cmd = cmd[0].cmd  # extract compilation command
-        cmd = " ".join(cmd)  # convert to string
+        The command runs in the container, not through the package manager
+        of the host, with the INVENIO_INSTANCE_PATH set in the Dockerfile
+        (config.instance_path is only set by the development install).
+        """
+        cmd = "pybabel compile --directory=${INVENIO_INSTANCE_PATH}/translations"
+        if fuzzy:
+            cmd += " --use-fuzzy"
 
         return [
             FunctionStep(
                 func=self.docker_helper.execute_cli_command,
                 args={
-                    "project_shortname": project_shortname,
+                    "project_shortname": self.cli_config.get_project_shortname(),
                     "command": cmd,
                 },
                 message="Compiling message catalog...",
@@ -260,44 +216,6 @@ class ContainersCommands(ServicesCommands):
             ),
         ]
 
-    def setup(self, force, demo_data=True, stop=False, services=True):
-        """Return the steps to setup containerize services.
-
-        :param force: Remove existing content (db, indices, etc.).
-        :param demo_data: Include demo records.
-        :param stop: Stop services after setup.
-        """
-        steps = []
-
-        if services:
-            steps.append(
-                FunctionStep(
-                    func=self.ensure_containers_running,
-                    message="Making sure containers are up...",
-                )
-            )
-
-        project_shortname = self.cli_config.get_project_shortname()
-
-        if force:
-            steps.extend(self._cleanup(project_shortname))
-
-        steps.extend(self._setup(project_shortname))
-        steps.extend(self.fixtures(project_shortname))
-
-        if demo_data:
-            steps.extend(self.demo(project_shortname))
-
-        if stop:
-            steps.append(
-                FunctionStep(
-                    func=self.docker_helper.stop_containers,
-                    message="Stopping containers....",
-                )
-            )
-
-        return steps
-
     def start(
         self, lock=False, build=False, setup=False, demo_data=True, services=True
     ):
@@ -325,6 +243,8 @@ class ContainersCommands(ServicesCommands):
             return steps
 
         # NOTE: Needed in case there is no setup
+        if services:
+            steps.append(self._pull_step())
         steps.append(
             FunctionStep(
                 func=self.docker_helper.start_containers,
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio module to ease the creation and management of applications."""
+
+import os
+import signal
+import time
+from subprocess import DEVNULL, STDOUT
+from subprocess import Popen as popen
+
+from ..helpers import daemon
+from ..helpers.process import ProcessResponse
+
+
+class DaemonCommands(object):
+    """Warm application daemon CLI commands."""
+
+    def __init__(self, cli_config):
+        """Constructor."""
+        self.cli_config = cli_config
+        self.cache_dir = cli_config.get_cache_dir()
+
+    def _watched_files(self):
+        """Files whose changes make the daemon reload the application."""
+        project_dir = self.cli_config.get_project_dir()
+        return [
+            project_dir / filename
+            for filename in ("invenio.cfg", ".env")
+            if (project_dir / filename).exists()
+        ]
+
+    def start(self, timeout=300):
+        """Start the daemon and wait for the application to be created."""
+        pid = daemon.read_pid(self.cache_dir)
+        if pid and daemon.is_running(self.cache_dir):
+            return ProcessResponse(
+                output=f"The daemon is already running (pid {pid}).", status_code=0
+            )
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        log_path = self.cache_dir / daemon.LOG_FILENAME
+        command = self.cli_config.python_package_manager.run_command(
+            "python", *daemon.serve_command(self.cache_dir, self._watched_files())
+        )
+        with open(log_path, "w") as log_file:
+            process = popen(
+                command,
+                cwd=self.cli_config.get_project_dir(),
+                env={**os.environ, "PIPENV_VERBOSITY": "-1"},
+                stdin=DEVNULL,
+                stdout=log_file,
+                stderr=STDOUT,
+                start_new_session=True,
+            )
+
+        deadline = time.monotonic() + timeout
+        while not daemon.is_running(self.cache_dir):
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                return ProcessResponse(
+                    error=f"The daemon did not start, see {log_path}.", status_code=1
+                )
+            time.sleep(0.2)
+
+        return ProcessResponse(
+            output=f"Daemon started (pid {daemon.read_pid(self.cache_dir)}), "
+            + "the invenio commands now run in the warm application.",
+            status_code=0,
+        )
+
+    def stop(self, timeout=10):
+        """Stop the daemon, the running commands being left to finish."""
+        pid = daemon.read_pid(self.cache_dir)
+        if pid:
+            os.kill(pid, signal.SIGTERM)
+            deadline = time.monotonic() + timeout
+            while daemon.read_pid(self.cache_dir) and time.monotonic() < deadline:
+                time.sleep(0.1)
+
+        # left behind by a daemon which did not stop cleanly
+        for filename in (daemon.SOCKET_FILENAME, daemon.PID_FILENAME):
+            (self.cache_dir / filename).unlink(missing_ok=True)
+
+        if not pid:
+            return ProcessResponse(output="The daemon is not running.", status_code=0)
+        return ProcessResponse(output="Daemon stopped.", status_code=0)
+
+    def restart(self, timeout=300):
+        """Stop the daemon if it is running, then start it again."""
+        self.stop()
+        return self.start(timeout=timeout)
+
+    def status(self):
+        """Return whether the daemon is running."""
+        pid = daemon.read_pid(self.cache_dir)
+        if pid and daemon.is_running(self.cache_dir):
+            return ProcessResponse(
+                output=f"The daemon is running (pid {pid}), "
+                + f"see {self.cache_dir / daemon.LOG_FILENAME}.",
+                status_code=0,
+            )
+        return ProcessResponse(error="The daemon is not running.", status_code=1)
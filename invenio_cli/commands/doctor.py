@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio module to ease the creation and management of applications."""
+
+import os
+import shutil
+import sys
+
+from ..helpers import doctor
+from ..helpers.doctor import OK, UNKNOWN, WARNING, Check
+
+MIN_MAX_MAP_COUNT = 262144
+"""Minimum ``vm.max_map_count`` required by OpenSearch/Elasticsearch."""
+
+MIN_DOCKER_MEMORY = 6 * 2**30
+"""Memory needed by the services containers (search, db, cache, mq)."""
+
+MIN_DOCKER_CPUS = 4
+
+MIN_FREE_DISK = 10 * 2**30
+
+MAX_DISK_USAGE = 0.85
+"""Above 85% of disk usage, the search cluster stops allocating shards."""
+
+MIN_WRITE_THROUGHPUT = 100 * 2**20
+
+MIN_CELERY_CPUS = 2
+
+GB = 2**30
+MB = 2**20
+
+
+class DoctorCommands(object):
+    """Host diagnostics CLI commands."""
+
+    def __init__(self, cli_config):
+        """Constructor."""
+        self.cli_config = cli_config
+
+    def _max_map_count_check(self):
+        """Check the virtual memory areas allowed for the search cluster."""
+        value = doctor.max_map_count()
+        name = "vm.max_map_count"
+        if value is None:
+            message = "Not measurable on this host"
+            if sys.platform == "darwin":
+                message += " (Docker Desktop sets it in its VM)"
+            return Check(name, UNKNOWN, None, message + ".", None)
+        if value < MIN_MAX_MAP_COUNT:
+            return Check(
+                name,
+                WARNING,
+                value,
+                f"{value} is below the {MIN_MAX_MAP_COUNT} needed by the search "
+                + "cluster, which may fail to start or crash under load.",
+                f"sudo sysctl -w vm.max_map_count={MIN_MAX_MAP_COUNT} (and set it "
+                + "in /etc/sysctl.conf to keep it after a reboot).",
+            )
+        return Check(name, OK, value, f"{value}.", None)
+
+    def _docker_checks(self, info):
+        """Check the memory and CPUs of the Docker daemon."""
+        if info is None:
+            return [
+                Check(
+                    name,
+                    UNKNOWN,
+                    None,
+                    "The Docker daemon is not reachable.",
+                    "Start Docker and run the check again.",
+                )
+                for name in ("docker.memory", "docker.cpus")
+            ]
+
+        checks = []
+        memory = info.get("MemTotal", 0)
+        if memory < MIN_DOCKER_MEMORY:
+            checks.append(
+                Check(
+                    "docker.memory",
+                    WARNING,
+                    memory,
+                    f"{memory / GB:.1f} GB available to the containers, the "
+                    + f"services need {MIN_DOCKER_MEMORY / GB:.0f} GB.",
+                    "Give more memory to Docker (e.g. Docker Desktop > Settings "
+                    + "> Resources), or use 'services start --profile fast'.",
+                )
+            )
+        else:
+            checks.append(
+                Check("docker.memory", OK, memory, f"{memory / GB:.1f} GB.", None)
+            )
+
+        cpus = info.get("NCPU", 0)
+        if cpus < MIN_DOCKER_CPUS:
+            checks.append(
+                Check(
+                    "docker.cpus",
+                    WARNING,
+                    cpus,
+                    f"{cpus} CPUs available to the containers, at least "
+                    + f"{MIN_DOCKER_CPUS} are recommended.",
+                    "Give more CPUs to Docker (e.g. Docker Desktop > Settings "
+                    + "> Resources).",
+                )
+            )
+        else:
+            checks.append(Check("docker.cpus", OK, cpus, f"{cpus} CPUs.", None))
+        return checks
+
+    def _disk_checks(self, label, directory):
+        """Check the free space and write throughput of a directory's disk."""
+        if not directory or not os.path.isdir(directory):
+            message = f"{directory} is not accessible from this host."
+            if not directory:
+                message = "The directory is unknown."
+            return [Check(f"disk.{label}", UNKNOWN, None, message, None)]
+
+        checks = []
+        usage = shutil.disk_usage(directory)
+        ratio = usage.used / usage.total if usage.total else 0
+        message = f"{usage.free / GB:.1f} GB free ({ratio:.0%} used) on {directory}."
+        if usage.free < MIN_FREE_DISK or ratio > MAX_DISK_USAGE:
+            checks.append(
+                Check(
+                    f"disk.{label}.free",
+                    WARNING,
+                    usage.free,
+                    message,
+                    f"Free disk space: at least {MIN_FREE_DISK / GB:.0f} GB and "
+                    + f"{1 - MAX_DISK_USAGE:.0%} of the disk, otherwise the "
+                    + "search cluster stops allocating shards.",
+                )
+            )
+        else:
+            checks.append(Check(f"disk.{label}.free", OK, usage.free, message, None))
+
+        throughput = doctor.write_throughput(directory)
+        if throughput is None:
+            checks.append(
+                Check(
+                    f"disk.{label}.write",
+                    UNKNOWN,
+                    None,
+                    f"{directory} is not writable by the current user.",
+                    None,
+                )
+            )
+        elif throughput < MIN_WRITE_THROUGHPUT:
+            checks.append(
+                Check(
+                    f"disk.{label}.write",
+                    WARNING,
+                    round(throughput),
+                    f"{throughput / MB:.0f} MB/s of synced writes, below "
+                    + f"{MIN_WRITE_THROUGHPUT / MB:.0f} MB/s.",
+                    "Use a local SSD rather than a network or emulated "
+                    + "filesystem, or 'services start --profile fast'.",
+                )
+            )
+        else:
+            checks.append(
+                Check(
+                    f"disk.{label}.write",
+                    OK,
+                    round(throughput),
+                    f"{throughput / MB:.0f} MB/s of synced writes.",
+                    None,
+                )
+            )
+        return checks
+
+    def _celery_check(self):
+        """Check the CPUs available to the celery workers."""
+        cpus = doctor.available_cpus()
+        if cpus < MIN_CELERY_CPUS:
+            return Check(
+                "celery.cpus",
+                WARNING,
+                cpus,
+                f"{cpus} CPU available to the celery worker, the background "
+                + "tasks (e.g. indexing) run one at a time.",
+                "Run on a host (or CI runner) with at least "
+                + f"{MIN_CELERY_CPUS} CPUs.",
+            )
+        return Check(
+            "celery.cpus",
+            OK,
+            cpus,
+            f"{cpus} CPUs, the prefork celery worker runs as many processes.",
+            None,
+        )
+
+    def perf(self):
+        """Measure the host resources the performance depends on.
+
+        :returns: A list of :class:`~invenio_cli.helpers.doctor.Check`.
+        """
+        info = doctor.docker_info()
+        instance_path = self.cli_config.get_instance_path(throw=False)
+        if not instance_path or not instance_path.is_dir():
+            # not created yet, it will be in the project directory
+            instance_path = self.cli_config.get_project_dir()
+
+        checks = [self._max_map_count_check()]
+        checks.extend(self._docker_checks(info))
+        checks.extend(self._disk_checks("instance", str(instance_path)))
+        docker_root = info.get("DockerRootDir") if info else None
+        checks.extend(self._disk_checks("docker", docker_root))
+        checks.append(self._celery_check())
+        return checks
@@ -8,13 +8,23 @@
 
 """Invenio module to ease the creation and management of applications."""
 
+import os
+from functools import partial
 
 from ..helpers import filesystem
-from ..helpers.process import run_cmd
+from ..helpers.process import ProcessResponse, run_cmd
 from .local import LocalCommands
 from .packages import PackagesCommands
 from .steps import FunctionStep
 
+INSTANCE_PATH_SCRIPT = """
+import importlib.util, os, sys
+if importlib.util.find_spec("invenio_app") is None:
+    sys.exit(3)
+print(os.getenv("INVENIO_INSTANCE_PATH") or os.path.join(sys.prefix, "var", "instance"))
+"""
+"""Computes the instance path the way Invenio-App's factory does."""
+
 
 class InstallCommands(LocalCommands):
     """Local installation commands."""
@@ -36,9 +46,16 @@ class InstallCommands(LocalCommands):
 
         return steps
 
-    def update_instance_path(self):
-        """Update path to instance in config."""
-        result = run_cmd(
+    def _instance_path_key(self):
+        """What the instance path depends on, ``None`` if unknown."""
+        env_key = self.cli_config.python_package_manager.environment_key()
+        if not env_key:
+            return None
+        return f"{env_key}:{os.getenv('INVENIO_INSTANCE_PATH', '')}"
+
+    def _app_instance_path(self):
+        """Ask the application for its instance path, booting it."""
+        return run_cmd(
             self.cli_config.python_package_manager.run_command(
                 "invenio",
                 "shell",
@@ -49,8 +66,31 @@ class InstallCommands(LocalCommands):
                 "\"print(app.instance_path, end='')\"",
             )
         )
+
+    def update_instance_path(self):
+        """Update path to instance in config.
+
+        The path is computed by the virtualenv's Python without booting the
+        application, which is only done for applications not created by
+        Invenio-App. It is cached as long as the virtualenv does not change.
+        """
+        key = self._instance_path_key()
+        if (
+            key
+            and key == self.cli_config.get_instance_path_key()
+            and self.cli_config.get_instance_path(throw=False)
+        ):
+            return ProcessResponse(output="Instance path up to date.", status_code=0)
+
+        result = run_cmd(
+            self.cli_config.python_package_manager.run_command(
+                "python", "-c", INSTANCE_PATH_SCRIPT
+            )
+        )
+        if result.status_code != 0:
+            result = self._app_instance_path()
         if result.status_code == 0:
-            self.cli_config.update_instance_path(result.output.strip())
+            self.cli_config.update_instance_path(result.output.strip(), key=key)
             result.output = "Instance path updated successfully."
         return result
 
@@ -61,6 +101,11 @@ class InstallCommands(LocalCommands):
 
         return filesystem.force_symlink(target_path, link_path)
 
+    def _symlink_outputs(self, target):
+        """Link of a symlink step, the instance path being updated by a step."""
+        instance_path = self.cli_config.get_instance_path(throw=False)
+        return [instance_path / target] if instance_path else []
+
     def symlink(self):
         """Sylink all necessary project files and folders."""
         steps = []
@@ -76,6 +121,7 @@ class InstallCommands(LocalCommands):
                     func=self._symlink_project_file_or_folder,
                     args={"target": path},
                     message=f"Symlinking '{path}'...",
+                    outputs=partial(self._symlink_outputs, path),
                 )
                 for path in ("invenio.cfg", "templates", "app_data")
             ]
@@ -17,11 +17,60 @@ from subprocess import Popen as popen
 
 import click
 
-from ..helpers import env, filesystem
+from ..helpers import env, filesystem, fingerprints
+from ..helpers.daemon_script import editable_sources
 from ..helpers.process import ProcessResponse, run_interactive
+from ..helpers.supervisor import Supervisor
 from ..helpers.versions import rdm_version
 from .commands import Commands
 
+WORKER_QUEUES = ["celery", "low"]
+"""Queues consumed by the Celery workers."""
+
+
+PROCESS_POOLS = (None, "prefork", "solo")
+"""Celery execution pools whose default concurrency follows the CPU cores.
+
+The threads, gevent and eventlet pools are left to the Celery defaults, their
+concurrency is not bound by the CPU cores.
+"""
+
+
+def default_worker_concurrency(pools=1):
+    """Number of Celery worker processes per pool, sharing the CPU cores."""
+    return max(1, (os.cpu_count() or 1) // pools)
+
+
+WEBPACK_CREATE_KEY = "invenio webpack create"
+"""Key of the fingerprint of the webpack project."""
+
+WSGI_APPLICATION = "invenio_app.wsgi:application"
+"""WSGI application served by the production-grade servers."""
+
+
+def default_web_workers():
+    """Number of web server processes, based on the CPU count."""
+    return 2 * (os.cpu_count() or 1) + 1
+
+
+def parse_queue_pool(value):
+    """Parse a ``QUEUE[,QUEUE...][:CONCURRENCY]`` pool definition.
+
+    :returns: A ``(queues, concurrency)`` tuple, ``concurrency`` being
+              ``None`` when not given.
+    :raises ValueError: if the definition is malformed.
+    """
+    queues, _, concurrency = value.partition(":")
+    queues = [q.strip() for q in queues.split(",") if q.strip()]
+    if not queues:
+        raise ValueError(f"No queue given in '{value}'.")
+    if not concurrency:
+        return queues, None
+    concurrency = int(concurrency)
+    if concurrency < 1:
+        raise ValueError(f"Invalid concurrency in '{value}'.")
+    return queues, concurrency
+
 
 class LocalCommands(Commands):
     """Local CLI commands."""
@@ -79,6 +128,44 @@ class LocalCommands(Commands):
             status_code=0,
         )
 
+    @staticmethod
+    def _webpack_sources(source):
+        """Return the ``webpack.py`` files and ``assets`` of a source tree."""
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(source):
+            if "webpack.py" in filenames:
+                paths.append(Path(dirpath) / "webpack.py")
+            if "assets" in dirnames:
+                paths.append(Path(dirpath) / "assets")
+            dirnames[:] = sorted(
+                name
+                for name in dirnames
+                if not name.startswith(".")
+                and name not in ("assets", "node_modules", "__pycache__")
+            )
+        return paths
+
+    def _webpack_project_files(self):
+        """Inputs and outputs of ``invenio webpack create``, if known.
+
+        The webpack project is created from the bundles of the installed
+        packages and the configuration of the instance. The bundles of the
+        editable packages are read from their source trees, which the
+        installed distributions do not reflect.
+        """
+        venv = self.cli_config.python_package_manager.venv()
+        instance_path = self.cli_config.get_instance_path(throw=False)
+        if not venv or not instance_path:
+            return None
+        site_dirs = sorted(Path(venv["path"]).glob("lib/python*/site-packages"))
+        inputs = sorted(
+            path for site_dir in site_dirs for path in site_dir.glob("*.dist-info")
+        )
+        for source in editable_sources(site_dirs):
+            inputs.extend(self._webpack_sources(source))
+        inputs.append(self.cli_config.get_project_dir() / "invenio.cfg")
+        return inputs, [instance_path / "assets" / "package.json"]
+
     def update_statics_and_assets(self, force, debug=False, log_file=None):
         """High-level command to update less/js/images/... files.
 
@@ -89,9 +176,14 @@ class LocalCommands(Commands):
         js_pkg_man = self.cli_config.javascript_package_manager
         ops = [py_pkg_man.run_command("invenio", "collect", "--verbose")]
 
+        webpack_files = self._webpack_project_files()
         if force:
             ops.append(py_pkg_man.run_command("invenio", "webpack", "clean", "create"))
             ops.append(py_pkg_man.run_command("invenio", "webpack", "install"))
+        elif webpack_files and fingerprints.is_up_to_date(
+            WEBPACK_CREATE_KEY, *webpack_files
+        ):
+            click.secho("Webpack project up to date.", fg="green")
         else:
             ops.append(py_pkg_man.run_command("invenio", "webpack", "create"))
         ops.append(self._statics)
@@ -116,6 +208,8 @@ class LocalCommands(Commands):
                     )
                 if response.status_code != 0:
                     break
+        if response.status_code == 0 and webpack_files:
+            fingerprints.record(WEBPACK_CREATE_KEY, *webpack_files)
         return response
 
     def _handle_sigint(self, name, process):
@@ -131,74 +225,155 @@ class LocalCommands(Commands):
 
         signal.signal(signal.SIGINT, _signal_handler)
 
-    def run_web(self, host, port, debug=True):
-        """Run development server."""
-        click.secho("Starting up local (development) server...", fg="green")
+    def _web_command(
+        self, host, port, debug=True, server="flask", workers=None, threads=None
+    ):
+        """Command and environment of the web server.
+
+        :param server: ``flask`` for the development server, ``gunicorn`` or
+                       ``uwsgi`` to serve the application with ``workers``
+                       preloaded processes (and ``threads`` per process).
+        """
         run_env = environ.copy()
-        run_env["FLASK_DEBUG"] = "1" if debug else "0"
+        run_env["FLASK_DEBUG"] = "1" if debug and server == "flask" else "0"
         run_env["INVENIO_SITE_UI_URL"] = f"https://{host}:{port}"
         run_env["INVENIO_SITE_API_URL"] = f"https://{host}:{port}/api"
         pkg_man = self.cli_config.python_package_manager
-        proc = popen(
-            pkg_man.run_command(
+        cert, key = "docker/nginx/test.crt", "docker/nginx/test.key"
+        workers = str(workers or default_web_workers())
+
+        if server == "gunicorn":
+            command = pkg_man.run_command(
+                "gunicorn",
+                WSGI_APPLICATION,
+                "--bind",
+                f"{host}:{port}",
+                "--workers",
+                workers,
+                "--preload",
+                "--certfile",
+                cert,
+                "--keyfile",
+                key,
+            )
+            if threads:
+                command += ["--worker-class", "gthread", "--threads", str(threads)]
+        elif server == "uwsgi":
+            # uWSGI loads the application before forking unless --lazy-apps
+            command = pkg_man.run_command(
+                "uwsgi",
+                "--https",
+                f"{host}:{port},{cert},{key}",
+                "--module",
+                WSGI_APPLICATION,
+                "--master",
+                "--processes",
+                workers,
+                "--need-app",
+                "--die-on-term",
+            )
+            if threads:
+                command += ["--enable-threads", "--threads", str(threads)]
+        else:
+            command = pkg_man.run_command(
                 "invenio",
                 "run",
                 "--cert",
-                "docker/nginx/test.crt",
+                cert,
                 "--key",
-                "docker/nginx/test.key",
+                key,
                 "--host",
                 host,
                 "--port",
                 port,
                 "--extra-files",
                 "invenio.cfg",
-            ),
-            env=run_env,
-        )
-        self._handle_sigint("Web server", proc)
-        click.secho(f"Instance running!\nVisit https://{host}:{port}", fg="green")
-        return [proc]
-
-    def run_worker(
-        self, celery_log_file=None, celery_log_level="INFO", jobs_scheduler=True
-    ):
-        """Run Celery worker."""
-        click.secho("Starting celery worker...", fg="green")
-
-        pkg_man = self.cli_config.python_package_manager
-        celery_command = pkg_man.run_command(
-            "celery",
-            "--app",
-            "invenio_app.celery",
-            "worker",
-            "--beat",
-            "--events",
-            "--loglevel",
-            celery_log_level,
-            "--queues",
-            "celery,low",
-        )
+            )
+        return command, run_env
 
+    def _celery_log_options(self, celery_log_file=None, celery_log_level="INFO"):
+        """Logging options shared by the Celery commands."""
+        options = ["--loglevel", celery_log_level]
         if celery_log_file:
-            celery_command += [
-                "--logfile",
-                celery_log_file,
-            ]
+            options += ["--logfile", celery_log_file]
+        return options
 
-        processes = []
-        proc = popen(celery_command)
-        self._handle_sigint("Celery worker", proc)
-        click.secho("Worker running!", fg="green")
-        processes.append(proc)
+    def _worker_commands(
+        self,
+        celery_log_file=None,
+        celery_log_level="INFO",
+        concurrency=None,
+        autoscale=None,
+        pool=None,
+        queue_pools=None,
+        separate_beat=False,
+    ):
+        """Commands of the Celery workers (and beat), as ``(name, command)``.
+
+        The queues given a dedicated pool in ``queue_pools`` (a list of
+        ``(queues, concurrency)``) are consumed by their own worker, the
+        default worker consumes the remaining ones. Without ``concurrency``,
+        the prefork (and solo) pools whose concurrency is not given share the
+        CPU cores, the other pools use the Celery default concurrency. The
+        periodic tasks scheduler is embedded in the first worker unless
+        ``separate_beat``.
+
+        :raises click.UsageError: if ``autoscale`` is given for a pool other
+                                  than prefork, which Celery ignores.
+        """
+        if autoscale and pool not in (None, "prefork"):
+            raise click.UsageError("--autoscale requires the prefork pool.")
 
-        if jobs_scheduler:
-            processes.extend(self.run_jobs_scheduler(celery_log_file, celery_log_level))
+        pkg_man = self.cli_config.python_package_manager
+        log_options = self._celery_log_options(celery_log_file, celery_log_level)
+        queue_pools = queue_pools or []
+
+        dedicated = [q for queues, _ in queue_pools for q in queues]
+        pools = []
+        default_queues = [q for q in WORKER_QUEUES if q not in dedicated]
+        if default_queues:
+            pools.append(("worker", default_queues, None))
+        for queues, pool_concurrency in queue_pools:
+            pools.append((f"worker-{'-'.join(queues)}", queues, pool_concurrency))
+        if not concurrency and pool in PROCESS_POOLS:
+            shared = [pool for pool in pools if pool[2] is None]
+            concurrency = default_worker_concurrency(max(1, len(shared)))
+
+        commands = []
+        for name, queues, pool_concurrency in pools:
+            command = pkg_man.run_command(
+                "celery",
+                "--app",
+                "invenio_app.celery",
+                "worker",
+                "--hostname",
+                f"{name}@%h",
+                "--events",
+                *log_options,
+                "--queues",
+                ",".join(queues),
+            )
+            if not commands and not separate_beat:
+                command.insert(command.index("worker") + 1, "--beat")
+            if pool:
+                command += ["--pool", pool]
+            if pool_concurrency is None and autoscale:
+                # Celery expects the maximum first
+                command += ["--autoscale", f"{autoscale[1]},{autoscale[0]}"]
+            elif pool_concurrency or concurrency:
+                command += ["--concurrency", str(pool_concurrency or concurrency)]
+            commands.append((name, command))
+
+        if separate_beat:
+            beat_command = pkg_man.run_command(
+                "celery", "--app", "invenio_app.celery", "beat", *log_options
+            )
+            commands.append(("beat", beat_command))
 
-        return processes
+        return commands
 
-    def run_jobs_scheduler(self, celery_log_file=None, celery_log_level="INFO"):
-        """Run Celery beat scheduler for jobs."""
+    def _jobs_scheduler_command(self, celery_log_file=None, celery_log_level="INFO"):
+        """Command of the jobs scheduler, ``None`` if not supported."""
         # Jobs scheduler is only available in RDM v13+
         version = rdm_version()
         if version is None:
@@ -207,11 +382,9 @@ class LocalCommands(Commands):
                 fg="yellow",
                 err=True,
             )
-            return []
+            return None
         elif version[0] < 13:
-            return []
-
-        click.secho("Starting jobs scheduler...", fg="green")
+            return None
 
         pkg_man = self.cli_config.python_package_manager
         beat_command = pkg_man.run_command(
@@ -221,16 +394,61 @@ class LocalCommands(Commands):
             "beat",
             "--scheduler",
             "invenio_jobs.services.scheduler:RunScheduler",
-            "--loglevel",
-            celery_log_level,
+            *self._celery_log_options(celery_log_file, celery_log_level),
         )
 
-        if celery_log_file:
-            beat_command += [
-                "--logfile",
-                celery_log_file,
-            ]
+        return beat_command
+
+    def run_web(
+        self, host, port, debug=True, server="flask", workers=None, threads=None
+    ):
+        """Run web server."""
+        if server == "flask":
+            click.secho("Starting up local (development) server...", fg="green")
+        else:
+            click.secho(f"Starting up local {server} server...", fg="green")
+        command, run_env = self._web_command(
+            host, port, debug, server, workers, threads
+        )
+        proc = popen(command, env=run_env)
+        self._handle_sigint("Web server", proc)
+        click.secho(f"Instance running!\nVisit https://{host}:{port}", fg="green")
+        return [proc]
+
+    def run_worker(
+        self,
+        celery_log_file=None,
+        celery_log_level="INFO",
+        jobs_scheduler=True,
+        **worker_options,
+    ):
+        """Run Celery workers.
 
+        :param worker_options: Scaling options, see ``_worker_commands``.
+        """
+        click.secho("Starting celery worker...", fg="green")
+
+        processes = []
+        for name, command in self._worker_commands(
+            celery_log_file, celery_log_level, **worker_options
+        ):
+            proc = popen(command)
+            self._handle_sigint(f"Celery {name}", proc)
+            processes.append(proc)
+        click.secho("Worker running!", fg="green")
+
+        if jobs_scheduler:
+            processes.extend(self.run_jobs_scheduler(celery_log_file, celery_log_level))
+
+        return processes
+
+    def run_jobs_scheduler(self, celery_log_file=None, celery_log_level="INFO"):
+        """Run Celery beat scheduler for jobs."""
+        beat_command = self._jobs_scheduler_command(celery_log_file, celery_log_level)
+        if not beat_command:
+            return []
+
+        click.secho("Starting jobs scheduler...", fg="green")
         proc = popen(beat_command)
         self._handle_sigint("Jobs scheduler", proc)
         click.secho("Jobs scheduler running!", fg="green")
@@ -245,13 +463,35 @@ class LocalCommands(Commands):
         celery_log_file=None,
         celery_log_level="INFO",
         jobs_scheduler=True,
+        max_restarts=None,
+        server="flask",
+        workers=None,
+        threads=None,
+        **worker_options,
     ):
-        """Run all services."""
-        processes = [
-            *self.run_web(host, port, debug),
-            *self.run_worker(
-                celery_log_file, celery_log_level, jobs_scheduler=jobs_scheduler
-            ),
-        ]
+        """Run all services under a supervisor until interrupted.
 
-        return processes
+        The web server, the worker and the jobs scheduler are watched
+        concurrently, restarted with backoff when they crash, and their
+        output is multiplexed with a prefix per process.
+
+        :returns: The exit code of the supervisor.
+        """
+        supervisor = Supervisor(max_restarts=max_restarts)
+        command, run_env = self._web_command(
+            host, port, debug, server, workers, threads
+        )
+        supervisor.add("web", command, env=run_env)
+        for name, worker_command in self._worker_commands(
+            celery_log_file, celery_log_level, **worker_options
+        ):
+            supervisor.add(name, worker_command)
+        if jobs_scheduler:
+            beat_command = self._jobs_scheduler_command(
+                celery_log_file, celery_log_level
+            )
+            if beat_command:
+                supervisor.add("scheduler", beat_command)
+
+        click.secho(f"Instance running!\nVisit https://{host}:{port}", fg="green")
+        return supervisor.run()
@@ -95,12 +95,20 @@ class PackagesCommands(object):
 
     def lock(self, pre, dev):
         """Steps to lock Python dependencies."""
-        cmd = self.cli_config.python_package_manager.lock_dependencies(pre, dev)
+        pkg_man = self.cli_config.python_package_manager
+        cmd = pkg_man.lock_dependencies(pre, dev)
+        project_dir = self.cli_config.get_project_dir()
         steps = [
             CommandStep(
                 cmd=cmd,
                 env={"PIPENV_VERBOSITY": "-1"},
                 message="Locking python dependencies...",
+                inputs=[
+                    project_dir / filename
+                    for filename in pkg_man.project_files
+                    if filename != pkg_man.lock_file_name
+                ],
+                outputs=[project_dir / pkg_man.lock_file_name],
             )
         ]
 
@@ -9,17 +9,39 @@
 
 """Invenio module to ease the creation and management of applications."""
 
+import os
+import time
+
 import click
 
 from invenio_cli.commands.translations import TranslationsCommands
 from invenio_cli.helpers.env import env
 
+from ..helpers.compose import (
+    search_heap_size,
+    write_fast_profile_override,
+    write_search_snapshots_override,
+)
 from ..helpers.docker_helper import DockerHelper
+from ..helpers.images import PullProgress
+from ..helpers.plans import PlanParams, PlanStep, resolve_plan
 from ..helpers.process import ProcessResponse
+from ..helpers.search import (
+    SNAPSHOT_CONTAINER_PATH,
+    BulkIndexingSettings,
+    SearchClient,
+    SearchError,
+    create_snapshot,
+    instance_indices,
+    list_snapshots,
+    register_snapshot_repository,
+    restore_snapshot,
+    snapshot_size,
+)
 from ..helpers.versions import ils_version, rdm_version
 from .commands import Commands
 from .services_health import HEALTHCHECKS, ServicesHealthCommands
-from .steps import CommandStep, FunctionStep
+from .steps import CommandStep, ContextStep, FunctionStep, ParallelStep
 
 
 class ServicesCommands(Commands):
@@ -29,8 +51,15 @@ class ServicesCommands(Commands):
         """Constructor."""
         super().__init__(cli_config)
         self.docker_helper = docker_helper or DockerHelper(
-            cli_config.get_project_shortname(), local=True
+            cli_config.get_project_shortname(),
+            local=True,
+            override_files=cli_config.get_compose_override_files(),
         )
+        self._db_env = None
+
+    def _search_address(self):
+        """Host and port of the search service."""
+        return self.cli_config.get_search_host(), self.cli_config.get_search_port()
 
     def ensure_containers_running(self):
         """Ensures containers are running."""
@@ -44,14 +73,16 @@ class ServicesCommands(Commands):
         with env(**cmd_env):
             self.docker_helper.start_containers()
 
+        search_host, search_port = self._search_address()
         services = ["redis", self.cli_config.get_db_type(), "search"]
         for service in services:
             ready = ServicesHealthCommands.wait_for_service(
                 service,
                 project_shortname=project_shortname,
                 print_func=lambda msg: click.secho(msg, fg="yellow"),
-                search_host=self.cli_config.get_search_host(),
-                search_port=self.cli_config.get_search_port(),
+                search_host=search_host,
+                search_port=search_port,
+                project_name=self.docker_helper.project_name,
             )
 
             if not ready:
@@ -83,55 +114,340 @@ class ServicesCommands(Commands):
             output="Services setup status consistent.", status_code=0
         )
 
-    def _cleanup(self):
-        """Services cleanup steps."""
-        pkg_man = self.cli_config.python_package_manager
+    def _db_credentials(self):
+        """Name of the database, and user and password of its owner.
+
+        They are the ones given to the ``db`` service in the compose files,
+        with the defaults of the PostgreSQL and MySQL images.
+        """
+        if self._db_env is None:
+            self._db_env = self.docker_helper.service_environment("db")
+        if self.cli_config.get_db_type() == "mysql":
+            user = self._db_env.get("MYSQL_USER")
+            if user:
+                password = self._db_env.get("MYSQL_PASSWORD", "")
+            else:
+                user, password = "root", self._db_env.get("MYSQL_ROOT_PASSWORD", "")
+            return self._db_env.get("MYSQL_DATABASE", ""), user, password
+        user = self._db_env.get("POSTGRES_USER") or "postgres"
+        password = self._db_env.get("POSTGRES_PASSWORD", "")
+        return self._db_env.get("POSTGRES_DB") or user, user, password
+
+    def db_template_name(self):
+        """Name of the template database kept after the setup."""
+        return f"{self._db_credentials()[0]}_template"
+
+    def _psql(self, *statements):
+        """Run SQL statements, each in its own transaction, in the db container."""
+        command = [
+            "psql",
+            "--username",
+            self._db_credentials()[1],
+            "--dbname",
+            "postgres",
+            "--tuples-only",
+            "--no-align",
+            "--set",
+            "ON_ERROR_STOP=1",
+        ]
+        for statement in statements:
+            command.extend(["--command", statement])
+        return self.docker_helper.exec_service("db", command)
+
+    def _copy_database(self, source, target):
+        """Replace the ``target`` database by a copy of ``source``."""
+        # no one can be connected to the databases while they are copied
+        return self._psql(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            + f"WHERE datname IN ('{source}', '{target}') "
+            + "AND pid <> pg_backend_pid()",
+            f'DROP DATABASE IF EXISTS "{target}"',
+            f'CREATE DATABASE "{target}" TEMPLATE "{source}"',
+        )
+
+    def save_db_template(self):
+        """Keep a copy of the database, to reset it to its current state."""
+        if self.cli_config.get_db_type() != "postgresql":
+            return ProcessResponse(
+                error="Database templates are only supported by PostgreSQL.",
+                status_code=1,
+            )
+        try:
+            db_name = self._db_credentials()[0]
+        except RuntimeError as e:
+            return ProcessResponse(error=str(e), status_code=1)
+        template = self.db_template_name()
+        response = self._copy_database(db_name, template)
+        if response.status_code == 0:
+            # connections would prevent the copies of the template
+            response = self._psql(
+                f'ALTER DATABASE "{template}" WITH ALLOW_CONNECTIONS false'
+            )
+        return response
+
+    def restore_db_template(self):
+        """Reset the database to the template kept after the setup.
+
+        ``CREATE DATABASE ... TEMPLATE`` copies the database files, which is
+        much faster than destroying and creating the tables and fixtures.
+        """
+        if self.cli_config.get_db_type() != "postgresql":
+            return ProcessResponse(
+                error="Database templates are only supported by PostgreSQL.",
+                status_code=1,
+            )
+        try:
+            db_name = self._db_credentials()[0]
+        except RuntimeError as e:
+            return ProcessResponse(error=str(e), status_code=1)
+        template = self.db_template_name()
+        response = self._psql(f"SELECT 1 FROM pg_database WHERE datname = '{template}'")
+        if response.status_code > 0:
+            return response
+        if not response.output.strip():
+            return ProcessResponse(
+                error=f"No template database ({template}), "
+                + "run 'invenio-cli services setup' first.",
+                status_code=1,
+            )
+        return self._copy_database(template, db_name)
+
+    def _search_client(self):
+        """Client for the search cluster of the services."""
+        host, port = self._search_address()
+        # snapshots are waited for in the requests
+        return SearchClient(host, port, timeout=3600)
+
+    def enable_search_snapshots(self, recreate=False):
+        """Mount the snapshot repository directory in the search container.
+
+        The compose override is kept in the cache directory, so that the
+        services are always started with it from now on.
+
+        :param recreate: Allow an existing search container to be recreated
+                         with the repository, losing the data it does not
+                         keep in a volume.
+        """
+        cache_dir = self.cli_config.get_cache_dir()
+        override_file = cache_dir / "compose" / "search-snapshots.yml"
+        if (
+            not override_file.exists()
+            and not recreate
+            and self.docker_helper.has_container("search")
+        ):
+            return ProcessResponse(
+                error="The search container has to be recreated to mount the "
+                + "snapshot repository, losing the data it does not keep in a "
+                + "volume. Run the command again with --recreate-search to do so.",
+                status_code=1,
+            )
+
+        snapshots_dir = cache_dir / "search-snapshots"
+        snapshots_dir.mkdir(parents=True, exist_ok=True)
+        # the search cluster does not run as the current user
+        os.chmod(snapshots_dir, 0o777)
+
+        write_search_snapshots_override(
+            override_file, snapshots_dir, SNAPSHOT_CONTAINER_PATH
+        )
+        if override_file not in self.docker_helper.override_files:
+            self.docker_helper.override_files.insert(0, override_file)
+
+        return ProcessResponse(
+            output=f"Snapshots are stored in {snapshots_dir}.", status_code=0
+        )
+
+    def _instance_indices(self):
+        """Pattern of the indices of the instance."""
+        return instance_indices(self.cli_config.get_search_index_prefix())
+
+    @staticmethod
+    def _transfer_summary(size, duration):
+        """Human readable size, duration and throughput of a transfer."""
+        throughput = size / duration if duration else 0
+        return f"{size / 1e6:.1f} MB in {duration:.1f}s ({throughput / 1e6:.1f} MB/s)"
+
+    def create_search_snapshot(self, name):
+        """Snapshot the indices of the instance."""
+        client = self._search_client()
+        try:
+            register_snapshot_repository(client)
+            start = time.monotonic()
+            snapshot = create_snapshot(client, name, self._instance_indices())
+            duration = time.monotonic() - start
+            size = snapshot_size(client, name)
+        except SearchError as e:
+            return ProcessResponse(error=str(e), status_code=1)
+
+        if snapshot.get("state") != "SUCCESS":
+            return ProcessResponse(
+                error=f"Snapshot {name} ended with state {snapshot.get('state')}.",
+                status_code=1,
+            )
+        return ProcessResponse(
+            output=f"Snapshot {name} of {len(snapshot['indices'])} indices created: "
+            + self._transfer_summary(size, duration),
+            status_code=0,
+        )
+
+    def restore_search_snapshot(self, name):
+        """Restore the indices of a snapshot, replacing the current ones."""
+        client = self._search_client()
+        try:
+            register_snapshot_repository(client)
+            size = snapshot_size(client, name)
+            start = time.monotonic()
+            snapshot = restore_snapshot(client, name, self._instance_indices())
+            duration = time.monotonic() - start
+        except SearchError as e:
+            return ProcessResponse(error=str(e), status_code=1)
+
+        return ProcessResponse(
+            output=f"Snapshot {name} of {len(snapshot['indices'])} indices restored: "
+            + self._transfer_summary(size, duration),
+            status_code=0,
+        )
+
+    def search_snapshots(self):
+        """Return the snapshots of the repository, as a list of dicts."""
+        client = self._search_client()
+        register_snapshot_repository(client)
+        return list_snapshots(client)
+
+    def search_snapshot(self, action, name, services=True, recreate=False):
+        """Steps to create or restore a snapshot of the search indices.
+
+        :param action: ``create`` or ``restore``.
+        :param recreate: Allow the search container to be recreated.
+        """
         steps = [
-            CommandStep(
-                cmd=pkg_man.run_command(
-                    "invenio",
-                    "shell",
-                    "--no-term-title",
-                    "-c",
-                    "import redis; redis.StrictRedis.from_url(app.config['CACHE_REDIS_URL']).flushall(); print('Cache cleared')",  # noqa
-                ),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Flushing Redis...",
-                skippable=True,
-            ),
-            CommandStep(
-                cmd=pkg_man.run_command("invenio", "db", "destroy", "--yes-i-know"),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Destroying database...",
-                skippable=True,
-            ),
-            CommandStep(
-                cmd=pkg_man.run_command(
-                    "invenio",
-                    "index",
-                    "destroy",
-                    "--force",
-                    "--yes-i-know",
-                ),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Destroying indices...",
-                skippable=True,
-            ),
-            CommandStep(
-                cmd=pkg_man.run_command("invenio", "index", "queue", "init", "purge"),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Purging queues...",
-                skippable=True,
-            ),
             FunctionStep(
-                func=self.cli_config.update_services_setup,
-                args={"is_setup": False},
-                message="Updating service setup status (False)...",
-            ),
+                func=self.enable_search_snapshots,
+                args={"recreate": recreate},
+                message="Enabling the snapshot repository...",
+            )
         ]
-
+        if services:
+            # recreates the search container if the repository was just added
+            steps.append(
+                FunctionStep(
+                    func=self.ensure_containers_running,
+                    message="Making sure containers are up...",
+                )
+            )
+        if action == "create":
+            steps.append(
+                FunctionStep(
+                    func=self.create_search_snapshot,
+                    args={"name": name},
+                    message=f"Creating snapshot {name}...",
+                )
+            )
+        else:
+            steps.append(
+                FunctionStep(
+                    func=self.restore_search_snapshot,
+                    args={"name": name},
+                    message=f"Restoring snapshot {name}...",
+                )
+            )
         return steps
 
+    def _profile_override_file(self):
+        """Compose file of the services profile."""
+        return self.cli_config.get_cache_dir() / "compose" / "profile.yml"
+
+    def apply_profile(self, profile):
+        """Write, or remove, the compose override of a services profile.
+
+        The profile is kept in the private config file, the services are
+        started with it from now on.
+
+        :param profile: ``fast`` or ``durable``.
+        """
+        override_file = self._profile_override_file()
+        override_files = self.docker_helper.override_files
+        if profile == "fast":
+            heap_size = search_heap_size()
+            write_fast_profile_override(
+                override_file,
+                self.cli_config.get_db_type(),
+                self.cli_config.get_search_type(),
+                heap_size,
+            )
+            if override_file not in override_files:
+                override_files.insert(0, override_file)
+            output = (
+                f"Services profile fast applied (search heap {heap_size} MB), "
+                + "their data is lost when they stop."
+            )
+        else:
+            override_file.unlink(missing_ok=True)
+            if override_file in override_files:
+                override_files.remove(override_file)
+            output = f"Services profile {profile} applied."
+
+        if profile != self.cli_config.get_services_profile():
+            if profile == "fast":
+                # the database is recreated in memory, empty
+                self.cli_config.update_services_setup(False)
+            self.cli_config.update_services_profile(profile)
+
+        return ProcessResponse(output=output, status_code=0)
+
+    def _profile_steps(self, profile=None):
+        """Steps applying the given, or else the configured, services profile."""
+        profile = profile or self.cli_config.get_services_profile()
+        if not profile:
+            return []
+        return [
+            FunctionStep(
+                func=self.apply_profile,
+                args={"profile": profile},
+                message=f"Applying the {profile} services profile...",
+            )
+        ]
+
+    def pull_images(self):
+        """Pull the missing images of the services at the same time.
+
+        Compose pulls them itself otherwise, with no visible progress.
+        """
+        try:
+            images = self.docker_helper.missing_images()
+        except RuntimeError as e:
+            return ProcessResponse(error=str(e), status_code=1)
+        if not images:
+            return ProcessResponse(output="All the images are present.", status_code=0)
+
+        progress = PullProgress(images)
+        mirror = self.cli_config.get_registry_mirror()
+        step = ParallelStep(
+            steps=[
+                FunctionStep(
+                    func=self.docker_helper.pull_image,
+                    args={
+                        "image": image,
+                        "mirror": mirror,
+                        "progress": progress.update,
+                    },
+                )
+                for image in images
+            ],
+            progress=lambda: click.secho(progress.report(), fg="yellow"),
+            interval=2,
+        )
+        response = step.execute()
+        if response.status_code == 0:
+            response.output = f"Pulled {len(images)} image(s)."
+        return response
+
+    def _pull_step(self):
+        """Step pulling the missing images, compose pulls them on failure."""
+        return FunctionStep(
+            func=self.pull_images, message="Pulling the images...", skippable=True
+        )
+
     def _default_location_path(self):
         """Build default location path based on file storage selection."""
         file_storage = self.cli_config.get_file_storage()
@@ -139,173 +455,183 @@ class ServicesCommands(Commands):
             return "{}/data".format(self.cli_config.get_instance_path())
         return "{}://default".format(self.cli_config.get_file_storage().lower())
 
-    def _setup(self, demo_data=False):
-        """Services initialization steps."""
+    def _plan_params(self):
+        """Values of the placeholders of the plans' commands."""
+        return PlanParams(default_location=self._default_location_path)
+
+    def _command_step(self, plan_step, params):
+        """Step running the command of a plan step in the virtualenv."""
         pkg_man = self.cli_config.python_package_manager
-        steps = [
+        return CommandStep(
+            cmd=pkg_man.run_command(*plan_step.args(params)),
+            env={"PIPENV_VERBOSITY": "-1"},
+            message=plan_step.message,
+            skippable=plan_step.skippable,
+        )
+
+    def _builtin_expect_not_setup(self, plan_step):
+        """Steps checking that the services are not setup yet."""
+        return [
             FunctionStep(
                 func=self.services_expected_status,
                 args={"expected": False},
-                message="Checking services are not setup...",
-            ),
-            CommandStep(
-                cmd=pkg_man.run_command("invenio", "db", "init", "create"),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Creating database...",
-            ),
-            CommandStep(
-                cmd=pkg_man.run_command(
-                    "invenio",
-                    "files",
-                    "location",
-                    "create",
-                    "--default",
-                    "default-location",
-                    self._default_location_path(),
-                ),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Creating files location...",
-            ),
-            CommandStep(
-                cmd=pkg_man.run_command("invenio", "roles", "create", "admin"),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Creating admin role...",
-            ),
-            CommandStep(
-                cmd=pkg_man.run_command(
-                    "invenio",
-                    "access",
-                    "allow",
-                    "superuser-access",
-                    "role",
-                    "admin",
-                ),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Allowing superuser access to admin role...",
-            ),
-            CommandStep(
-                cmd=pkg_man.run_command("invenio", "index", "init"),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Creating indices...",
-            ),
+                message=plan_step.message,
+                skippable=plan_step.skippable,
+            )
         ]
 
-        rdm_version_value = rdm_version()
-        if rdm_version_value:
-            if rdm_version_value[0] >= 10:
-                steps.extend(
-                    [
-                        CommandStep(
-                            cmd=pkg_man.run_command(
-                                "invenio",
-                                "rdm-records",
-                                "custom-fields",
-                                "init",
-                            ),
-                            env={"PIPENV_VERBOSITY": "-1"},
-                            message="Creating custom fields for records...",
-                        ),
-                        CommandStep(
-                            cmd=pkg_man.run_command(
-                                "invenio",
-                                "communities",
-                                "custom-fields",
-                                "init",
-                            ),
-                            env={"PIPENV_VERBOSITY": "-1"},
-                            message="Creating custom fields for communities...",
-                        ),
-                    ]
-                )
+    def _builtin_mark_setup(self, plan_step, is_setup=True):
+        """Steps updating the services setup status."""
+        return [
+            FunctionStep(
+                func=self.cli_config.update_services_setup,
+                args={"is_setup": is_setup},
+                message=plan_step.message,
+                skippable=plan_step.skippable,
+            )
+        ]
 
-            if rdm_version_value[0] >= 11:
-                steps.extend(self.rdm_fixtures())
-                steps.extend(self.translations())
+    def _builtin_mark_not_setup(self, plan_step):
+        """Steps resetting the services setup status."""
+        return self._builtin_mark_setup(plan_step, is_setup=False)
 
-            if rdm_version_value[0] >= 12:
-                steps.extend(self.declare_queues())
+    def _builtin_translations(self, plan_step):
+        """Steps compiling the message catalogs."""
+        steps = self.translations()
+        for step in steps:
+            step.skippable = step.skippable or plan_step.skippable
+        return steps
 
-            steps.extend(self.fixtures())
-            if demo_data:
-                steps.extend(self.demo())
-        else:
-            click.secho(
-                "RDM version couldn't be determined. RDM-specific steps will not be executed.",
-                fg="yellow",
-                err=True,
-            )
+    @staticmethod
+    def _unsupported():
+        """Fail, the command not being supported by the instance."""
+        return ProcessResponse(
+            error="Only supported by InvenioRDM instances.", status_code=1
+        )
+
+    def _builtin_unsupported(self, plan_step):
+        """Steps failing, the command not being supported by the instance."""
+        return [FunctionStep(func=self._unsupported, message=plan_step.message)]
 
-        if ils_version():
-            cmd = pkg_man.run_command("invenio", "setup", "--verbose")
-            if not demo_data:
-                cmd.append("--skip-demo-data")
-            steps.extend(
-                [
-                    CommandStep(
-                        cmd=cmd,
-                        env={"PIPENV_VERBOSITY": "-1"},
-                        message="Setting up services...",
-                    )
-                ]
+    def _builtin_save_db_template(self, plan_step):
+        """Steps keeping a template of the database, if supported."""
+        if self.cli_config.get_db_type() != "postgresql":
+            return []
+        return [
+            FunctionStep(
+                func=self.save_db_template,
+                message=plan_step.message,
+                skippable=plan_step.skippable,
             )
+        ]
 
-        steps.append(
+    def _builtin_restore_db_template(self, plan_step):
+        """Steps resetting the database from its template."""
+        return [
             FunctionStep(
-                func=self.cli_config.update_services_setup,
-                args={"is_setup": True},
-                message="Updating service setup status (True)...",
-            ),
+                func=self.restore_db_template,
+                message=plan_step.message,
+                skippable=plan_step.skippable,
+            )
+        ]
+
+    def _builtin_demo(self, plan_step):
+        """Steps adding the demo records."""
+        return self.demo()
+
+    def _version_facts(self):
+        """Major versions of InvenioRDM and InvenioILS, ``None`` if absent."""
+        rdm_version_value = rdm_version()
+        ils_version_value = ils_version()
+        return {
+            "rdm": rdm_version_value[0] if rdm_version_value else None,
+            "ils": ils_version_value[0] if ils_version_value else None,
+        }
+
+    def _bulk_step(self, steps):
+        """Step running steps with the bulk indexing settings applied."""
+        settings = BulkIndexingSettings(
+            SearchClient(*self._search_address()), self._instance_indices()
+        )
+        return ContextStep(
+            steps=steps,
+            on_enter=settings.apply,
+            on_exit=settings.restore,
+            print_func=lambda msg: click.secho(msg, fg="green"),
+            message="Applying the bulk indexing settings...",
         )
 
+    def plan(self, name, **facts):
+        """Return the steps of a plan of ``plans/services.yml``.
+
+        :param name: Name of the plan.
+        :param facts: Facts the plan is resolved for (``rdm``, ``ils`` and
+                      ``demo_data``), see :func:`resolve_plan`.
+        """
+        params = self._plan_params()
+        steps = []
+        bulk_steps = []
+        for plan_step in resolve_plan(name, **facts):
+            if plan_step.bulk:
+                bulk_steps.append(self._command_step(plan_step, params))
+                continue
+            if bulk_steps:
+                steps.append(self._bulk_step(bulk_steps))
+                bulk_steps = []
+
+            if plan_step.builtin:
+                builtin = getattr(self, f"_builtin_{plan_step.builtin}")
+                steps.extend(builtin(plan_step))
+            else:
+                steps.append(self._command_step(plan_step, params))
+        if bulk_steps:
+            steps.append(self._bulk_step(bulk_steps))
         return steps
 
-    def demo(self):
-        """Steps to add demo records into the instance."""
-        pkg_man = self.cli_config.python_package_manager
-        steps = [
-            CommandStep(
-                cmd=pkg_man.run_command("invenio", "rdm-records", "demo"),
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Creating demo records...",
+    def _cleanup(self):
+        """Services cleanup steps."""
+        return self.plan("cleanup")
+
+    def _setup(self, demo_data=False):
+        """Services initialization steps."""
+        facts = self._version_facts()
+        if not facts["rdm"]:
+            click.secho(
+                "RDM version couldn't be determined. RDM-specific steps will not be executed.",
+                fg="yellow",
+                err=True,
             )
-        ]
+        return self.plan("setup", demo_data=demo_data, **facts)
 
-        return steps
+    def demo(self):
+        """Steps to add demo records into the instance."""
+        return self.plan("demo")
+
+    def _single_command(self, command, message, **kwargs):
+        """Steps running a command, as a step of a plan would."""
+        plan_step = PlanStep(
+            message=message,
+            command=command,
+            builtin=None,
+            skippable=False,
+            bulk=False,
+            when=(),
+        )
+        return [self._command_step(plan_step, self._plan_params(), **kwargs)]
 
     def declare_queues(self):
         """Steps to declare the MQ queues required for statistics, etc."""
-        pkg_man = self.cli_config.python_package_manager
-        command = pkg_man.run_command("invenio", "queues", "declare")
-        steps = [CommandStep(cmd=command, message="Declaring queues...")]
-        return steps
+        return self._single_command("invenio queues declare", "Declaring queues...")
 
     def fixtures(self):
         """Steps to set up the required fixtures for the instance."""
-        pkg_man = self.cli_config.python_package_manager
-        command = pkg_man.run_command("invenio", "rdm-records", "fixtures")
-        steps = [
-            CommandStep(
-                cmd=command,
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Creating records fixtures...",
-            )
-        ]
-
-        return steps
+        return self._single_command(
+            "invenio rdm-records fixtures", "Creating records fixtures..."
+        )
 
     def rdm_fixtures(self):
         """Steps to set up the rdm fixtures for the instance."""
-        pkg_man = self.cli_config.python_package_manager
-        command = pkg_man.run_command("invenio", "rdm", "fixtures")
-        steps = [
-            CommandStep(
-                cmd=command,
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Creating rdm fixtures...",
-            )
-        ]
-
-        return steps
+        return self._single_command("invenio rdm fixtures", "Creating rdm fixtures...")
 
     def translations(self):
         """Steps to compile translations."""
@@ -316,15 +642,19 @@ class ServicesCommands(Commands):
         )
         return commands.compile(symlink=False)
 
-    def setup(self, force, demo_data=True, stop=False, services=True):
+    def setup(self, force, demo_data=True, stop=False, services=True, profile=None):
         """Steps to setup services' containers.
 
         A check in invenio-cli's config file is done to see if one-time setup
         has been executed before.
+
+        :param profile: Services profile (``fast`` or ``durable``) to apply,
+                        defaults to the configured one.
         """
-        steps = []
+        steps = self._profile_steps(profile)
 
         if services:
+            steps.append(self._pull_step())
             steps.append(
                 FunctionStep(
                     func=self.ensure_containers_running,
@@ -345,14 +675,37 @@ class ServicesCommands(Commands):
             )
         return steps
 
-    def start(self):
-        """Steps to start services' containers."""
-        steps = [
+    def reset(self, services=True):
+        """Steps to reset the services to their state right after the setup.
+
+        The database is restored from the template kept by the setup, the
+        indices are created again and filled from it.
+        """
+        steps = []
+        if services:
+            steps.append(
+                FunctionStep(
+                    func=self.ensure_containers_running,
+                    message="Making sure containers are up...",
+                )
+            )
+        steps.extend(self.plan("reset", **self._version_facts()))
+        return steps
+
+    def start(self, profile=None):
+        """Steps to start services' containers.
+
+        :param profile: Services profile (``fast`` or ``durable``) to apply,
+                        defaults to the configured one.
+        """
+        steps = self._profile_steps(profile)
+        steps.append(self._pull_step())
+        steps.append(
             FunctionStep(
                 func=self.ensure_containers_running,
                 message="Making sure containers are up...",
             )
-        ]
+        )
 
         return steps
 
@@ -364,6 +717,15 @@ class ServicesCommands(Commands):
                 message="Stopping containers...",
             )
         ]
+        if self.cli_config.get_services_profile() == "fast":
+            # the data in memory is gone with the containers
+            steps.append(
+                FunctionStep(
+                    func=self.cli_config.update_services_setup,
+                    args={"is_setup": False},
+                    message="Updating service setup status (False)...",
+                )
+            )
 
         return steps
 
@@ -26,6 +26,14 @@ from ..helpers.process import run_cmd
 class ServicesHealthCommands(object):
     """Services status commands."""
 
+    @classmethod
+    def _compose(cls, filepath, project_name=None):
+        """Docker compose command for the given file and project."""
+        command = ["docker", "compose"]
+        if project_name:
+            command.extend(["--project-name", project_name])
+        return command + ["--file", filepath]
+
     @classmethod
     def search_healthcheck(cls, *args, **kwargs):
         """Open/Elasticsearch healthcheck."""
@@ -41,11 +49,8 @@ class ServicesHealthCommands(object):
         filepath = kwargs["filepath"]
 
         return run_cmd(
-            [
-                "docker",
-                "compose",
-                "--file",
-                filepath,
+            cls._compose(filepath, kwargs.get("project_name"))
+            + [
                 "exec",
                 "-T",
                 "db",
@@ -62,11 +67,8 @@ class ServicesHealthCommands(object):
         password = kwargs["project_shortname"]
 
         return run_cmd(
-            [
-                "docker",
-                "compose",
-                "--file",
-                filepath,
+            cls._compose(filepath, kwargs.get("project_name"))
+            + [
                 "exec",
                 "-T",
                 "db",
@@ -82,11 +84,8 @@ class ServicesHealthCommands(object):
         filepath = kwargs["filepath"]
 
         return run_cmd(
-            [
-                "docker",
-                "compose",
-                "--file",
-                filepath,
+            cls._compose(filepath, kwargs.get("project_name"))
+            + [
                 "exec",
                 "-T",
                 "cache",
@@ -110,6 +109,7 @@ class ServicesHealthCommands(object):
         verbose=False,
         search_host="localhost",
         search_port="9200",
+        project_name=None,
     ):
         """Wait for the given service to be up."""
         if service not in HEALTHCHECKS:
@@ -132,6 +132,7 @@ class ServicesHealthCommands(object):
                 project_shortname=project_shortname,
                 search_host=search_host,
                 search_port=search_port,
+                project_name=project_name,
             )
             ready = response.status_code == 0
 
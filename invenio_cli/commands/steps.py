@@ -8,21 +8,79 @@
 
 """Invenio module to ease the creation and management of applications."""
 
-from ..helpers.process import run_interactive
+import shlex
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import copy_context
+
+from ..helpers import fingerprints, log, profiling, tracing
+from ..helpers.process import ProcessResponse, run_interactive
+
+
+def execute_step(step):
+    """Execute a step within its own log entry, trace span and profile name."""
+    step_type = type(step).__name__
+    with log.step(step.message, step_type) as step_log, tracing.span(
+        "step", **{"step.type": step_type, "step.message": step.message}
+    ) as span, profiling.step(step.message):
+        response = step.execute()
+        step_log.status_code = response.status_code
+        step_log.error = response.error
+        if span:
+            span.set_attribute("step.status_code", response.status_code)
+            if response.status_code > 0:
+                span.set_error(response.error)
+    return response
 
 
 class Step(object):
     """Interface for step objects."""
 
-    def __init__(self, message=None, skippable=False):
-        """Constructor."""
+    def __init__(
+        self, message=None, skippable=False, inputs=None, outputs=None, cache_key=None
+    ):
+        """Constructor.
+
+        :param inputs: Files (or directories) the step reads. With outputs,
+                       the step is skipped while they are not modified.
+        :param outputs: Files (or directories) the step creates. The step is
+                        skipped while they exist. Either list can be given as
+                        a function, called when the step is about to run.
+        :param cache_key: Identifies the step among the recorded fingerprints,
+                          its message by default.
+        """
         self.message = message
         self.skippable = skippable
+        self.inputs = inputs
+        self.outputs = outputs
+        self.cache_key = cache_key or message
 
     def execute(self):
         """Execute the step."""
         raise NotImplementedError
 
+    def _fingerprint_args(self):
+        """Arguments identifying the step and its files to the fingerprints."""
+        inputs, outputs = [
+            (paths() if callable(paths) else paths) or []
+            for paths in (self.inputs, self.outputs)
+        ]
+        return (self.cache_key, inputs, outputs, self.describe())
+
+    def is_up_to_date(self):
+        """Whether the step can be skipped, its inputs and outputs unchanged."""
+        if self.inputs is None and self.outputs is None:
+            return False
+        return fingerprints.is_up_to_date(*self._fingerprint_args())
+
+    def record(self):
+        """Record the fingerprint of the step after it ran successfully."""
+        if self.inputs is not None or self.outputs is not None:
+            fingerprints.record(*self._fingerprint_args())
+
+    def describe(self):
+        """Return what the step would execute, e.g. for dry runs."""
+        return ""
+
 
 class FunctionStep(Step):
     """A step which execution is a function call.
@@ -46,6 +104,12 @@ class FunctionStep(Step):
 
         return response
 
+    def describe(self):
+        """Return the function call."""
+        name = getattr(self.func, "__name__", repr(self.func))
+        args = ", ".join(f"{key}={value!r}" for key, value in self.args.items())
+        return f"{name}({args})"
+
 
 class CommandStep(Step):
     """A step which execution is a command run.
@@ -63,3 +127,121 @@ class CommandStep(Step):
     def execute(self):
         """Execute the function with the given arguments."""
         return run_interactive(self.cmd, self.env, self.skippable, self.log_file)
+
+    def describe(self):
+        """Return the command line."""
+        return shlex.join(str(arg) for arg in self.cmd)
+
+
+class ParallelStep(Step):
+    """A step which execution is running several steps at the same time.
+
+    Is composed of a list of steps, an optional progress function called
+    periodically while they run, and a message (feedback).
+    """
+
+    def __init__(self, steps, progress=None, interval=5, **kwargs):
+        """Constructor."""
+        super().__init__(**kwargs)
+        self.steps = steps
+        self.progress = progress
+        self.interval = interval
+
+    def execute(self):
+        """Execute all the steps and wait for them to finish."""
+        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
+            # run in copies of the current context to keep the active span,
+            # each step in its own log entry, span and profile name
+            futures = [
+                executor.submit(copy_context().run, execute_step, step)
+                for step in self.steps
+            ]
+            pending = futures
+            while pending:
+                _, pending = wait(pending, timeout=self.interval)
+                if self.progress:
+                    self.progress()
+
+        responses = [future.result() for future in futures]
+        for response in responses:
+            if response.status_code > 0:
+                return response
+
+        return ProcessResponse(
+            output=f"{len(responses)} steps finished.",
+            status_code=0,
+            warning=any(response.warning for response in responses),
+        )
+
+    def describe(self):
+        """Return the steps run in parallel, one per line."""
+        return "\n".join(f"| {step.describe()}" for step in self.steps)
+
+
+class ContextStep(Step):
+    """A step which execution is running several steps within a context.
+
+    Is composed of a list of steps run one after the other, the functions
+    entering and exiting the context, and a message (feedback). The exit
+    function is called even if one of the steps fails.
+    """
+
+    def __init__(self, steps, on_enter, on_exit, print_func=None, **kwargs):
+        """Constructor.
+
+        :param on_enter: Function returning a ProcessResponse, called first.
+        :param on_exit: Function returning a ProcessResponse, called last.
+        :param print_func: Function printing the message of every step.
+        """
+        super().__init__(**kwargs)
+        self.steps = steps
+        self.on_enter = on_enter
+        self.on_exit = on_exit
+        self.print_func = print_func
+
+    def _run_steps(self):
+        """Run the steps until one of them fails."""
+        responses = []
+        for step in self.steps:
+            if self.print_func and step.message:
+                self.print_func(step.message)
+            response = execute_step(step)
+            responses.append(response)
+            if response.status_code > 0:
+                break
+        return responses
+
+    def execute(self):
+        """Enter the context, execute the steps, and exit the context."""
+        enter_response = self.on_enter()
+        if enter_response.status_code > 0:
+            return enter_response
+
+        try:
+            responses = self._run_steps()
+        finally:
+            exit_response = self.on_exit()
+
+        for response in responses:
+            if response.status_code > 0:
+                return response
+        if exit_response.status_code > 0:
+            return exit_response
+
+        warnings = [
+            response.error or response.output
+            for response in [enter_response, *responses, exit_response]
+            if response.warning
+        ]
+        return ProcessResponse(
+            output="\n".join(warnings or [exit_response.output or ""]),
+            status_code=0,
+            warning=bool(warnings),
+        )
+
+    def describe(self):
+        """Return the steps run within the context, one per line."""
+        lines = [FunctionStep(self.on_enter).describe()]
+        lines.extend(f"| {step.describe()}" for step in self.steps)
+        lines.append(FunctionStep(self.on_exit).describe())
+        return "\n".join(lines)
@@ -7,10 +7,13 @@
 
 """Invenio module to ease the creation and management of applications."""
 
+from pathlib import Path
 
 from ..commands import Commands
 from ..helpers.cli_config import CLIConfig
+from ..helpers.extraction_cache import extract_messages
 from ..helpers.filesystem import force_symlink
+from ..helpers.process import run_interactive
 from .steps import CommandStep, FunctionStep
 
 
@@ -31,8 +34,13 @@ class TranslationsCommands(Commands):
         msgid_bugs_address,
         copyright_holder,
         add_comments="NOTE",
+        cache=False,
     ):
-        """Extract messages from source code and templates."""
+        """Extract messages from source code and templates.
+
+        :param cache: Only parse the files that changed since the last
+                      extraction, reusing the cached messages of the others.
+        """
         pkg_man = self.cli_config.python_package_manager
         cmd = pkg_man.run_command(
             "pybabel",
@@ -45,6 +53,23 @@ class TranslationsCommands(Commands):
             f"--add-comments={add_comments}",
         )
 
+        if cache:
+            return [
+                FunctionStep(
+                    func=self._cached_extract,
+                    args={
+                        "fallback_cmd": cmd,
+                        "babel_file": babel_file,
+                        "output_file": output_file,
+                        "input_dirs": input_dirs,
+                        "msgid_bugs_address": msgid_bugs_address,
+                        "copyright_holder": copyright_holder,
+                        "add_comments": add_comments,
+                    },
+                    message=f"Extracting i18n messages from {input_dirs} (cached)...",
+                )
+            ]
+
         return [
             CommandStep(
                 cmd=cmd,
@@ -53,6 +78,19 @@ class TranslationsCommands(Commands):
             )
         ]
 
+    def _cached_extract(self, fallback_cmd, **kwargs):
+        """Extract messages through the cache, or fall back to ``pybabel``.
+
+        Extraction methods are resolved in the CLI's environment, if one of
+        them is not available there the extraction runs in the project's
+        virtual environment instead.
+        """
+        cache_path = self.cli_config.get_cache_dir() / "translations-extract.json"
+        try:
+            return extract_messages(cache_path=cache_path, **kwargs)
+        except (ImportError, ValueError):
+            return run_interactive(fallback_cmd, env={"PIPENV_VERBOSITY": "-1"})
+
     def init(self, output_dir, input_file, locale):
         """Initialize a new language catalog."""
         pkg_man = self.cli_config.python_package_manager
@@ -110,12 +148,15 @@ class TranslationsCommands(Commands):
         if fuzzy:
             cmd.append("--use-fuzzy")
 
+        catalogs = sorted(Path(directory).glob("*/LC_MESSAGES/*.po"))
         steps = [
             CommandStep(
                 cmd=cmd,
                 env={"PIPENV_VERBOSITY": "-1"},
                 message="Compiling message catalog...",
                 skippable=True,
+                inputs=catalogs,
+                outputs=[catalog.with_suffix(".mo") for catalog in catalogs],
             ),
         ]
 
@@ -131,6 +172,7 @@ class TranslationsCommands(Commands):
                         "link_name": link_path,
                     },
                     message="Symlinking translations...",
+                    outputs=[link_path],
                 )
             )
 
@@ -7,8 +7,128 @@
 
 """Invenio module to ease the creation and management of applications."""
 
+import os
+import time
+
+import click
+
+from ..errors import InvenioCLIConfigError
 from ..helpers.cli_config import CLIConfig
-from .steps import CommandStep
+from ..helpers.process import ProcessResponse, run_cmd
+from ..helpers.search import (
+    BulkIndexingSettings,
+    IndexingProgress,
+    SearchClient,
+    SearchError,
+    switch_index_generation,
+)
+from .steps import CommandStep, ContextStep, FunctionStep, ParallelStep
+
+REINDEXED_INDICES = {
+    "records": "rdmrecords-records",
+    "communities": "communities-communities",
+}
+"""Indices (without prefix) whose document count is polled to report progress."""
+
+REBUILT_INDICES = (
+    "rdmrecords-",
+    "communities-",
+    "vocabularies-",
+    "affiliations-",
+    "awards-",
+    "funders-",
+    "names-",
+    "subjects-",
+)
+"""Indices (without prefix) filled by the ``rebuild-index`` commands."""
+
+
+def default_index_workers():
+    """Number of bulk indexing processes to run, based on the CPU count."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+class IndexGeneration(object):
+    """The current and the new prefix of the indices rebuilt side by side.
+
+    The prefixes are resolved by the first step, once the database is
+    upgraded, and the environment of the commands creating and filling the
+    new indices is updated in place.
+    """
+
+    def __init__(self, client, resolve_prefix, progress):
+        """Constructor.
+
+        :param client: :class:`SearchClient` instance.
+        :param resolve_prefix: Function returning the current prefix.
+        :param progress: :class:`IndexingProgress` polling the new indices.
+        """
+        self.client = client
+        self.resolve_prefix = resolve_prefix
+        self.progress = progress
+        self.prefix = None
+        self.new_prefix = None
+        self.env = {"PIPENV_VERBOSITY": "-1"}
+
+    @staticmethod
+    def indices(prefix):
+        """Reindexed indices patterns for the given prefix."""
+        return {k: f"{prefix}{v}*" for k, v in REINDEXED_INDICES.items()}
+
+    def resolve(self):
+        """Resolve the current prefix and choose the new one."""
+        try:
+            self.prefix = self.resolve_prefix()
+        except InvenioCLIConfigError as e:
+            return ProcessResponse(error=e.message, status_code=1)
+        self.new_prefix = f"{self.prefix}v{int(time.time())}-"
+        self.env["INVENIO_SEARCH_INDEX_PREFIX"] = self.new_prefix
+        self.progress.indices = self.indices(self.new_prefix)
+        return ProcessResponse(
+            output=f"New indexes prefix: '{self.new_prefix}'.", status_code=0
+        )
+
+    def new_indices(self):
+        """Pattern of the indices of the new generation."""
+        return f"{self.new_prefix}*"
+
+    def snapshot_totals(self):
+        """Remember the document counts of the current indices."""
+        return self.progress.snapshot_totals(indices=self.indices(self.prefix))
+
+    def check_counts(self):
+        """Check that the new indices have (at least) the current documents."""
+        try:
+            self.client.refresh(self.new_indices())
+            counts = {
+                label: (self.client.count(index), self.client.count(new_index))
+                for (label, index), new_index in zip(
+                    self.indices(self.prefix).items(),
+                    self.indices(self.new_prefix).values(),
+                )
+            }
+        except SearchError as e:
+            return ProcessResponse(error=str(e), status_code=1)
+
+        missing = [
+            f"{label}: {new}/{current} docs"
+            for label, (current, new) in counts.items()
+            if new < current
+        ]
+        if missing:
+            return ProcessResponse(
+                error="The new indexes are missing documents ("
+                + ", ".join(missing)
+                + "), the current ones are kept.",
+                status_code=1,
+            )
+        return ProcessResponse(
+            output="The new indexes have all the documents.", status_code=0
+        )
+
+    def switch(self):
+        """Switch the aliases to the new indices."""
+        return switch_index_generation(self.client, self.prefix, self.new_prefix)
 
 
 class UpgradeCommands(object):
@@ -17,8 +137,204 @@ class UpgradeCommands(object):
     def __init__(self, cli_config: CLIConfig):
         """Constructor."""
         self.cli_config = cli_config
+        self._prefix = None
+
+    def _search_client(self):
+        """Client for the configured search cluster."""
+        return SearchClient(
+            self.cli_config.get_search_host(), self.cli_config.get_search_port()
+        )
+
+    def _indices(self, prefix):
+        """Reindexed indices patterns for the given prefix."""
+        return {k: f"{prefix}{v}*" for k, v in REINDEXED_INDICES.items()}
 
-    def upgrade(self, script_path):
+    def _indexing_progress(self, prefix="*"):
+        """Progress reporter polling the reindexed indices."""
+        return IndexingProgress(
+            self._search_client(),
+            self._indices(prefix),
+            print_func=lambda msg: click.secho(msg, fg="yellow"),
+        )
+
+    def _index_prefix(self):
+        """Return the application's search index prefix.
+
+        It is read from the CLI configuration (``search_index_prefix``) and
+        otherwise asked to the application.
+        """
+        prefix = self.cli_config.get_search_index_prefix()
+        if prefix is not None:
+            return prefix
+
+        result = run_cmd(
+            self.cli_config.python_package_manager.run_command(
+                "invenio",
+                "shell",
+                "--no-term-title",
+                "-c",
+                "\"print(app.config.get('SEARCH_INDEX_PREFIX', ''), end='')\"",
+            )
+        )
+        if result.status_code > 0:
+            raise InvenioCLIConfigError(
+                "Could not determine the search index prefix, please set "
+                + "'search_index_prefix' in the .invenio.private file."
+            )
+        return result.output.strip()
+
+    def _resolve_index_prefix(self):
+        """Resolve the search index prefix, once the database is upgraded."""
+        try:
+            self._prefix = self._index_prefix()
+        except InvenioCLIConfigError as e:
+            return ProcessResponse(error=e.message, status_code=1)
+        return ProcessResponse(
+            output=f"Search index prefix: '{self._prefix}'.", status_code=0
+        )
+
+    def _rebuilt_indices(self):
+        """Pattern of the indices filled by the reindex steps."""
+        return ",".join(f"{self._prefix}{name}*" for name in REBUILT_INDICES)
+
+    def _reindex_steps(self, progress=None, index_workers=1, env=None):
+        """Steps to rebuild the records and communities indices.
+
+        The ``rebuild-index`` commands only queue the documents for bulk
+        indexing, the bulk queue being then consumed by ``invenio index run``.
+        When a progress reporter is given, both are started at the same time
+        and the queue is consumed by ``index_workers`` concurrent processes,
+        while the progress is reported.
+        """
+        pkg_man = self.cli_config.python_package_manager
+        # the environment can be updated in place by an earlier step
+        env = env if env is not None else {"PIPENV_VERBOSITY": "-1"}
+        rebuild_steps = [
+            CommandStep(
+                cmd=pkg_man.run_command("invenio", "rdm-records", "rebuild-index"),
+                env=env,
+                message="Rebuilding records and vocabularies indices...",
+            ),
+            CommandStep(
+                cmd=pkg_man.run_command("invenio", "communities", "rebuild-index"),
+                env=env,
+                message="Rebuilding communities indices...",
+            ),
+        ]
+        index_run_cmd = pkg_man.run_command(
+            "invenio", "index", "run", "--raise-on-error"
+        )
+        if not progress:
+            return rebuild_steps + [
+                CommandStep(
+                    cmd=index_run_cmd,
+                    env=env,
+                    message="Indexing the queued documents...",
+                )
+            ]
+
+        return [
+            ParallelStep(
+                steps=rebuild_steps,
+                message="Queuing records, vocabularies and communities for reindexing...",
+            ),
+            ParallelStep(
+                steps=[
+                    CommandStep(cmd=index_run_cmd, env=env)
+                    for _ in range(index_workers)
+                ],
+                progress=progress,
+                message=f"Bulk indexing with {index_workers} processes...",
+            ),
+        ]
+
+    def _bulk_step(self, steps, indices):
+        """Step running the reindex steps with the bulk indexing settings.
+
+        Refreshes are disabled and no replicas are kept while the indices
+        are filled, the settings being restored (and the indices refreshed)
+        afterwards, even if the reindexing fails.
+        """
+        settings = BulkIndexingSettings(self._search_client(), indices)
+        return ContextStep(
+            steps=steps,
+            on_enter=settings.apply,
+            on_exit=settings.restore,
+            print_func=lambda msg: click.secho(msg, fg="green"),
+            message="Applying the bulk indexing settings...",
+        )
+
+    def _check_no_workers(self):
+        """Fail if celery workers are running.
+
+        They would consume the bulk indexing queue, indexing the documents
+        under the current prefix.
+        """
+        result = run_cmd(
+            self.cli_config.python_package_manager.run_command(
+                "celery", "--app", "invenio_app.celery", "inspect", "ping"
+            )
+        )
+        if result.status_code == 0:
+            return ProcessResponse(
+                error="Celery workers are running, please stop them while the "
+                + "new indexes are filled.",
+                status_code=1,
+            )
+        return ProcessResponse(output="No celery worker is running.", status_code=0)
+
+    def _zero_downtime_reindex_steps(self, index_workers):
+        """Steps to rebuild the indices while the current ones keep serving.
+
+        The new indices are created and filled under a versioned prefix, by
+        the ``invenio index run`` processes of the CLI only (the celery
+        workers must be stopped). Once their document counts are checked,
+        the aliases are switched to them atomically and the old indices are
+        dropped.
+        """
+        pkg_man = self.cli_config.python_package_manager
+        generation = IndexGeneration(
+            self._search_client(), self._index_prefix, self._indexing_progress()
+        )
+
+        return [
+            FunctionStep(
+                func=generation.resolve,
+                message="Resolving the search index prefix...",
+            ),
+            FunctionStep(
+                func=self._check_no_workers,
+                message="Checking that no celery worker is running...",
+            ),
+            FunctionStep(
+                func=generation.snapshot_totals,
+                message="Counting documents to reindex...",
+                skippable=True,
+            ),
+            CommandStep(
+                cmd=pkg_man.run_command("invenio", "index", "init"),
+                env=generation.env,
+                message="Creating new indexes...",
+            ),
+            self._bulk_step(
+                self._reindex_steps(
+                    generation.progress, index_workers, env=generation.env
+                ),
+                indices=generation.new_indices,
+            ),
+            FunctionStep(
+                func=generation.check_counts,
+                message="Comparing the document counts...",
+            ),
+            FunctionStep(
+                func=generation.switch,
+                message="Switching aliases to the new indexes...",
+            ),
+        ]
+
+    def upgrade(
+        self, script_path, parallel=True, index_workers=None, zero_downtime=False
+    ):
         """Steps to perform an upgrade of the invenio instance.
 
         First, and alembic upgrade is launched to allow alembic to migrate the
@@ -26,6 +342,12 @@ class UpgradeCommands(object):
         Then, the custom script is executed.
         Last, the search indices are destroyed, initialized and rebuilt.
         It is a class method since it does not require any configuration.
+
+        :param parallel: Rebuild the independent indices at the same time.
+        :param index_workers: Number of concurrent bulk indexing processes.
+        :param zero_downtime: Build new indices next to the current ones and
+                              switch to them once they are rebuilt, instead of
+                              destroying them first.
         """
         pkg_man = self.cli_config.python_package_manager
         alembic_cmd = pkg_man.run_command("invenio", "alembic", "upgrade")
@@ -33,13 +355,8 @@ class UpgradeCommands(object):
             "invenio", "index", "destroy", "--yes-i-know"
         )
         init_index_cmd = pkg_man.run_command("invenio", "index", "init")
-        rec_rebuild_index_cmd = pkg_man.run_command(
-            "invenio", "rdm-records", "rebuild-index"
-        )
-        comm_rebuild_index_cmd = pkg_man.run_command(
-            "invenio", "communities", "rebuild-index"
-        )
         script_cmd = pkg_man.run_command("invenio", "shell", script_path)
+        index_workers = index_workers or default_index_workers()
 
         steps = [
             CommandStep(
@@ -52,26 +369,44 @@ class UpgradeCommands(object):
                 env={"PIPENV_VERBOSITY": "-1"},
                 message="Executing data upgrade script...",
             ),
-            CommandStep(
-                cmd=destroy_index_cmd,
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Destroying indexes...",
-            ),
-            CommandStep(
-                cmd=init_index_cmd,
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Creating new indexes...",
-            ),
-            CommandStep(
-                cmd=rec_rebuild_index_cmd,
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Rebuilding records and vocabularies indices...",
-            ),
-            CommandStep(
-                cmd=comm_rebuild_index_cmd,
-                env={"PIPENV_VERBOSITY": "-1"},
-                message="Rebuilding communities indices...",
-            ),
         ]
 
+        if zero_downtime:
+            steps.extend(self._zero_downtime_reindex_steps(index_workers))
+            return steps
+
+        progress = None
+        if parallel:
+            progress = self._indexing_progress()
+            steps.append(
+                FunctionStep(
+                    func=progress.snapshot_totals,
+                    message="Counting documents to reindex...",
+                    skippable=True,
+                )
+            )
+
+        steps.extend(
+            [
+                FunctionStep(
+                    func=self._resolve_index_prefix,
+                    message="Resolving the search index prefix...",
+                ),
+                CommandStep(
+                    cmd=destroy_index_cmd,
+                    env={"PIPENV_VERBOSITY": "-1"},
+                    message="Destroying indexes...",
+                ),
+                CommandStep(
+                    cmd=init_index_cmd,
+                    env={"PIPENV_VERBOSITY": "-1"},
+                    message="Creating new indexes...",
+                ),
+                self._bulk_step(
+                    self._reindex_steps(progress, index_workers),
+                    indices=self._rebuilt_indices,
+                ),
+            ]
+        )
+
         return steps
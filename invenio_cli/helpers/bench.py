@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI HTTP benchmark helper module."""
+
+import asyncio
+import itertools
+import ssl
+import time
+
+
+def unverified_ssl_context():
+    """SSL context accepting the self-signed development certificate."""
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def percentile(values, pct):
+    """Return the ``pct`` percentile of sorted ``values`` (linear)."""
+    if not values:
+        return None
+    rank = (len(values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+class HTTPConnection(object):
+    """Minimal asyncio HTTP/1.1 client connection with keep-alive."""
+
+    def __init__(self, host, port, ssl_context=None, timeout=30):
+        """Constructor."""
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+
+    async def _connect(self):
+        """Open the connection if needed."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl_context
+            )
+
+    def close(self):
+        """Close the connection."""
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def _read_headers(self):
+        """Read a status line and its headers, return the status and headers."""
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by the server.")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return status, headers
+
+    async def _read_body(self, headers, status, method):
+        """Read the response body, return its size and whether to close.
+
+        The responses to HEAD requests, 1xx, 204 and 304 responses have no
+        body, whatever their headers say (RFC 9112, section 6.3).
+        """
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if method == "HEAD" or status < 200 or status in (204, 304):
+            return 0, not keep_alive
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            size = 0
+            while True:
+                chunk_size = int((await self.reader.readline()).split(b";")[0], 16)
+                if chunk_size == 0:
+                    # trailers, up to the empty line
+                    while (await self.reader.readline()) not in (b"\r\n", b""):
+                        pass
+                    break
+                await self.reader.readexactly(chunk_size + 2)
+                size += chunk_size
+        elif "content-length" in headers:
+            size = int(headers["content-length"])
+            await self.reader.readexactly(size)
+        else:
+            size = len(await self.reader.read())
+            return size, True
+        return size, not keep_alive
+
+    async def _request(self, method, path, headers):
+        """Send a request and read the response."""
+        await self._connect()
+        request = f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+        for name, value in headers.items():
+            request += f"{name}: {value}\r\n"
+        self.writer.write((request + "\r\n").encode("latin-1"))
+        await self.writer.drain()
+
+        status, response_headers = await self._read_headers()
+        # interim responses, e.g. 103 Early Hints, precede the final one
+        while 100 <= status < 200 and status != 101:
+            status, response_headers = await self._read_headers()
+
+        size, close = await self._read_body(response_headers, status, method)
+        if close:
+            self.close()
+        return status, size
+
+    async def request(self, method, path, headers=None):
+        """Perform a request.
+
+        :returns: A ``(status, body size)`` tuple.
+        """
+        return await asyncio.wait_for(
+            self._request(method, path, headers or {}), self.timeout
+        )
+
+    async def get(self, path, headers=None):
+        """Perform a GET request.
+
+        :returns: A ``(status, body size)`` tuple.
+        """
+        return await self.request("GET", path, headers)
+
+
+class EndpointStats(object):
+    """Latencies and outcomes of the requests to one endpoint."""
+
+    def __init__(self):
+        """Constructor."""
+        self.requests = 0
+        self.latencies = []
+        self.statuses = {}
+        self.errors = 0
+        self.bytes = 0
+
+    def add(self, latency, status=None, size=0):
+        """Record a request, ``status`` being ``None`` on connection errors."""
+        self.requests += 1
+        if status is None or status >= 400:
+            self.errors += 1
+        if status is not None:
+            self.latencies.append(latency)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes += size
+
+    def merge(self, other):
+        """Add the requests of another instance to this one."""
+        self.requests += other.requests
+        self.latencies.extend(other.latencies)
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.errors += other.errors
+        self.bytes += other.bytes
+
+    def summary(self, elapsed):
+        """Return the throughput and latency percentiles as a dict."""
+        latencies = sorted(self.latencies)
+
+        def _ms(value):
+            return round(value * 1000, 2) if value is not None else None
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "throughput": round(self.requests / elapsed, 2) if elapsed else 0,
+            "bytes": self.bytes,
+            "latency_ms": {
+                "mean": _ms(sum(latencies) / len(latencies)) if latencies else None,
+                "p50": _ms(percentile(latencies, 50)),
+                "p95": _ms(percentile(latencies, 95)),
+                "p99": _ms(percentile(latencies, 99)),
+                "max": _ms(latencies[-1] if latencies else None),
+            },
+        }
+
+
+async def _worker(host, port, ssl_context, timeout, schedule, stats, deadline):
+    """Request the scheduled endpoints over one connection until done."""
+    connection = HTTPConnection(host, port, ssl_context, timeout)
+    headers = {"Accept-Encoding": "identity"}
+    try:
+        for name, path, accept in schedule:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            start = time.perf_counter()
+            try:
+                status, size = await connection.get(path, {**headers, **accept})
+            except (OSError, EOFError, ValueError, IndexError, asyncio.TimeoutError):
+                connection.close()
+                stats[name].add(time.perf_counter() - start)
+                continue
+            stats[name].add(time.perf_counter() - start, status, size)
+    finally:
+        connection.close()
+
+
+async def _run(host, port, endpoints, concurrency, duration, requests, **kwargs):
+    """Run the workers and return the stats per endpoint and elapsed time."""
+    stats = {name: EndpointStats() for name in endpoints}
+    cycle = itertools.cycle(
+        (name, path, {"Accept": accept}) for name, (path, accept) in endpoints.items()
+    )
+    # workers share the iterator, so that the endpoints are evenly requested
+    schedule = itertools.islice(cycle, requests) if requests else cycle
+    deadline = time.monotonic() + duration if duration else None
+
+    start = time.monotonic()
+    await asyncio.gather(
+        *(
+            _worker(
+                host, port, schedule=schedule, stats=stats, deadline=deadline, **kwargs
+            )
+            for _ in range(concurrency)
+        )
+    )
+    return stats, time.monotonic() - start
+
+
+def run_benchmark(
+    host,
+    port,
+    endpoints,
+    concurrency=10,
+    duration=None,
+    requests=None,
+    scheme="https",
+    timeout=30,
+):
+    """Benchmark endpoints of a running instance with concurrent requests.
+
+    The endpoints are requested in turn by ``concurrency`` keep-alive
+    connections, for ``duration`` seconds or until ``requests`` requests
+    were sent.
+
+    :param endpoints: Dict of name to a ``(path, accept mimetype)`` tuple.
+    :returns: A dict with the overall and per endpoint statistics.
+    """
+    if not duration and not requests:
+        raise ValueError("Either a duration or a number of requests is needed.")
+
+    ssl_context = unverified_ssl_context() if scheme == "https" else None
+    stats, elapsed = asyncio.run(
+        _run(
+            host,
+            port,
+            endpoints,
+            concurrency,
+            duration,
+            requests,
+            ssl_context=ssl_context,
+            timeout=timeout,
+        )
+    )
+
+    total = EndpointStats()
+    for endpoint_stats in stats.values():
+        total.merge(endpoint_stats)
+
+    return {
+        "elapsed": round(elapsed, 3),
+        "concurrency": concurrency,
+        "total": total.summary(elapsed),
+        "endpoints": {
+            name: {"path": endpoints[name][0], **s.summary(elapsed)}
+            for name, s in stats.items()
+        },
+    }
@@ -39,14 +39,17 @@ class CLIConfig(object):
 
     CONFIG_FILENAME = ".invenio"
     PRIVATE_CONFIG_FILENAME = ".invenio.private"
+    CACHE_DIRNAME = ".invenio.cache"
     CLI_SECTION = "cli"
     COOKIECUTTER_SECTION = "cookiecutter"
     FILES_SECTION = "files"
 
-    def __init__(self, project_dir="./"):
+    def __init__(self, project_dir="./", write_private=True):
         """Constructor.
 
         :param config_dir: Path to general cli config file.
+        :param write_private: Write the per machine config file if missing,
+                              otherwise its values are the defaults.
         """
         self.project_path = Path(project_dir)
         self.config_path = self.project_path / self.CONFIG_FILENAME
@@ -66,6 +69,9 @@ class CLIConfig(object):
             with open(self.private_config_path) as cfg_file:
                 self.private_config.read_file(cfg_file)
         except FileNotFoundError:
+            if not write_private:
+                self.private_config = CLIConfig._default_private_config()
+                return
             CLIConfig._write_private_config(Path(project_dir))
             with open(self.private_config_path) as cfg_file:
                 self.private_config.read_file(cfg_file)
@@ -74,15 +80,23 @@ class CLIConfig(object):
     def python_package_manager(self) -> PythonPackageManager:
         """Get python packages manager."""
         manager_name = self.config[CLIConfig.CLI_SECTION].get("python_package_manager")
+        # commands are run directly from the environment unless disabled
+        kwargs = {}
+        if self.private_config[CLIConfig.CLI_SECTION].getboolean("venv_cache", True):
+            kwargs = {
+                "project_dir": self.project_path,
+                "cache_dir": self.get_cache_dir(),
+            }
+
         if manager_name == Pipenv.name:
-            return Pipenv()
+            return Pipenv(**kwargs)
         elif manager_name == UV.name:
-            return UV()
+            return UV(**kwargs)
 
         if (self.project_path / "Pipfile").is_file():
-            return Pipenv()
+            return Pipenv(**kwargs)
         elif (self.project_path / "pyproject.toml").is_file():
-            return UV()
+            return UV(**kwargs)
         else:
             raise RuntimeError(
                 "Could not determine the Python package manager, please configure it."
@@ -105,6 +119,18 @@ class CLIConfig(object):
         """Returns path to project directory."""
         return self.config_path.parent.resolve()
 
+    def get_cache_dir(self):
+        """Returns path to the (not version controlled) CLI cache directory."""
+        return self.get_project_dir() / self.CACHE_DIRNAME
+
+    def get_compose_override_files(self):
+        """Returns the compose files applied on top of the project ones.
+
+        They are the ``.yml`` files of the ``compose`` folder of the cache
+        directory, applied in alphabetical order.
+        """
+        return sorted((self.get_cache_dir() / "compose").glob("*.yml"))
+
     def get_instance_path(self, throw=True):
         """Returns path to application instance directory.
 
@@ -116,11 +142,25 @@ class CLIConfig(object):
         elif throw:
             raise InvenioCLIConfigError("Accessing unset 'instance_path'")
 
-    def update_instance_path(self, new_instance_path):
-        """Updates path to application instance directory."""
+    def get_instance_path_key(self):
+        """Returns what the instance path was computed from, if cached."""
+        return self.private_config[CLIConfig.CLI_SECTION].get("instance_path_key")
+
+    def update_instance_path(self, new_instance_path, key=None):
+        """Updates path to application instance directory.
+
+        :param key: What the path was computed from (e.g. the virtualenv),
+                    the path is cached as long as it does not change.
+        """
         self.private_config[CLIConfig.CLI_SECTION]["instance_path"] = str(
             new_instance_path
         )
+        if key:
+            self.private_config[CLIConfig.CLI_SECTION]["instance_path_key"] = key
+        else:
+            self.private_config.remove_option(
+                CLIConfig.CLI_SECTION, "instance_path_key"
+            )
 
         with open(self.private_config_path, "w") as configfile:
             self.private_config.write(configfile)
@@ -146,6 +186,22 @@ class CLIConfig(object):
             status_code=0,
         )
 
+    def get_services_profile(self):
+        """Returns the services profile (fast, durable), ``None`` if unset."""
+        return self.private_config[CLIConfig.CLI_SECTION].get("services_profile")
+
+    def update_services_profile(self, profile):
+        """Updates the services profile."""
+        self.private_config[CLIConfig.CLI_SECTION]["services_profile"] = profile
+
+        with open(self.private_config_path, "w") as configfile:
+            self.private_config.write(configfile)
+
+        return ProcessResponse(
+            output=f"Services profile updated (new value {profile}).",
+            status_code=0,
+        )
+
     def get_project_shortname(self):
         """Returns the project's shortname."""
         return self.config[CLIConfig.COOKIECUTTER_SECTION]["project_shortname"]
@@ -161,6 +217,16 @@ class CLIConfig(object):
             "localhost",
         )
 
+    def get_search_index_prefix(self):
+        """Returns the search index prefix, if configured."""
+        return self.private_config[CLIConfig.CLI_SECTION].get("search_index_prefix")
+
+    def get_registry_mirror(self):
+        """Returns the registry mirror of the Docker Hub images, if any."""
+        return self.private_config[CLIConfig.CLI_SECTION].get(
+            "registry_mirror", self.config[CLIConfig.CLI_SECTION].get("registry_mirror")
+        )
+
     def get_web_port(self):
         """Returns web port."""
         return self.private_config[CLIConfig.CLI_SECTION].get("web_port", "5000")
@@ -169,6 +235,31 @@ class CLIConfig(object):
         """Returns web host."""
         return self.private_config[CLIConfig.CLI_SECTION].get("web_host", "127.0.0.1")
 
+    def get_log_file(self):
+        """Returns the path of the CLI log file, ``None`` if disabled.
+
+        The ``logfile`` is relative to the project directory, including when
+        it starts with a ``/`` (as written by ``invenio-cli init``).
+        """
+        logfile = self.private_config[CLIConfig.CLI_SECTION].get(
+            "logfile", self.config[CLIConfig.CLI_SECTION].get("logfile")
+        )
+        if not logfile:
+            return None
+        return self.get_project_dir() / logfile.lstrip("/")
+
+    def get_log_max_bytes(self):
+        """Returns the size after which the CLI log file is rotated."""
+        return self.private_config.getint(
+            CLIConfig.CLI_SECTION, "log_max_bytes", fallback=10 * 1024 * 1024
+        )
+
+    def get_log_backup_count(self):
+        """Returns the number of rotated CLI log files to keep."""
+        return self.private_config.getint(
+            CLIConfig.CLI_SECTION, "log_backup_count", fallback=5
+        )
+
     def get_db_type(self):
         """Returns the database type (mysql, postgresql)."""
         return self.config[CLIConfig.COOKIECUTTER_SECTION]["database"]
@@ -201,11 +292,17 @@ class CLIConfig(object):
         return self.config[CLIConfig.COOKIECUTTER_SECTION]["author_name"]
 
     @classmethod
-    def _write_private_config(cls, project_dir):
-        """Write per-instance config file."""
+    def _default_private_config(cls):
+        """Return the initial per-instance config."""
         config_parser = ConfigParser()
         config_parser[cls.CLI_SECTION] = {}
         config_parser[cls.CLI_SECTION]["services_setup"] = str(False)
+        return config_parser
+
+    @classmethod
+    def _write_private_config(cls, project_dir):
+        """Write per-instance config file."""
+        config_parser = cls._default_private_config()
         private_config_path = project_dir / cls.PRIVATE_CONFIG_FILENAME
         with open(private_config_path, "w") as configfile:
             config_parser.write(configfile)
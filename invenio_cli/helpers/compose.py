@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI Docker Compose files helper module."""
+
+import json
+import os
+import zlib
+
+from .process import run_cmd
+
+PORT_RANGE = (20000, 60000)
+"""Host ports given to the services of additional compose projects."""
+
+PROFILES = ("fast", "durable")
+"""Services profiles: ``fast`` trades durability for speed, ``durable`` is
+the one of the project's compose files."""
+
+SEARCH_HEAP_RANGE = (512, 4096)
+"""Bounds, in MB, of the heap of the search service."""
+
+
+def compose_config(compose_files):
+    """Return the configuration of a compose project, as resolved by compose.
+
+    :param compose_files: The compose files, the main one first.
+    """
+    command = ["docker", "compose"]
+    for compose_file in compose_files:
+        command.extend(["--file", str(compose_file)])
+    result = run_cmd(command + ["config", "--format", "json"])
+    if result.status_code != 0:
+        raise RuntimeError(f"Unable to read the compose configuration: {result.error}")
+    return json.loads(result.output)
+
+
+def published_ports(compose_files):
+    """Return the ports published by the services of a compose project.
+
+    :param compose_files: The compose files, the main one first.
+    :returns: A dict of service name to the list of published container
+              ports, e.g. ``{"db": [5432]}``.
+    """
+    services = compose_config(compose_files).get("services", {})
+    ports = {}
+    for name, service in sorted(services.items()):
+        targets = [int(port["target"]) for port in service.get("ports", [])]
+        if targets:
+            ports[name] = sorted(set(targets))
+    return ports
+
+
+def service_environment(compose_files, service):
+    """Return the environment variables of a service of a compose project.
+
+    :param compose_files: The compose files, the main one first.
+    """
+    services = compose_config(compose_files).get("services", {})
+    environment = services.get(service, {}).get("environment") or {}
+    return {key: value for key, value in environment.items() if value is not None}
+
+
+def service_images(compose_files):
+    """Return the images pulled by a compose project, i.e. not built.
+
+    :param compose_files: The compose files, the main one first.
+    """
+    services = compose_config(compose_files).get("services", {})
+    return sorted(
+        {
+            service["image"]
+            for service in services.values()
+            if service.get("image") and not service.get("build")
+        }
+    )
+
+
+def project_images(compose_files):
+    """Return all the images of a compose project, pulled and built.
+
+    The built images without a name are named by compose after the project
+    and the service, e.g. ``my-site-web-ui``.
+
+    :param compose_files: The compose files, the main one first.
+    """
+    config = compose_config(compose_files)
+    return sorted(
+        {
+            service.get("image") or f"{config['name']}-{name}"
+            for name, service in config.get("services", {}).items()
+            if service.get("image") or service.get("build")
+        }
+    )
+
+
+def built_services(compose_files):
+    """Return the services of a compose project which are built.
+
+    :param compose_files: The compose files, the main one first.
+    :returns: A dict of service name to a dict with the ``image`` of the
+              service and its ``build`` configuration.
+    """
+    config = compose_config(compose_files)
+    return {
+        name: {
+            "image": service.get("image") or f"{config['name']}-{name}",
+            "build": service["build"],
+        }
+        for name, service in sorted(config.get("services", {}).items())
+        if service.get("build")
+    }
+
+
+def derive_ports(project_name, ports, taken=(), port_range=PORT_RANGE):
+    """Derive stable host ports for the services of a compose project.
+
+    The ports are a contiguous block whose position in ``port_range`` is
+    given by the CRC32 of the project name, so that a project always gets
+    the same ports. Blocks overlapping ``taken`` ports are skipped.
+
+    :param ports: Dict of service name to container ports, see
+                  :func:`published_ports`.
+    :param taken: Host ports that cannot be used.
+    :returns: A dict of service name to a dict of container port (as a
+              string, like in JSON) to host port.
+    """
+    targets = [
+        (name, port) for name, service_ports in ports.items() for port in service_ports
+    ]
+    size = max(len(targets), 1)
+    slots = (port_range[1] - port_range[0]) // size
+    taken = set(taken)
+
+    slot = zlib.crc32(project_name.encode("utf-8")) % slots
+    for _ in range(slots):
+        base = port_range[0] + slot * size
+        block = range(base, base + len(targets))
+        if taken.isdisjoint(block):
+            derived = {}
+            for (name, port), host_port in zip(targets, block):
+                derived.setdefault(name, {})[str(port)] = host_port
+            return derived
+        slot = (slot + 1) % slots
+
+    raise RuntimeError("No free ports left in the port range.")
+
+
+def write_ports_override(path, ports):
+    """Write a compose file publishing the services on the given ports.
+
+    The ports of the main compose files are replaced (``!override``
+    requires Docker Compose 2.24.4 or newer).
+
+    :param ports: Dict of service name to a dict of container to host port.
+    """
+    lines = ["services:"]
+    for name, mapping in sorted(ports.items()):
+        lines.append(f"  {json.dumps(name)}:")
+        lines.append("    ports: !override")
+        for port, host_port in sorted(mapping.items(), key=lambda i: int(i[0])):
+            lines.append(f'      - "{host_port}:{port}"')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
+
+
+def write_search_snapshots_override(path, host_dir, container_dir, service="search"):
+    """Write a compose file mounting a snapshot repository in the search service.
+
+    :param host_dir: Directory of the host holding the snapshots.
+    :param container_dir: Path of the directory in the container, allowed
+                          as snapshot repository location (``path.repo``).
+    """
+    lines = [
+        "services:",
+        f"  {json.dumps(service)}:",
+        "    environment:",
+        f"      - {json.dumps(f'path.repo={container_dir}')}",
+        "    volumes:",
+        f"      - {json.dumps(f'{host_dir}:{container_dir}')}",
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
+
+
+def write_build_override(path, labels, layer_cache_dir=None):
+    """Write a compose file labelling the built images and caching their layers.
+
+    :param labels: Dict of service name to the labels of its image.
+    :param layer_cache_dir: Directory of the BuildKit local layer cache,
+                            one subdirectory per service.
+    """
+    lines = ["services:"]
+    for service, service_labels in sorted(labels.items()):
+        lines.extend([f"  {json.dumps(service)}:", "    build:", "      labels:"])
+        lines.extend(
+            f"        {json.dumps(key)}: {json.dumps(value)}"
+            for key, value in sorted(service_labels.items())
+        )
+        if layer_cache_dir:
+            cache_dir = os.path.join(layer_cache_dir, service)
+            if os.path.exists(os.path.join(cache_dir, "index.json")):
+                lines.extend(
+                    [
+                        "      cache_from:",
+                        f"        - {json.dumps(f'type=local,src={cache_dir}')}",
+                    ]
+                )
+            lines.extend(
+                [
+                    "      cache_to:",
+                    f"        - {json.dumps(f'type=local,dest={cache_dir},mode=max')}",
+                ]
+            )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
+
+
+def host_memory():
+    """Return the physical memory of the host in bytes, ``None`` if unknown."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def search_heap_size(memory=None, heap_range=SEARCH_HEAP_RANGE):
+    """Return the heap size (in MB) of the search service.
+
+    It is a quarter of the host memory, within ``heap_range``.
+    """
+    memory = memory or host_memory()
+    if not memory:
+        return heap_range[0]
+    heap = memory // 4 // 2**20
+    return max(heap_range[0], min(heap, heap_range[1]))
+
+
+def write_fast_profile_override(path, db_type, search_type, heap_size):
+    """Write a compose file trading the durability of the services for speed.
+
+    The database does not flush to disk and keeps its data in memory, the
+    cache does not persist, and the search heap is sized to ``heap_size``,
+    the memory limit of the search container being raised to twice the heap
+    (off-heap memory, e.g. for Lucene, is about as large).
+
+    :param db_type: ``postgresql`` or ``mysql``.
+    :param search_type: E.g. ``opensearch2`` or ``elasticsearch7``.
+    :param heap_size: Heap of the search service, in MB.
+    """
+    if db_type == "mysql":
+        db_command = [
+            "--innodb-flush-log-at-trx-commit=0",
+            "--innodb-doublewrite=0",
+            "--sync-binlog=0",
+        ]
+        db_data = "/var/lib/mysql"
+    else:
+        db_command = [
+            "postgres",
+            "-c",
+            "fsync=off",
+            "-c",
+            "synchronous_commit=off",
+            "-c",
+            "full_page_writes=off",
+        ]
+        db_data = "/var/lib/postgresql/data"
+    if search_type.startswith("opensearch"):
+        java_opts = "OPENSEARCH_JAVA_OPTS"
+    else:
+        java_opts = "ES_JAVA_OPTS"
+
+    lines = [
+        "services:",
+        '  "db":',
+        f"    command: {json.dumps(db_command)}",
+        "    tmpfs:",
+        f"      - {json.dumps(db_data)}",
+        '  "cache":',
+        '    command: ["redis-server", "--save", "", "--appendonly", "no"]',
+        '  "search":',
+        "    environment:",
+        f"      - {json.dumps(f'{java_opts}=-Xms{heap_size}m -Xmx{heap_size}m')}",
+        f'    mem_limit: "{2 * heap_size}m"',
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
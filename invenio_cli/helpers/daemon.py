@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI warm application daemon helper module.
+
+The daemon keeps the application of the project created in a process of
+its virtualenv, and runs the ``invenio`` commands in forks of it, which
+saves importing the extensions and creating the application every time.
+See :mod:`invenio_cli.helpers.daemon_script`.
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).with_name("daemon_script.py")
+
+SOCKET_FILENAME = "daemon.sock"
+PID_FILENAME = "daemon.pid"
+LOG_FILENAME = "daemon.log"
+
+COLD_COMMANDS = {"run", "celery"}
+"""``invenio`` commands managing their own processes, never run warm."""
+
+
+def socket_path(cache_dir):
+    """Path of the socket of the daemon of a project."""
+    return Path(cache_dir) / SOCKET_FILENAME
+
+
+def read_pid(cache_dir):
+    """Return the pid of the running daemon, ``None`` if it is not running."""
+    try:
+        pid = int((Path(cache_dir) / PID_FILENAME).read_text())
+        os.kill(pid, 0)
+    except (OSError, ValueError):
+        return None
+    return pid
+
+
+def is_running(cache_dir):
+    """Whether the daemon of a project is running."""
+    return read_pid(cache_dir) is not None and socket_path(cache_dir).exists()
+
+
+def serve_command(cache_dir, watched):
+    """Return the arguments of the daemon, to run with the project's Python.
+
+    :param watched: Files whose changes make the daemon reload.
+    """
+    return [str(SCRIPT), "serve", str(socket_path(cache_dir)), *map(str, watched)]
+
+
+def attach_command(cache_dir, command, fallback=None):
+    """Return the command running an ``invenio`` command through the daemon.
+
+    :param command: The ``invenio`` command, in array form.
+    :param fallback: The command run instead if the daemon does not answer,
+                     in array form.
+    """
+    return [
+        sys.executable,
+        str(SCRIPT),
+        "attach",
+        str(socket_path(cache_dir)),
+        json.dumps(fallback or []),
+        *command,
+    ]
+
+
+def warm_command(cache_dir, command, fallback):
+    """Return the command run through the daemon if it can be, else ``None``."""
+    # the standard streams are passed with socket.send_fds, Python >= 3.9
+    if not hasattr(socket, "send_fds"):
+        return None
+    if not cache_dir or not command or command[0] != "invenio":
+        return None
+    if len(command) > 1 and command[1] in COLD_COMMANDS:
+        return None
+    if not socket_path(cache_dir).exists():
+        return None
+    return attach_command(cache_dir, command, fallback)
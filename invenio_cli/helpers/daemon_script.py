@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI warm application daemon and client.
+
+This script only depends on the standard library: it is run as a file,
+without importing the CLI, for the client to start fast, and the server
+is run by the Python of the project's virtualenv.
+
+``python daemon_script.py serve SOCKET [WATCHED_FILE...]`` imports the
+``invenio`` command and creates the application once, then forks a child
+per request, which runs the requested ``invenio`` command with the
+standard streams of the client, received along with the request. The
+server execs itself again when a watched file, the virtualenv's packages
+or the modules of its editable packages change, keeping its listening
+socket so that no request is lost.
+
+``python daemon_script.py attach SOCKET FALLBACK ARG...`` runs a command
+through the server, or the ``FALLBACK`` command (a JSON list) if the
+server does not answer.
+"""
+
+import io
+import json
+import os
+import signal
+import site
+import socket
+import sys
+import time
+from glob import glob
+from importlib.metadata import entry_points
+from urllib.parse import unquote, urlparse
+
+SOCKET_FD_VARIABLE = "INVENIO_CLI_DAEMON_FD"
+"""Environment variable passing the listening socket across reloads."""
+
+APP_VARIABLES = ("INVENIO_", "FLASK_")
+"""Prefixes of the environment variables the application is created from."""
+
+
+def load_invenio_command():
+    """Return the click group of the ``invenio`` console script."""
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        eps = eps.select(group="console_scripts")
+    else:
+        eps = eps.get("console_scripts", [])
+    return next(ep for ep in eps if ep.name == "invenio").load()
+
+
+def app_environment(environ):
+    """Return the environment variables the application is created from."""
+    return {k: v for k, v in environ.items() if k.startswith(APP_VARIABLES)}
+
+
+def editable_sources(site_dirs):
+    """Return the source directories of the packages installed as editable.
+
+    They are read from the ``direct_url.json`` of the distributions and from
+    the paths listed in the ``.pth`` files of the site directories.
+    """
+    sources = set()
+    for site_dir in map(os.path.abspath, site_dirs):
+        for url_path in glob(os.path.join(site_dir, "*.dist-info", "direct_url.json")):
+            try:
+                with open(url_path) as url_file:
+                    direct_url = json.load(url_file)
+            except (OSError, ValueError):
+                continue
+            url = urlparse(direct_url.get("url", ""))
+            if direct_url.get("dir_info", {}).get("editable") and url.scheme == "file":
+                sources.add(os.path.normpath(unquote(url.path)))
+        for pth_path in glob(os.path.join(site_dir, "*.pth")):
+            try:
+                with open(pth_path) as pth_file:
+                    lines = pth_file.read().splitlines()
+            except OSError:
+                continue
+            for line in lines:
+                line = line.strip()
+                if not line or line.startswith(("#", "import")):
+                    continue
+                path = os.path.normpath(os.path.join(site_dir, line))
+                if os.path.isdir(path) and not path.startswith(site_dir + os.sep):
+                    sources.add(path)
+    # e.g. the ``src`` directory of a project, along with the project
+    return sorted(
+        source
+        for source in sources
+        if not any(source.startswith(other + os.sep) for other in sources)
+    )
+
+
+def watched_paths(paths):
+    """Return the watched files, along with the virtualenv's packages.
+
+    The site directories and the ``RECORD`` of the distributions change
+    when packages are installed, upgraded or removed, the modules of the
+    packages installed as editable when their sources are edited.
+    """
+    site_dirs = site.getsitepackages()
+    watched = [*paths, *site_dirs]
+    for site_dir in site_dirs:
+        watched.extend(sorted(glob(os.path.join(site_dir, "*.dist-info", "RECORD"))))
+    for source in editable_sources(site_dirs):
+        for dirpath, dirnames, filenames in os.walk(source):
+            dirnames[:] = sorted(
+                name
+                for name in dirnames
+                if not name.startswith(".")
+                and name not in ("node_modules", "__pycache__")
+            )
+            watched.extend(
+                os.path.join(dirpath, name)
+                for name in sorted(filenames)
+                if name.endswith(".py")
+            )
+    return watched
+
+
+def watched_mtimes(paths):
+    """Return the modification times of the watched paths."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def listening_socket(path):
+    """Return the listening socket, inherited from before a reload if any."""
+    fd = os.environ.pop(SOCKET_FD_VARIABLE, None)
+    if fd is not None:
+        return socket.socket(fileno=int(fd))
+
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(16)
+    return server
+
+
+def receive_request(conn):
+    """Return the request and the standard streams' file descriptors."""
+    data, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+    try:
+        while not data.endswith(b"\n"):
+            chunk = conn.recv(65536)
+            if not chunk:
+                raise ConnectionError("Incomplete request.")
+            data += chunk
+        return json.loads(data), fds
+    except (OSError, ValueError):
+        for fd in fds:
+            os.close(fd)
+        raise
+
+
+def _reopen_streams(fds):
+    """Make the client's streams the standard streams of the process."""
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    sys.stdin = io.TextIOWrapper(io.FileIO(0, "r", closefd=False))
+    sys.stdout = io.TextIOWrapper(
+        io.FileIO(1, "w", closefd=False), line_buffering=os.isatty(1)
+    )
+    sys.stderr = io.TextIOWrapper(io.FileIO(2, "w", closefd=False), line_buffering=True)
+
+
+def run_request(conn, request, fds, invenio, script_info, environ):
+    """Run the requested command in the current (forked) process."""
+    from flask.cli import ScriptInfo
+
+    for signum in (signal.SIGCHLD, signal.SIGTERM, signal.SIGHUP):
+        signal.signal(signum, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    conn.sendall(json.dumps({"pid": os.getpid()}).encode("utf-8") + b"\n")
+
+    _reopen_streams(fds)
+    os.chdir(request["cwd"])
+    env = {**environ, **request["env"]}
+    env["VIRTUAL_ENV"] = sys.prefix
+    env["PATH"] = os.pathsep.join(
+        [os.path.join(sys.prefix, "bin"), request["env"].get("PATH", "")]
+    )
+    os.environ.clear()
+    os.environ.update(env)
+    if app_environment(env) != app_environment(environ):
+        # the warm application was created with another configuration
+        script_info = ScriptInfo(create_app=invenio.create_app)
+
+    sys.argv = list(request["argv"])
+    try:
+        invenio.main(args=sys.argv[1:], prog_name="invenio", obj=script_info)
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except OSError:
+                pass
+
+    try:
+        conn.sendall(json.dumps({"exit": exit_code}).encode("utf-8") + b"\n")
+    finally:
+        os._exit(exit_code)
+
+
+def serve(socket_path, watched):
+    """Create the application and serve the requests until stopped."""
+    from flask.cli import ScriptInfo
+
+    start = time.monotonic()
+    invenio = load_invenio_command()
+    script_info = ScriptInfo(create_app=invenio.create_app)
+    script_info.load_app()
+    environ = dict(os.environ)
+    watched = watched_paths(watched)
+    mtimes = watched_mtimes(watched)
+
+    server = listening_socket(socket_path)
+    server.settimeout(1)
+    pid_path = os.path.splitext(socket_path)[0] + ".pid"
+    with open(pid_path, "w") as pid_file:
+        pid_file.write(str(os.getpid()))
+
+    def stop(signum, frame):
+        server.close()
+        for path in (socket_path, pid_path):
+            if os.path.exists(path):
+                os.unlink(path)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # no zombie children
+    print(f"Ready in {time.monotonic() - start:.1f}s.", flush=True)
+
+    while True:
+        try:
+            conn, _ = server.accept()
+        except socket.timeout:
+            conn = None
+
+        if watched_mtimes(watched) != mtimes:
+            print("Reloading, the application changed.", flush=True)
+            if conn:
+                conn.close()  # the client falls back to a cold run
+            os.set_inheritable(server.fileno(), True)
+            os.environ[SOCKET_FD_VARIABLE] = str(server.fileno())
+            os.execv(sys.executable, [sys.executable, *sys.argv])
+        if conn is None:
+            continue
+
+        conn.settimeout(None)
+        try:
+            request, fds = receive_request(conn)
+        except (OSError, ValueError) as e:
+            print(f"Invalid request: {e}", flush=True)
+            conn.close()
+            continue
+
+        if os.fork() == 0:
+            server.close()
+            run_request(conn, request, fds, invenio, script_info, environ)
+        for fd in fds:
+            os.close(fd)
+        conn.close()
+
+
+class Fallback(Exception):
+    """The server did not take the request."""
+
+
+def _forward_signals(pid):
+    """Forward the signals meant for the command to its process."""
+
+    def forward(signum, frame):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP, signal.SIGWINCH):
+        signal.signal(signum, forward)
+
+
+def attach(socket_path, argv):
+    """Run a command through the server, return its exit code."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        raise Fallback()
+
+    request = {"argv": argv, "env": dict(os.environ), "cwd": os.getcwd()}
+    message = json.dumps(request).encode("utf-8") + b"\n"
+    socket.send_fds(client, [message], [0, 1, 2])
+    responses = client.makefile("rb")
+    line = responses.readline()
+    if not line:
+        # reloading, or unable to fork
+        raise Fallback()
+    _forward_signals(json.loads(line)["pid"])
+
+    line = responses.readline()
+    # the command's process died without reporting
+    return json.loads(line)["exit"] if line else 1
+
+
+def main(argv):
+    """Serve, or run a command through the server."""
+    action, socket_path, *args = argv
+    if action == "serve":
+        serve(socket_path, args)
+        return 0
+
+    fallback, *command = args
+    try:
+        return attach(socket_path, command)
+    except Fallback:
+        fallback = json.loads(fallback)
+        if not fallback:
+            print("The invenio-cli daemon is not running.", file=sys.stderr)
+            return 1
+        os.execvp(fallback[0], fallback)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -14,7 +14,9 @@
 import re
 
 import docker
+from docker.utils import parse_repository_tag
 
+from . import compose, images, tracing
 from .process import ProcessResponse, run_cmd, run_interactive
 
 DOCKER_COMPOSE_VERSION_DASH = "1.21.0"
@@ -23,14 +25,45 @@ DOCKER_COMPOSE_VERSION_DASH = "1.21.0"
 class DockerHelper(object):
     """Utility class to interact with docker-compose."""
 
-    def __init__(self, project_shortname, local=True, log_config=None):
-        """Constructor."""
+    def __init__(
+        self,
+        project_shortname,
+        local=True,
+        log_config=None,
+        project_name=None,
+        override_files=None,
+    ):
+        """Constructor.
+
+        :param project_name: Compose project name, defaults to the one
+                             derived by compose from the project directory.
+        :param override_files: Compose files applied on top of the main one.
+        """
         super().__init__()
         self.docker_compose = ["docker", "compose"]
-        self.container_prefix = self._normalize_name(project_shortname)
+        if project_name:
+            self.docker_compose.extend(["--project-name", project_name])
+        self.project_name = project_name
+        self.container_prefix = self._normalize_name(project_name or project_shortname)
         self.local = local
+        self.override_files = list(override_files or [])
         self.docker_client = docker.from_env()
 
+    def compose_files(self, main_file=None):
+        """Return the compose files, the main one first."""
+        if main_file is None:
+            main_file = (
+                "docker-compose.yml" if self.local else "docker-compose.full.yml"
+            )
+        return [main_file, *map(str, self.override_files)]
+
+    def _compose_files(self, main_file=None):
+        """Return the ``--file`` arguments of the compose files."""
+        args = []
+        for compose_file in self.compose_files(main_file):
+            args.extend(["--file", compose_file])
+        return args
+
     def _normalize_name(self, project_shortname):
         """Normalize the container name according to the compose version.
 
@@ -46,48 +79,126 @@ class DockerHelper(object):
         else:
             return project_shortname
 
-    def _get_container_from_service(self, service_name):
-        """Retrieve the docker container for the given service_name."""
-        container_name = [
-            container.name
-            for container in self.docker_client.containers.list()
-            if container.name.startswith(self.container_prefix)
-            and service_name in container.name
-        ]
+    def _get_container_from_service(self, service_name, stopped=False):
+        """Retrieve the docker container for the given service_name.
 
-        return (
-            self.docker_client.containers.get(container_name[0])
-            if container_name
-            else None
-        )
+        The containers are matched on their compose project and service
+        labels, names are ambiguous (``proj-db-1`` and ``proj-pool-0-db-1``).
 
-    def build_images(self, pull=False, cache=True):
+        :param stopped: Also look for the stopped containers.
+        """
+        for container in self.docker_client.containers.list(all=stopped):
+            labels = container.labels or {}
+            if (
+                labels.get("com.docker.compose.project") == self.container_prefix
+                and labels.get("com.docker.compose.service") == service_name
+            ):
+                return container
+        return None
+
+    def has_container(self, service_name):
+        """Whether the container of a service exists, running or stopped."""
+        return self._get_container_from_service(service_name, stopped=True) is not None
+
+    def build_images(self, pull=False, cache=True, services=None, build_files=None):
         """Build images.
 
         :param pull: Adds --pull to the docker-compose command.
         :param cache: Removes --no-cache to the docker-compose command.
+        :param services: The services to build, all by default.
+        :param build_files: Compose files only applied to the build, e.g.
+                            labelling the images.
         """
         command = self.docker_compose + [
-            "--file",
-            "docker-compose.full.yml",
-            "build",
+            *self._compose_files("docker-compose.full.yml"),
         ]
+        for build_file in build_files or []:
+            command.extend(["--file", str(build_file)])
+        command.append("build")
         if pull:
             command.append("--pull")
         if not cache:
             command.append("--no-cache")
+        command.extend(services or [])
 
         # FIXME: To get real-time output
         return run_interactive(command)
 
+    def image_id(self, image):
+        """Return the id of a local image, ``None`` if it is not present."""
+        try:
+            return self.docker_client.images.get(image).id
+        except docker.errors.ImageNotFound:
+            return None
+
+    def image_labels(self, image):
+        """Return the labels of a local image, empty if it is not present."""
+        try:
+            return self.docker_client.images.get(image).labels or {}
+        except docker.errors.ImageNotFound:
+            return {}
+
+    def project_images(self):
+        """Return the images of the services, pulled and built."""
+        return compose.project_images(self.compose_files())
+
+    def service_environment(self, service):
+        """Return the environment variables of a service, e.g. ``db``."""
+        return compose.service_environment(self.compose_files(), service)
+
+    def missing_images(self):
+        """Return the images of the services which are not present locally."""
+        return [
+            image
+            for image in compose.service_images(self.compose_files())
+            if self.image_id(image) is None
+        ]
+
+    def pull_image(self, image, mirror=None, progress=None):
+        """Pull an image, from a registry mirror if possible.
+
+        :param mirror: Registry mirror of the Docker Hub images, the image
+                       is pulled from Docker Hub if it is not on the mirror.
+        :param progress: Function called with the image and every event of
+                         the pull, see :class:`~.images.PullProgress`.
+        """
+        repository, tag = parse_repository_tag(image)
+        tag = tag or "latest"
+        sources = [repository]
+        # digests cannot be tagged with the original name
+        if mirror and not tag.startswith("sha256:"):
+            mirrored = images.mirror_repository(repository, mirror)
+            if mirrored:
+                sources.insert(0, mirrored)
+
+        errors = []
+        for source in sources:
+            try:
+                for event in self.docker_client.api.pull(
+                    source, tag, stream=True, decode=True
+                ):
+                    if "error" in event:
+                        raise docker.errors.APIError(event["error"])
+                    if progress:
+                        progress(image, event)
+            except docker.errors.APIError as e:
+                errors.append(f"{source}: {e}")
+                continue
+            if source != repository:
+                self.docker_client.api.tag(f"{source}:{tag}", repository, tag)
+            return ProcessResponse(output=f"Pulled {image}.", status_code=0)
+
+        return ProcessResponse(
+            error=f"Unable to pull {image}: " + "; ".join(errors), status_code=1
+        )
+
     def start_containers(self, app_only=False):
         """Start containers according to the specified environment.
 
         :param app_only: Boot up only ui and api containers.
         """
         command = self.docker_compose + [
-            "--file",
-            "docker-compose.yml" if self.local else "docker-compose.full.yml",
+            *self._compose_files(),
             "up",
             "-d",  # --detach not supported in 1.17.0
         ]
@@ -100,8 +211,7 @@ class DockerHelper(object):
     def stop_containers(self):
         """Stop currently running containers."""
         command = self.docker_compose + [
-            "--file",
-            "docker-compose.yml" if self.local else "docker-compose.full.yml",
+            *self._compose_files(),
             "stop",
         ]
         return run_cmd(command)
@@ -109,24 +219,45 @@ class DockerHelper(object):
     def destroy_containers(self):
         """Stop and remove all containers, volumes and images."""
         command = self.docker_compose + [
-            "--file",
-            "docker-compose.yml" if self.local else "docker-compose.full.yml",
+            *self._compose_files(),
             "down",
             "--volumes",
         ]
 
         return run_cmd(command)
 
+    def exec_service(self, service, command):
+        """Run a command in the container of a service, e.g. ``db``.
+
+        :param command: The command, in array form.
+        """
+        return run_cmd(
+            self.docker_compose
+            + [*self._compose_files(), "exec", "-T", service]
+            + list(command)
+        )
+
     def execute_cli_command(self, project_shortname, command):
         """Execute an invenio CLI command in the API container."""
         container = self._get_container_from_service("web-ui")
         if container:
-            status = container.exec_run(
-                cmd='/bin/bash -c "{}"'.format(command.replace('"', '\\"')),
-                tty=True,
-                stdout=True,
-                stderr=True,
-            )
+            with tracing.span(
+                "container exec",
+                kind=tracing.SPAN_KIND_CLIENT,
+                **{"container.name": container.name, "process.command_line": command},
+            ) as span:
+                status = container.exec_run(
+                    cmd='/bin/bash -c "{}"'.format(command.replace('"', '\\"')),
+                    tty=True,
+                    stdout=True,
+                    stderr=True,
+                    environment=tracing.propagation_env(),
+                )
+                if span:
+                    span.set_attribute("process.exit_code", status.exit_code)
+                    span.set_attribute("process.output_bytes", len(status.output))
+                    if status.exit_code:
+                        span.set_error()
             # FIXME: What happens when exec_run fails? handle exception.
             return ProcessResponse(
                 output=status.output.decode("utf-8").strip(),
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI host diagnostics helper module.
+
+The functions measure the host resources which the services and the
+instance depend on, returning ``None`` when a value cannot be measured.
+"""
+
+import json
+import os
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from .process import run_cmd
+
+OK = "ok"
+WARNING = "warning"
+UNKNOWN = "unknown"
+
+
+class Check(namedtuple("Check", "name status value message recommendation")):
+    """Result of a diagnostic check."""
+
+
+def max_map_count(path="/proc/sys/vm/max_map_count"):
+    """Return the ``vm.max_map_count`` kernel setting, Linux only."""
+    try:
+        return int(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def docker_info():
+    """Return the information of the Docker daemon, as a dict."""
+    try:
+        result = run_cmd(["docker", "info", "--format", "{{json .}}"])
+    except OSError:
+        return None
+    if result.status_code != 0:
+        return None
+    try:
+        return json.loads(result.output)
+    except ValueError:
+        return None
+
+
+def available_cpus(cgroup_dir="/sys/fs/cgroup"):
+    """Return the number of CPUs the processes can use.
+
+    It takes into account the CPU affinity of the process and the CPU
+    quota of its (v2) cgroup, e.g. in CI containers.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+
+    try:
+        quota, period = Path(cgroup_dir, "cpu.max").read_text().split()
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(1, min(cpus, int(quota) // int(period)))
+
+
+def write_throughput(directory, size=64 * 2**20, chunk_size=2**20):
+    """Measure the write throughput of a directory's disk, in bytes per second.
+
+    A file of ``size`` bytes is written, synced to the disk, and removed.
+    """
+    path = Path(directory) / f".invenio-cli-doctor-{os.getpid()}"
+    chunk = os.urandom(chunk_size)
+    try:
+        start = time.monotonic()
+        with open(path, "wb") as test_file:
+            for _ in range(size // chunk_size):
+                test_file.write(chunk)
+            test_file.flush()
+            os.fsync(test_file.fileno())
+        duration = time.monotonic() - start
+    except OSError:
+        return None
+    finally:
+        path.unlink(missing_ok=True)
+    return size / duration if duration > 0 else None
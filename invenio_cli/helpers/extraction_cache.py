@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI i18n message extraction cache."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from babel.messages import frontend
+from babel.messages.catalog import Catalog
+from babel.messages.extract import (
+    DEFAULT_KEYWORDS,
+    check_and_call_extract_file,
+    pathmatch,
+)
+from babel.messages.pofile import write_po
+
+from .filesystem import hash_file
+from .process import ProcessResponse
+
+CACHE_VERSION = 1
+"""Bump to invalidate every existing extraction cache."""
+
+
+def _parse_mapping(babel_file):
+    """Parse a babel mapping file into ``(method_map, options_map)``."""
+    parse = getattr(frontend, "parse_mapping_cfg", None) or frontend.parse_mapping
+    with open(babel_file) as fileobj:
+        return parse(fileobj, filename=str(babel_file))
+
+
+class ExtractionCache(object):
+    """Per source file cache of extracted messages.
+
+    Each entry is keyed by the file path relative to the input directory and
+    stores the file's mtime, size and hash along with the messages extracted
+    from it. A file is only parsed again when its mtime/size changed *and*
+    its content hash differs from the cached one.
+    """
+
+    def __init__(self, cache_path, config_key):
+        """Constructor.
+
+        :param cache_path: Path to the JSON file backing the cache.
+        :param config_key: Hash of the extraction configuration. A cache
+                           written with a different key is discarded.
+        """
+        self.cache_path = Path(cache_path)
+        self.config_key = config_key
+        self.entries = {}
+        self.parsed = 0
+        self.cached = 0
+
+        try:
+            with open(self.cache_path) as cache_file:
+                data = json.load(cache_file)
+        except (FileNotFoundError, ValueError):
+            return
+
+        if (
+            data.get("version") == CACHE_VERSION
+            and data.get("config_key") == self.config_key
+        ):
+            self.entries = data.get("files", {})
+
+    def _lookup(self, filename, filepath):
+        """Return the cached entry for the file if it is still valid."""
+        entry = self.entries.get(filename)
+        if not entry:
+            return None, None
+
+        stat = os.stat(filepath)
+        if entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry, None
+
+        digest = hash_file(filepath)
+        if entry["hash"] == digest:
+            entry["mtime"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            return entry, digest
+
+        return None, digest
+
+    def extract(self, filename, filepath, extract_func):
+        """Return the messages of a file, from the cache if possible.
+
+        :param filename: Path relative to the input directory (cache key).
+        :param filepath: Absolute path to the file.
+        :param extract_func: Callable parsing the file, returns an iterable of
+                             ``(lineno, message, comments, context)``.
+        """
+        entry, digest = self._lookup(filename, filepath)
+        if entry is not None:
+            self.cached += 1
+            return entry
+
+        messages = []
+        for lineno, message, comments, context in extract_func():
+            if isinstance(message, tuple):
+                message = list(message)
+            messages.append([lineno, message, list(comments), context])
+
+        stat = os.stat(filepath)
+        entry = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": digest or hash_file(filepath),
+            "messages": messages,
+        }
+        self.entries[filename] = entry
+        self.parsed += 1
+        return entry
+
+    def prune(self, seen):
+        """Drop the entries of files that no longer exist."""
+        self.entries = {k: v for k, v in self.entries.items() if k in seen}
+
+    def save(self):
+        """Write the cache to disk."""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as cache_file:
+            json.dump(
+                {
+                    "version": CACHE_VERSION,
+                    "config_key": self.config_key,
+                    "files": self.entries,
+                },
+                cache_file,
+            )
+        os.replace(tmp_path, self.cache_path)
+
+
+def _walk(input_dir, method_map):
+    """Yield the files of the input directory the way ``pybabel`` does.
+
+    Hidden and underscore prefixed directories are skipped, as well as those
+    matching an ``ignore`` pattern of the mapping file.
+    """
+    ignore_patterns = [p for p, method in method_map if method == "ignore"]
+    for root, dirnames, filenames in os.walk(input_dir):
+        kept = []
+        for subdir in dirnames:
+            if subdir.startswith(".") or subdir.startswith("_"):
+                continue
+            rel_dir = os.path.relpath(os.path.join(root, subdir), input_dir)
+            rel_dir = rel_dir.replace(os.sep, "/")
+            if any(pathmatch(p, rel_dir) for p in ignore_patterns):
+                continue
+            kept.append(subdir)
+        dirnames[:] = sorted(kept)
+
+        for filename in sorted(filenames):
+            filepath = os.path.join(root, filename).replace(os.sep, "/")
+            rel_path = os.path.relpath(filepath, input_dir).replace(os.sep, "/")
+            yield rel_path, filepath
+
+
+def _matches(method_map, filename):
+    """Whether a file is subject to extraction."""
+    for pattern, method in method_map:
+        if pathmatch(pattern, filename):
+            return method != "ignore"
+    return False
+
+
+def extract_messages(
+    babel_file,
+    output_file,
+    input_dirs,
+    cache_path,
+    msgid_bugs_address=None,
+    copyright_holder=None,
+    add_comments="NOTE",
+):
+    """Extract messages into a ``.pot`` file, only parsing changed files.
+
+    Mirrors ``pybabel extract --mapping-file --input-dirs`` but keeps the
+    messages of every source file in an :class:`ExtractionCache`.
+
+    :raises ValueError: if an extraction method of the mapping file is
+                        unknown to the current environment.
+    :raises ImportError: if an extraction method cannot be imported.
+    """
+    with open(babel_file, "rb") as mapping_file:
+        mapping = mapping_file.read()
+    config_key = hashlib.sha256(mapping + add_comments.encode("utf-8")).hexdigest()
+
+    method_map, options_map = _parse_mapping(babel_file)
+    comment_tags = [add_comments] if add_comments else []
+    cache = ExtractionCache(cache_path, config_key)
+
+    catalog = Catalog(
+        msgid_bugs_address=msgid_bugs_address,
+        copyright_holder=copyright_holder,
+    )
+
+    input_dir = str(input_dirs)
+    seen = set()
+    for filename, filepath in _walk(input_dir, method_map):
+        if not _matches(method_map, filename):
+            continue
+        seen.add(filename)
+
+        def _extract():
+            for _, *message in check_and_call_extract_file(
+                filepath,
+                method_map,
+                options_map,
+                None,
+                DEFAULT_KEYWORDS,
+                comment_tags,
+                False,
+                dirpath=input_dir,
+            ):
+                yield message
+
+        entry = cache.extract(filename, filepath, _extract)
+        location = os.path.normpath(os.path.join(input_dir, filename))
+        for lineno, message, comments, context in entry["messages"]:
+            if isinstance(message, list):
+                message = tuple(message)
+            catalog.add(
+                message,
+                None,
+                [(location, lineno)],
+                auto_comments=comments,
+                context=context,
+            )
+
+    with open(output_file, "wb") as outfile:
+        write_po(outfile, catalog, width=76)
+
+    cache.prune(seen)
+    cache.save()
+
+    return ProcessResponse(
+        output=f"Extracted {len(catalog)} messages "
+        + f"({cache.parsed} files parsed, {cache.cached} from cache).",
+        status_code=0,
+    )
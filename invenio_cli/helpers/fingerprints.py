@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI fingerprints helper module.
+
+Steps declaring their input and output files are skipped, make-style, when
+their outputs exist and the fingerprint of their inputs (sizes and
+modification times, directories being walked) is the one recorded after
+their last successful run. The fingerprints are stored in a JSON file of
+the project's cache directory.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+FINGERPRINTS_FILENAME = "fingerprints.json"
+
+_store = None
+
+
+class FingerprintStore(object):
+    """Fingerprints of the inputs of the steps, by step key."""
+
+    def __init__(self, path, force=False):
+        """Constructor.
+
+        :param path: Path to the JSON file the fingerprints are stored in.
+        :param force: Never consider a step up to date, e.g. ``--no-cache``.
+        """
+        self.path = Path(path)
+        self.force = force
+        self._fingerprints = None
+
+    @property
+    def fingerprints(self):
+        """The stored fingerprints, loaded on first access."""
+        if self._fingerprints is None:
+            try:
+                self._fingerprints = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._fingerprints = {}
+        return self._fingerprints
+
+    def is_up_to_date(self, key, inputs, outputs, command=""):
+        """Whether the outputs exist and the inputs did not change."""
+        if self.force:
+            return False
+        if not all(os.path.exists(output) for output in outputs):
+            return False
+        return self.fingerprints.get(key) == fingerprint(inputs, outputs, command)
+
+    def record(self, key, inputs, outputs, command=""):
+        """Record the fingerprint of the inputs after a successful run."""
+        self.fingerprints[key] = fingerprint(inputs, outputs, command)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.fingerprints, indent=2, sort_keys=True))
+        os.replace(tmp_path, self.path)
+
+
+def _files(path):
+    """Return the files of a path, walking the directories."""
+    if not os.path.isdir(path):
+        return [str(path)]
+    files = []
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        files.extend(os.path.join(dirpath, filename) for filename in sorted(filenames))
+    return files
+
+
+def fingerprint(inputs, outputs=(), command=""):
+    """Return the fingerprint of input files, output paths and a command."""
+    digest = hashlib.sha256(command.encode("utf-8"))
+    for output in outputs:
+        digest.update(f"output:{output}\n".encode("utf-8"))
+    for path in inputs:
+        for filename in _files(path):
+            try:
+                stat = os.stat(filename)
+                state = f"{stat.st_size}:{stat.st_mtime_ns}"
+            except OSError:
+                state = "missing"
+            digest.update(f"input:{filename}:{state}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def configure(cache_dir, force=False):
+    """Enable the up-to-date checks, storing the fingerprints in ``cache_dir``."""
+    global _store
+    _store = FingerprintStore(Path(cache_dir) / FINGERPRINTS_FILENAME, force=force)
+
+
+def is_up_to_date(key, inputs, outputs, command=""):
+    """Whether a step can be skipped, never if the checks are not enabled."""
+    if _store is None:
+        return False
+    return _store.is_up_to_date(key, inputs, outputs, command)
+
+
+def record(key, inputs, outputs, command=""):
+    """Record the fingerprint of a step which ran successfully."""
+    if _store is not None:
+        _store.record(key, inputs, outputs, command)
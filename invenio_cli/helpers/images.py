@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI Docker images helper module."""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from pathlib import Path
+from subprocess import PIPE, Popen
+
+from docker.auth import INDEX_NAME, resolve_repository_name
+
+from .process import ProcessResponse
+
+MB = 2**20
+
+IMAGE_CACHE_MANIFEST = "images.json"
+"""File of an image cache directory listing the saved images and their ids."""
+
+FINGERPRINT_LABEL = "org.inveniosoftware.cli.fingerprint"
+"""Label of the built images, the fingerprint of what they were built from."""
+
+CONTEXT_EXCLUDES = (".invenio.cache",)
+"""Directories of the build contexts never fingerprinted.
+
+The cache directory of the CLI changes with every command, e.g. the image
+archives and fingerprints, it is excluded even if ``.dockerignore`` does not.
+"""
+
+
+def mirror_repository(repository, mirror):
+    """Return the repository of a Docker Hub image on a registry mirror.
+
+    Images of other registries are not mirrored, ``None`` is returned.
+
+    :param repository: The repository, e.g. ``postgres``.
+    :param mirror: The mirror, e.g. ``localhost:5000`` or ``mirror.gcr.io``.
+    """
+    registry, name = resolve_repository_name(repository)
+    if registry != INDEX_NAME:
+        return None
+    if "/" not in name:
+        # official images
+        name = f"library/{name}"
+    return f"{mirror.rstrip('/')}/{name}"
+
+
+class PullProgress(object):
+    """Bytes downloaded by parallel image pulls, by image and layer.
+
+    It is fed the events streamed by the Docker API for each image.
+    """
+
+    DONE_STATUSES = ("Download complete", "Pull complete", "Already exists")
+
+    def __init__(self, images):
+        """Constructor."""
+        self.layers = {image: {} for image in images}
+        self.done = set()
+        self._lock = threading.Lock()
+
+    def update(self, image, event):
+        """Account for an event of the pull of an image."""
+        status = event.get("status", "")
+        layer = event.get("id")
+        detail = event.get("progressDetail") or {}
+        with self._lock:
+            layers = self.layers.setdefault(image, {})
+            if status == "Downloading" and detail.get("total"):
+                layers[layer] = (detail.get("current", 0), detail["total"])
+            elif status in self.DONE_STATUSES and layer in layers:
+                layers[layer] = (layers[layer][1], layers[layer][1])
+            elif status.startswith("Status:"):
+                self.done.add(image)
+
+    def report(self):
+        """Return one line per image, with its downloaded and total bytes."""
+        lines = []
+        with self._lock:
+            for image, layers in self.layers.items():
+                if image in self.done:
+                    lines.append(f"{image}: done")
+                    continue
+                current = sum(layer[0] for layer in layers.values())
+                total = sum(layer[1] for layer in layers.values())
+                lines.append(f"{image}: {current / MB:.1f}/{total / MB:.1f} MB")
+        return "\n".join(lines)
+
+
+def _compile_pattern(pattern):
+    r"""Compile a ``.dockerignore`` pattern the way Docker matches it.
+
+    ``*`` and ``?`` do not match ``/``, ``**`` matches any number of
+    directories and ``\`` escapes the next character.
+    """
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            regex += "(.*/)?"
+            i += 2
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 1
+        elif char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "\\" and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        elif char == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            chars = pattern[i + 1 : end]
+            if chars[0] == "!":
+                chars = "^" + chars[1:]
+            regex += f"[{chars}]"
+            i = end
+        else:
+            regex += re.escape(char)
+        i += 1
+    return re.compile(regex)
+
+
+def _dockerignore_patterns(context_dir):
+    """Return the ``(negated, regex)`` of a context's ``.dockerignore``."""
+    try:
+        lines = Path(context_dir, ".dockerignore").read_text().splitlines()
+    except OSError:
+        return []
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        pattern = line.lstrip("!").strip("/")
+        patterns.append((negated, _compile_pattern(os.path.normpath(pattern))))
+    return patterns
+
+
+def _is_ignored(path, patterns):
+    """Whether a path of a build context is excluded, the last match wins.
+
+    As with Docker, a pattern matching a directory matches its content.
+    """
+    parts = path.split(os.sep)
+    paths = ["/".join(parts[: i + 1]) for i in range(len(parts))]
+    ignored = False
+    for negated, regex in patterns:
+        if any(regex.fullmatch(candidate) for candidate in paths):
+            ignored = not negated
+    return ignored
+
+
+def build_fingerprint(build):
+    """Return the fingerprint of what an image is built from.
+
+    It is computed from the build configuration and the content of the
+    files of the build context (including the lock files), the ones
+    excluded by its ``.dockerignore`` aside.
+
+    :param build: The ``build`` configuration of a compose service.
+    """
+    # the context is hashed by content, wherever the project is
+    config = {key: value for key, value in build.items() if key != "context"}
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8"))
+    context_dir = build.get("context", ".")
+    patterns = _dockerignore_patterns(context_dir)
+    # excluded directories can only be skipped if no file is included back
+    prune = not any(negated for negated, _ in patterns)
+    for dirpath, dirnames, filenames in os.walk(context_dir):
+        relative_dir = os.path.relpath(dirpath, context_dir)
+        dirnames[:] = sorted(
+            name
+            for name in dirnames
+            if name not in CONTEXT_EXCLUDES
+            and not (
+                prune
+                and _is_ignored(
+                    os.path.normpath(os.path.join(relative_dir, name)), patterns
+                )
+            )
+        )
+        for filename in sorted(filenames):
+            relative_path = os.path.normpath(os.path.join(relative_dir, filename))
+            path = os.path.join(dirpath, filename)
+            if _is_ignored(relative_path, patterns) or not os.path.isfile(path):
+                continue
+            digest.update(f"{relative_path}\n".encode("utf-8"))
+            with open(path, "rb") as context_file:
+                for chunk in iter(lambda: context_file.read(2**20), b""):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _run_pipeline(producer, consumer, **consumer_kwargs):
+    """Run two commands, the output of the first piped to the second."""
+    first = Popen(producer, stdout=PIPE, stderr=PIPE)
+    second = Popen(consumer, stdin=first.stdout, stderr=PIPE, **consumer_kwargs)
+    first.stdout.close()  # the consumer gets a SIGPIPE if it exits
+    output, second_error = second.communicate()
+    first_error = first.stderr.read()
+    first.wait()
+    for process, error in ((first, first_error), (second, second_error)):
+        if process.returncode != 0:
+            return ProcessResponse(
+                error=error.decode("utf-8", "replace").strip(),
+                status_code=process.returncode,
+            )
+    return ProcessResponse(
+        output=output.decode("utf-8").strip() if output else "", status_code=0
+    )
+
+
+class ImageCache(object):
+    """Directory of images saved as zstd-compressed ``docker save`` archives.
+
+    A manifest keeps the id of the saved images, so that the images whose
+    id did not change are neither saved nor loaded again.
+    """
+
+    def __init__(self, directory):
+        """Constructor."""
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / IMAGE_CACHE_MANIFEST
+
+    @staticmethod
+    def check_zstd():
+        """Check that ``zstd``, which compresses the images, is installed."""
+        if shutil.which("zstd") is None:
+            return ProcessResponse(error="zstd is not installed.", status_code=1)
+        return ProcessResponse(output="zstd is installed.", status_code=0)
+
+    def manifest(self):
+        """Return the saved images, by name, e.g. ``{"id": ..., "file": ...}``."""
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _update_manifest(self, image, entry):
+        """Record a saved image in the manifest."""
+        manifest = self.manifest()
+        manifest[image] = entry
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        os.replace(tmp_path, self.manifest_path)
+
+    def is_saved(self, image, image_id):
+        """Whether an image is saved with the given id."""
+        entry = self.manifest().get(image)
+        return (
+            entry is not None
+            and entry["id"] == image_id
+            and (self.directory / entry["file"]).exists()
+        )
+
+    def save(self, image, image_id):
+        """Save an image, streaming ``docker save`` through ``zstd``."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        filename = re.sub(r"[^\w.-]+", "_", image) + ".tar.zst"
+        tmp_path = self.directory / (filename + ".tmp")
+        with open(tmp_path, "wb") as archive:
+            response = _run_pipeline(
+                ["docker", "save", image],
+                ["zstd", "-T0", "-q", "-c"],
+                stdout=archive,
+            )
+        if response.status_code != 0:
+            tmp_path.unlink(missing_ok=True)
+            return response
+
+        os.replace(tmp_path, self.directory / filename)
+        self._update_manifest(image, {"id": image_id, "file": filename})
+        size = (self.directory / filename).stat().st_size
+        return ProcessResponse(
+            output=f"Saved {image} ({size / MB:.0f} MB).", status_code=0
+        )
+
+    def load(self, image):
+        """Load a saved image, streaming its archive through ``zstd``."""
+        entry = self.manifest()[image]
+        response = _run_pipeline(
+            ["zstd", "-d", "-q", "-c", str(self.directory / entry["file"])],
+            ["docker", "load", "--quiet"],
+            stdout=PIPE,
+        )
+        if response.status_code == 0:
+            response.output = f"Loaded {image}."
+        return response
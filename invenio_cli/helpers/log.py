@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI logging helper module.
+
+Records of the ``invenio_cli`` logger are written as JSON lines to a file
+rotated by size. Writes are buffered and flushed every ``capacity``
+records, on errors and when the CLI exits. The records logged while a step
+runs carry its id, so that the commands it ran can be correlated with it.
+"""
+
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import MemoryHandler, RotatingFileHandler
+
+logger = logging.getLogger("invenio_cli")
+# only log to the configured file, never to the console
+logger.addHandler(logging.NullHandler())
+logger.propagate = False
+
+RUN_ID = uuid.uuid4().hex[:12]
+"""Identifier of the current CLI invocation."""
+
+_current_step = ContextVar("invenio_cli_current_step", default=None)
+_step_counter = itertools.count(1)
+_handler = None
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as JSON objects."""
+
+    def format(self, record):
+        """Return the JSON representation of the record."""
+        data = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "run_id": RUN_ID,
+            "pid": record.process,
+        }
+        step_id = getattr(record, "step_id", None)
+        if step_id:
+            data["step_id"] = step_id
+        data.update(getattr(record, "data", {}))
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+class _StepFilter(logging.Filter):
+    """Tag the records with the id of the running step."""
+
+    def filter(self, record):
+        """Add the ``step_id`` attribute."""
+        record.step_id = _current_step.get()
+        return True
+
+
+def setup(log_file, max_bytes=10 * 1024 * 1024, backup_count=5, capacity=100):
+    """Log the ``invenio_cli`` records to ``log_file``.
+
+    :param max_bytes: Size after which the file is rotated.
+    :param backup_count: Number of rotated files to keep.
+    :param capacity: Number of records buffered before being written.
+    """
+    global _handler
+    shutdown()
+
+    os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, delay=True
+    )
+    file_handler.setFormatter(JSONFormatter())
+    _handler = MemoryHandler(
+        capacity, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+    )
+    _handler.addFilter(_StepFilter())
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.info("Command started", extra={"data": {"event": "run", "argv": sys.argv}})
+
+
+def flush():
+    """Write the buffered records."""
+    if _handler:
+        _handler.flush()
+
+
+def shutdown():
+    """Write the buffered records and stop logging to the file."""
+    global _handler
+    if _handler:
+        file_handler = _handler.target
+        logger.removeHandler(_handler)
+        _handler.close()
+        file_handler.close()
+        _handler = None
+        logger.setLevel(logging.NOTSET)
+
+
+class StepLog(object):
+    """Outcome of a step, logged when it finishes."""
+
+    def __init__(self, step_id, message):
+        """Constructor."""
+        self.step_id = step_id
+        self.message = message
+        self.status_code = None
+        self.error = None
+
+
+@contextmanager
+def step(message, step_type=None):
+    """Log the start and the outcome of a step.
+
+    The records logged within the block are tagged with the step id. Set the
+    ``status_code`` (and ``error``) of the yielded :class:`StepLog`.
+    """
+    step_log = StepLog(f"{RUN_ID}-{next(_step_counter)}", message)
+    token = _current_step.set(step_log.step_id)
+    logger.info(
+        "Step started: %s",
+        message,
+        extra={"data": {"event": "step.start", "step_type": step_type}},
+    )
+    start = time.monotonic()
+    try:
+        yield step_log
+    finally:
+        level = logging.ERROR if step_log.status_code else logging.INFO
+        logger.log(
+            level,
+            "Step finished: %s",
+            message,
+            extra={
+                "data": {
+                    "event": "step.end",
+                    "step_type": step_type,
+                    "duration": round(time.monotonic() - start, 3),
+                    "status_code": step_log.status_code,
+                    "error": step_log.error,
+                }
+            },
+        )
+        _current_step.reset(token)
+
+
+def log_process(command, exit_code, duration, output_bytes=None):
+    """Log the outcome of a subprocess."""
+    logger.log(
+        logging.WARNING if exit_code else logging.INFO,
+        "Command exited with %s: %s",
+        exit_code,
+        command[0] if command else "",
+        extra={
+            "data": {
+                "event": "process",
+                "argv": list(command),
+                "exit_code": exit_code,
+                "duration": round(duration, 3),
+                "output_bytes": output_bytes,
+            }
+        },
+    )
@@ -7,28 +7,157 @@
 
 """Wrappers around various package managers to be used under the hood."""
 
+import json
 import os
+import shlex
 from abc import ABC
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from subprocess import DEVNULL, PIPE, CalledProcessError, run
 from typing import Dict, List, Union
 
+try:
+    import tomli as tomllib
+except ModuleNotFoundError:
+    import tomllib
+
 from pynpm import NPMPackage, PNPMPackage
 
 from ..helpers.process import ProcessResponse
+from .daemon import warm_command
+from .profiling import profile_command
 
 
 class PythonPackageManager(ABC):
-    """Interface for creating tool-specific Python package management commands."""
+    """Interface for creating tool-specific Python package management commands.
+
+    When given the project and cache directories, commands are run directly
+    from the virtual environment instead of through the package manager's
+    ``run`` wrapper. The location of the environment is cached, keyed on the
+    modification times of the project files, and the wrapper is used again
+    as long as it cannot be resolved.
+    """
 
     name: str = None
     lock_file_name: str = None
+    project_files: List[str] = []
+    venv_cache_filename = "venv.json"
+
+    def __init__(self, project_dir=None, cache_dir=None):
+        """Constructor.
+
+        :param project_dir: Path to the project, enables direct runs.
+        :param cache_dir: Directory where the environment location is cached.
+        """
+        self.project_dir = Path(project_dir) if project_dir else None
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._venv = None
+        self._venv_key = None
+
+    def resolve_venv(self) -> Union[Dict, None]:
+        """Return the location of the environment (``{"path": ...}``) or None."""
+        return None
+
+    def _venv_cache_key(self):
+        """Modification times of the files the environment depends on."""
+        key = {"manager": self.name}
+        for filename in self.project_files:
+            try:
+                key[filename] = os.stat(self.project_dir / filename).st_mtime_ns
+            except FileNotFoundError:
+                key[filename] = None
+        return key
+
+    def venv(self) -> Union[Dict, None]:
+        """Return the (cached) location of the environment, if usable."""
+        if not self.project_dir or not self.cache_dir:
+            return None
+        # the wrappers load the project's .env file
+        if (self.project_dir / ".env").exists():
+            return None
+
+        key = self._venv_cache_key()
+        if key == self._venv_key:
+            return self._venv
+
+        cache_path = self.cache_dir / self.venv_cache_filename
+        try:
+            with open(cache_path) as cache_file:
+                cached = json.load(cache_file)
+        except (FileNotFoundError, ValueError):
+            cached = {}
+
+        venv = cached.get("venv")
+        if cached.get("key") != key or not venv or not Path(venv["path"]).is_dir():
+            venv = self.resolve_venv()
+            if venv:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, "w") as cache_file:
+                    json.dump({"key": key, "venv": venv}, cache_file)
+
+        if venv:
+            # not found yet, e.g. before the installation: resolved again
+            self._venv, self._venv_key = venv, key
+        return venv
+
+    def environment_key(self):
+        """Return what the environment depends on, to cache values of it.
+
+        That is its location, else the files it is created from and the
+        ``.env`` file its wrapper loads. ``None`` without a project.
+        """
+        if not self.project_dir:
+            return None
+        venv = self.venv()
+        if venv:
+            return venv["path"]
+        key = self._venv_cache_key()
+        try:
+            key[".env"] = os.stat(self.project_dir / ".env").st_mtime_ns
+        except FileNotFoundError:
+            key[".env"] = None
+        return json.dumps(key, sort_keys=True)
+
+    def direct_command(self, command, extra_env=None):
+        """Return the command run from the environment, None if not possible."""
+        venv = self.venv()
+        if not venv or not command or command[0] in venv.get("scripts", []):
+            return None
+
+        bin_dir = Path(venv["path"]) / "bin"
+        executable = bin_dir / command[0]
+        if not executable.is_file():
+            return None
+
+        # the PATH of the environment the command is run in, not the current one
+        exports = "".join(
+            f" {shlex.quote(f'{k}={v}')}" for k, v in (extra_env or {}).items()
+        )
+        return [
+            "sh",
+            "-c",
+            f'export VIRTUAL_ENV="$0" PATH="$0/bin${{PATH:+:$PATH}}"{exports}; '
+            + 'exec "$@"',
+            venv["path"],
+            str(executable),
+            *command[1:],
+        ]
 
-    def run_command(self, *command: str) -> List[str]:
-        """Generate command to run the given command in the managed environment."""
+    def run_command(self, *command: str, warm: bool = True) -> List[str]:
+        """Generate command to run the given command in the managed environment.
+
+        :param warm: Run ``invenio`` commands through the warm application
+                     daemon, when it is running.
+        """
         raise NotImplementedError()
 
+    def _warm_command(self, command, fallback, warm=True):
+        """Return the command run by the daemon if possible, else ``fallback``."""
+        if warm:
+            return warm_command(self.cache_dir, command, fallback) or fallback
+        return fallback
+
     def editable_dev_install(self, package: str) -> List[str]:
         """Install the local packages as editable, but ignore it for locking."""
         raise NotImplementedError()
@@ -67,10 +196,36 @@ class Pipenv(PythonPackageManager):
 
     name = "pipenv"
     lock_file_name = "Pipfile.lock"
-
-    def run_command(self, *command):
+    project_files = ["Pipfile", "Pipfile.lock"]
+
+    def resolve_venv(self):
+        """Ask pipenv for the location of the environment."""
+        try:
+            result = run(
+                [self.name, "--venv"],
+                cwd=self.project_dir,
+                env={**os.environ, "PIPENV_VERBOSITY": "-1"},
+                stdout=PIPE,
+                stderr=DEVNULL,
+                check=True,
+            )
+            with open(self.project_dir / "Pipfile", "rb") as pipfile:
+                scripts = list(tomllib.load(pipfile).get("scripts", {}))
+        except (OSError, CalledProcessError, ValueError):
+            return None
+
+        path = result.stdout.decode("utf-8").strip()
+        return {"path": path, "scripts": scripts} if path else None
+
+    def run_command(self, *command, warm=True):
         """Generate command to run the given command in the managed environment."""
-        return [self.name, "run", *command]
+        command = profile_command(command)
+        # like "pipenv run", expand the environment variables of the arguments
+        expanded = [command[0], *(os.path.expandvars(arg) for arg in command[1:])]
+        direct_command = self.direct_command(expanded, extra_env={"PIPENV_ACTIVE": "1"})
+        return self._warm_command(
+            expanded, direct_command or [self.name, "run", *command], warm
+        )
 
     def editable_dev_install(self, *packages):
         """Install the local packages as editable, but ignore it for locking."""
@@ -124,11 +279,22 @@ class UV(PythonPackageManager):
 
     name = "uv"
     lock_file_name = "uv.lock"
+    project_files = ["pyproject.toml", "uv.lock"]
+
+    def resolve_venv(self):
+        """Return the location of the project environment, if created."""
+        path = self.project_dir / os.environ.get("UV_PROJECT_ENVIRONMENT", ".venv")
+        return {"path": str(path.resolve())} if path.is_dir() else None
 
-    def run_command(self, *command):
+    def run_command(self, *command, warm=True):
         """Generate command to run the given command in the managed environment."""
+        command = profile_command(command)
         # "--no-sync" is used to not override locally installed editable packages
-        return [self.name, "run", "--no-sync", *command]
+        return self._warm_command(
+            command,
+            self.direct_command(command) or [self.name, "run", "--no-sync", *command],
+            warm,
+        )
 
     def editable_dev_install(self, *packages):
         """Install the local packages as editable, but ignore it for locking."""
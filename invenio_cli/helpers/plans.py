@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI plans helper module.
+
+Plans describe, as data, the steps of a command (e.g. the services setup)
+for the different InvenioRDM/ILS versions. A plan file is parsed and
+validated once, and each plan is resolved once per set of facts; the
+executors then turn the resolved steps into :mod:`~invenio_cli.commands.steps`.
+"""
+
+import shlex
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+PLANS_DIR = Path(__file__).parent.parent / "plans"
+
+FACTS = {
+    "rdm": (bool, int, dict),
+    "ils": (bool,),
+    "demo_data": (bool,),
+}
+"""Facts a ``when`` condition can test, with their accepted value types."""
+
+BOUNDS = {"below"}
+"""Keys of the ``{below: <major>}`` conditions on a version."""
+
+STEP_KEYS = {"message", "command", "builtin", "skippable", "bulk", "when"}
+
+
+class PlanParams(dict):
+    """Values of the placeholders of the plans' commands.
+
+    A callable value is only called, once, when a command uses its
+    placeholder, e.g. not to require the instance path for the commands
+    which do not need it.
+    """
+
+    def __getitem__(self, key):
+        """Return the value of a placeholder, computing it if needed."""
+        value = super().__getitem__(key)
+        if callable(value):
+            value = value()
+            self[key] = value
+        return value
+
+
+class PlanStep(namedtuple("PlanStep", "message command builtin skippable bulk when")):
+    """A step of a plan, running either a ``command`` or a ``builtin``."""
+
+    def args(self, params):
+        """Return the command as a list of arguments, placeholders filled.
+
+        :param params: Mapping of the placeholders to their values.
+        """
+        return [arg.format_map(params) for arg in shlex.split(self.command)]
+
+    def command_line(self, params):
+        """Return the command as a string, placeholders filled.
+
+        :param params: Mapping of the placeholders to their values.
+        """
+        return self.command.format_map(params)
+
+
+def _compile_when(when, where):
+    """Validate a ``when`` condition, return it as a hashable tuple."""
+    when = when or {}
+    if not isinstance(when, dict):
+        raise ValueError(f"{where}: 'when' must be a mapping.")
+    for fact, value in when.items():
+        if fact not in FACTS:
+            raise ValueError(f"{where}: unknown fact '{fact}'.")
+        if not isinstance(value, FACTS[fact]) or (
+            isinstance(value, dict)
+            and (
+                set(value) != BOUNDS
+                or not all(isinstance(bound, int) for bound in value.values())
+            )
+        ):
+            raise ValueError(f"{where}: invalid value for '{fact}': {value!r}.")
+    return tuple(
+        sorted(
+            (fact, tuple(sorted(value.items())) if isinstance(value, dict) else value)
+            for fact, value in when.items()
+        )
+    )
+
+
+def _compile_step(step, where):
+    """Validate a step definition, return it as a :class:`PlanStep`."""
+    unknown = set(step) - STEP_KEYS
+    if unknown:
+        raise ValueError(f"{where}: unknown keys {sorted(unknown)}.")
+    if ("command" in step) == ("builtin" in step):
+        raise ValueError(f"{where}: either a 'command' or a 'builtin' is needed.")
+    if "command" in step:
+        # fail early on unbalanced quotes
+        shlex.split(step["command"])
+    elif "bulk" in step:
+        raise ValueError(f"{where}: only commands can be 'bulk' steps.")
+
+    return PlanStep(
+        message=step.get("message"),
+        command=step.get("command"),
+        builtin=step.get("builtin"),
+        skippable=bool(step.get("skippable", False)),
+        bulk=bool(step.get("bulk", False)),
+        when=_compile_when(step.get("when"), where),
+    )
+
+
+@lru_cache(maxsize=None)
+def load_plans(filename="services.yml"):
+    """Load and validate a plan file, only once.
+
+    :returns: A dict of plan name to a tuple of ``(when, steps)`` sections.
+    """
+    path = PLANS_DIR / filename
+    with open(path) as plans_file:
+        data = yaml.safe_load(plans_file)
+
+    plans = {}
+    for name, sections in data.items():
+        compiled = []
+        for index, section in enumerate(sections):
+            where = f"{path.name}: {name}[{index}]"
+            steps = tuple(
+                _compile_step(step, f"{where}.steps[{step_index}]")
+                for step_index, step in enumerate(section.get("steps", []))
+            )
+            compiled.append((_compile_when(section.get("when"), where), steps))
+        plans[name] = tuple(compiled)
+    return plans
+
+
+def _holds(when, facts):
+    """Whether all the conditions of ``when`` hold for ``facts``."""
+    for fact, expected in when:
+        value = facts.get(fact)
+        if isinstance(expected, bool):
+            if bool(value) != expected:
+                return False
+        elif isinstance(expected, tuple):
+            # (("below", major),)
+            if value is None or value >= dict(expected)["below"]:
+                return False
+        elif value is None or value < expected:
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def resolve_plan(name, rdm=None, ils=None, demo_data=False, filename="services.yml"):
+    """Return the steps of a plan applying to the given facts.
+
+    :param rdm: InvenioRDM major version, ``None`` if not installed.
+    :param ils: InvenioILS major version, ``None`` if not installed.
+    :param demo_data: Whether demo data is requested.
+    :returns: A tuple of :class:`PlanStep`.
+    """
+    facts = {"rdm": rdm, "ils": ils, "demo_data": demo_data}
+    return tuple(
+        step
+        for section_when, steps in load_plans(filename)[name]
+        if _holds(section_when, facts)
+        for step in steps
+        if _holds(step.when, facts)
+    )
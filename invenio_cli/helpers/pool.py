@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI services pool helper module.
+
+The state of the pool is a JSON file shared by the CLI processes leasing,
+releasing and resetting its members, every access holding a lock on it.
+"""
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+READY = "ready"
+LEASED = "leased"
+RESETTING = "resetting"
+FAILED = "failed"
+
+
+def _is_alive(pid):
+    """Whether a process is running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def member_status(member):
+    """Return the status of a pool member.
+
+    A member whose reset process died before the end is ``failed``.
+    """
+    status = member["status"]
+    if status == RESETTING and not _is_alive(member.get("pid") or 0):
+        return FAILED
+    return status
+
+
+class PoolState(object):
+    """Members of the services pool, stored in ``<pool_dir>/pool.json``."""
+
+    def __init__(self, pool_dir):
+        """Constructor."""
+        self.pool_dir = Path(pool_dir)
+        self.state_file = self.pool_dir / "pool.json"
+        self.lock_file = self.pool_dir / "pool.lock"
+
+    @contextmanager
+    def _lock(self, exclusive):
+        """Hold the lock of the state file."""
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_file, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _load(self):
+        """Load the state, empty if there is none."""
+        try:
+            with open(self.state_file) as state_file:
+                return json.load(state_file)
+        except FileNotFoundError:
+            return {"members": {}}
+
+    def read(self):
+        """Return a snapshot of the members, as a dict of name to member."""
+        with self._lock(exclusive=False):
+            return self._load()["members"]
+
+    @contextmanager
+    def update(self):
+        """Yield the members to modify them, the changes being saved after.
+
+        Concurrent updates wait for each other.
+        """
+        with self._lock(exclusive=True):
+            state = self._load()
+            yield state["members"]
+            tmp_file = self.state_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as state_file:
+                json.dump(state, state_file, indent=2)
+            os.replace(tmp_file, self.state_file)
+
+    def set_status(self, name, status, **values):
+        """Update the status of a member, ``values`` being stored with it."""
+        with self.update() as members:
+            members[name].update(
+                status=status,
+                updated_at=datetime.now(timezone.utc).isoformat(),
+                **values,
+            )
@@ -10,11 +10,14 @@
 
 """Invenio CLI Process helper module."""
 
+import time
 from os import environ
 from subprocess import PIPE, CalledProcessError
 from subprocess import Popen as popen
 from subprocess import run
 
+from . import log, profiling, tracing
+
 
 class ProcessResponse:
     """Process response class."""
@@ -32,10 +35,24 @@ class ProcessResponse:
 
 def run_cmd(command):
     """Runs a given command and returns a ProcessResponse."""
-    p = popen(command, stdout=PIPE, stderr=PIPE)
-    output, error = p.communicate()
-    output = output.decode("utf-8")
-    error = error.decode("utf-8")
+    with tracing.span(
+        "subprocess", kind=tracing.SPAN_KIND_CLIENT, **{"process.command_args": command}
+    ) as span:
+        trace_env = tracing.propagation_env()
+        kwargs = {"env": {**environ, **trace_env}} if trace_env else {}
+        start = time.monotonic()
+        p = popen(command, stdout=PIPE, stderr=PIPE, **kwargs)
+        output, error = p.communicate()
+        log.log_process(
+            command, p.returncode, time.monotonic() - start, len(output) + len(error)
+        )
+        if span:
+            span.set_attribute("process.exit_code", p.returncode)
+            span.set_attribute("process.output_bytes", len(output) + len(error))
+            if p.returncode:
+                span.set_error()
+        output = output.decode("utf-8")
+        error = error.decode("utf-8")
 
     return ProcessResponse(output, error, p.returncode)
 
@@ -47,16 +64,38 @@ def run_interactive(command, env=None, skippable=False, log_file=None):
     :param command: The command to run, in array form.
     :param env: A dict of variables to add to the environment.
     """
+    with tracing.span(
+        "subprocess", kind=tracing.SPAN_KIND_CLIENT, **{"process.command_args": command}
+    ) as span:
+        env = profiling.propagation_env(command, tracing.propagation_env(env))
+        response = _run_interactive(command, env, skippable, log_file, span)
+        if span and (response.status_code or response.warning):
+            span.set_error(response.error)
+    return response
+
+
+def _run_interactive(command, env, skippable, log_file, span):
+    """Run the command of :func:`run_interactive`."""
     full_env = environ.copy()  # Need to inherit the global one
     if env:
         for var, val in env.items():
             full_env[var] = val
 
+    stdout = None
+    exit_code = output_bytes = None
+    start = time.monotonic()
     try:
         stdout = open(log_file, "a") if log_file else None
+        log_start = stdout.tell() if stdout else 0
         _ = run(command, check=True, env=full_env, stdout=stdout, stderr=stdout)
+        exit_code = 0
+        if span:
+            span.set_attribute("process.exit_code", 0)
         return ProcessResponse(output=None, error=None, status_code=0)
     except CalledProcessError as e:
+        exit_code = e.returncode
+        if span:
+            span.set_attribute("process.exit_code", e.returncode)
         if skippable:
             return ProcessResponse(
                 output=e.stdout, error=e.stderr, status_code=0, warning=True
@@ -67,4 +106,9 @@ def run_interactive(command, env=None, skippable=False, log_file=None):
             )
     finally:
         if stdout:
+            stdout.seek(0, 2)
+            output_bytes = stdout.tell() - log_start
+            if span:
+                span.set_attribute("process.output_bytes", output_bytes)
             stdout.close()
+        log.log_process(command, exit_code, time.monotonic() - start, output_bytes)
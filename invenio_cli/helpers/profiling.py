@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI profiling helper module.
+
+When enabled, the ``invenio`` commands run in the managed environment are
+wrapped to be profiled: with ``py-spy`` if it is installed (speedscope
+files), with ``cProfile`` otherwise (``.prof`` files). The wrapper only
+profiles the commands given an output file when they are run, named after
+the step running them; the commands whose output is captured and parsed
+are run as they are.
+"""
+
+import itertools
+import re
+import shutil
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+OUTPUT_VARIABLE = "INVENIO_CLI_PROFILE_OUTPUT"
+"""Environment variable giving the wrapped command its output file."""
+
+PROFILE_RUNNER = """\
+import cProfile, os, sys
+from importlib.metadata import entry_points
+py_spy, argv = sys.argv[1], ["invenio", *sys.argv[2:]]
+output = os.environ.pop("INVENIO_CLI_PROFILE_OUTPUT", None)
+if output and py_spy:
+    os.execv(py_spy, [py_spy, "record", "--subprocesses", "--format",
+        "speedscope", "--output", output + ".speedscope.json", "--", *argv])
+eps = entry_points()
+eps = eps.select(group="console_scripts") if hasattr(eps, "select") \
+    else eps.get("console_scripts", [])
+main = next(ep for ep in eps if ep.name == "invenio").load()
+sys.argv = argv
+if not output:
+    sys.exit(main())
+profiler = cProfile.Profile()
+profiler.enable()
+try:
+    status = main()
+finally:
+    profiler.disable()
+    profiler.dump_stats(output + ".prof")
+sys.exit(status)
+"""
+"""Script running ``invenio`` under py-spy (if given first) or cProfile."""
+
+_profile_dir = None
+_counter = itertools.count(1)
+_step_name = ContextVar("profiled_step", default=None)
+
+
+def configure(profile_dir):
+    """Enable the profiling of ``invenio`` commands into ``profile_dir``."""
+    global _profile_dir
+    _profile_dir = Path(profile_dir).resolve() if profile_dir else None
+    if _profile_dir:
+        _profile_dir.mkdir(parents=True, exist_ok=True)
+
+
+def is_enabled():
+    """Whether profiling is enabled."""
+    return _profile_dir is not None
+
+
+def _slug(words):
+    """Return a file name part made of the first words, e.g. ``rdm-records``."""
+    words = [re.sub(r"[^\w.-]+", "_", word).strip("_.") for word in words]
+    return "-".join(word for word in words if word)[:60]
+
+
+@contextmanager
+def step(message):
+    """Name the profiles of the commands run in the block after a step."""
+    token = _step_name.set(_slug((message or "").lower().split()[:4]) or None)
+    try:
+        yield
+    finally:
+        _step_name.reset(token)
+
+
+def _output_name(command):
+    """Name of the profile of a command, e.g. ``03-creating-demo-records``.
+
+    Outside of a step, it is named after its arguments.
+    """
+    args = command[command.index(PROFILE_RUNNER) + 2 :]
+    name = _step_name.get() or _slug([arg for arg in args if arg[:1] != "-"][:3])
+    return f"{next(_counter):02d}-{name or 'invenio'}"
+
+
+def propagation_env(command, env=None):
+    """Return ``env`` with the output file of a profiled command added.
+
+    The commands are numbered in the order they are run.
+    """
+    if not is_enabled() or PROFILE_RUNNER not in command:
+        return env
+    return {**(env or {}), OUTPUT_VARIABLE: str(_profile_dir / _output_name(command))}
+
+
+def profile_command(command):
+    """Wrap an ``invenio`` command to run it under a profiler.
+
+    Other commands, and all commands when profiling is disabled, are
+    returned unchanged.
+
+    :param command: The command, in array form, to run in the environment.
+    """
+    if not is_enabled() or not command or command[0] != "invenio":
+        return list(command)
+
+    py_spy = shutil.which("py-spy") or ""
+    return ["python", "-c", PROFILE_RUNNER, py_spy, *command[1:]]
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI search (OpenSearch/Elasticsearch) helper module."""
+
+import json
+import time
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from .process import ProcessResponse
+
+
+class SearchError(Exception):
+    """Error while talking to the search cluster."""
+
+
+class SearchClient(object):
+    """Minimal client for the search cluster's REST API."""
+
+    def __init__(self, host, port, scheme="http", timeout=30):
+        """Constructor."""
+        self.base_url = f"{scheme}://{host}:{port}"
+        self.timeout = timeout
+
+    def request(self, method, path, body=None, params=None):
+        """Perform a request and return the decoded JSON response."""
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        if params:
+            url += "?" + "&".join(f"{k}={v}" for k, v in params.items())
+
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        request = Request(url, data=data, method=method)
+        request.add_header("Content-Type", "application/json")
+
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                content = response.read()
+        except HTTPError as e:
+            raise SearchError(f"{method} {url}: {e.code} {e.read().decode()}")
+        except (URLError, OSError) as e:
+            raise SearchError(f"{method} {url}: {e}")
+
+        return json.loads(content) if content else {}
+
+    def count(self, index):
+        """Return the number of documents of the given index (pattern)."""
+        response = self.request(
+            "GET", f"{index}/_count", params={"ignore_unavailable": "true"}
+        )
+        return response.get("count", 0)
+
+    def refresh(self, index):
+        """Refresh the given index (pattern), making its documents searchable."""
+        return self.request(
+            "POST", f"{index}/_refresh", params={"ignore_unavailable": "true"}
+        )
+
+    def get_aliases(self, index="*"):
+        """Return the aliases of the indices matching the given pattern."""
+        return self.request(
+            "GET", f"{index}/_alias", params={"ignore_unavailable": "true"}
+        )
+
+    def update_aliases(self, actions):
+        """Apply the given alias actions atomically."""
+        return self.request("POST", "_aliases", body={"actions": actions})
+
+    def delete_templates(self, pattern):
+        """Delete the (legacy and composable) index templates matching pattern."""
+        for endpoint in ("_template", "_index_template"):
+            try:
+                self.request("DELETE", f"{endpoint}/{pattern}")
+            except SearchError:
+                pass
+
+
+def switch_index_generation(client, prefix, new_prefix):
+    """Make the indices created under ``new_prefix`` serve under ``prefix``.
+
+    Every index of the new generation takes over the aliases (without the
+    temporary prefix) of its counterpart in the old generation, and the old
+    index is removed, all in a single atomic ``_aliases`` call. New indices
+    that are empty while their counterpart has documents (e.g. statistics or
+    indices which were not rebuilt) are dropped instead, so the old ones keep
+    serving.
+    """
+    new_state = client.get_aliases(f"{new_prefix}*")
+    old_holders = {}
+    for index, state in client.get_aliases(f"{prefix}*").items():
+        if index.startswith(new_prefix):
+            continue
+        for alias in state.get("aliases", {}):
+            old_holders.setdefault(alias, set()).add(index)
+
+    actions = []
+    switched, kept = [], []
+    for index, state in sorted(new_state.items()):
+        new_aliases = [a for a in state.get("aliases", {}) if a.startswith(new_prefix)]
+        base_aliases = [prefix + a[len(new_prefix) :] for a in new_aliases]
+
+        # the old indices holding all the aliases they share with the new one
+        counterparts = None
+        for alias in base_aliases:
+            if alias in old_holders:
+                holders = old_holders[alias]
+                counterparts = (
+                    holders if counterparts is None else counterparts & holders
+                )
+        counterparts = counterparts or set()
+
+        old_count = sum(client.count(old) for old in counterparts)
+        if old_count and not client.count(index):
+            actions.append({"remove_index": {"index": index}})
+            kept.extend(counterparts)
+            continue
+
+        actions.extend({"remove": {"index": index, "alias": a}} for a in new_aliases)
+        actions.extend({"add": {"index": index, "alias": a}} for a in base_aliases)
+        actions.extend({"remove_index": {"index": old}} for old in sorted(counterparts))
+        switched.append(index)
+
+    if not switched:
+        return ProcessResponse(
+            error=f"No index found under the prefix '{new_prefix}'.", status_code=1
+        )
+
+    try:
+        client.update_aliases(actions)
+    except SearchError as e:
+        return ProcessResponse(error=str(e), status_code=1)
+    client.delete_templates(f"{new_prefix}*")
+
+    output = f"Switched {len(switched)} indices to the new generation."
+    if kept:
+        output += f" Kept (not rebuilt): {', '.join(sorted(set(kept)))}."
+    return ProcessResponse(output=output, status_code=0)
+
+
+class IndexingProgress(object):
+    """Report indexing throughput by polling the document count of indices.
+
+    The expected totals are taken from the indices before they are
+    destroyed, so that an ETA can be given while they are rebuilt.
+    """
+
+    def __init__(self, client, indices, print_func):
+        """Constructor.
+
+        :param client: :class:`SearchClient` instance.
+        :param indices: Dict of label to index name (or pattern).
+        :param print_func: Function used to output the progress.
+        """
+        self.client = client
+        self.indices = indices
+        self.print_func = print_func
+        self.totals = {}
+        self._last = {}
+
+    def snapshot_totals(self, indices=None):
+        """Remember the current document counts as the expected totals.
+
+        :param indices: Dict of label to the index name (or pattern) to count,
+                        if different from the polled ones.
+        """
+        try:
+            self.totals = {
+                label: self.client.count(index)
+                for label, index in (indices or self.indices).items()
+            }
+        except SearchError as e:
+            return ProcessResponse(error=str(e), status_code=1)
+
+        totals = ", ".join(f"{k}: {v}" for k, v in self.totals.items())
+        return ProcessResponse(output=f"Documents to reindex ({totals}).")
+
+    def __call__(self):
+        """Poll the counts and print docs/s and ETA for every index."""
+        now = time.monotonic()
+        for label, index in self.indices.items():
+            try:
+                count = self.client.count(index)
+            except SearchError:
+                continue
+
+            last_time, last_count = self._last.get(label, (now, count))
+            self._last[label] = (now, count)
+            elapsed = now - last_time
+            rate = (count - last_count) / elapsed if elapsed > 0 else 0
+
+            message = f"{label}: {count}"
+            total = self.totals.get(label)
+            if total:
+                message += f"/{total} docs"
+            else:
+                message += " docs"
+            message += f" ({rate:.0f} docs/s"
+            if total and rate > 0 and count < total:
+                message += f", ETA {(total - count) / rate:.0f}s"
+            message += ")"
+            self.print_func(message)
+
+
+SNAPSHOT_REPOSITORY = "invenio-cli"
+"""Name of the snapshot repository registered by the CLI."""
+
+SNAPSHOT_CONTAINER_PATH = "/mnt/invenio-cli-snapshots"
+"""Path of the snapshot repository in the search container."""
+
+
+def register_snapshot_repository(client, location=SNAPSHOT_CONTAINER_PATH):
+    """Register (or update) the CLI ``fs`` snapshot repository."""
+    return client.request(
+        "PUT",
+        f"_snapshot/{SNAPSHOT_REPOSITORY}",
+        body={"type": "fs", "settings": {"location": location}},
+    )
+
+
+def list_snapshots(client):
+    """Return the snapshots of the CLI repository."""
+    response = client.request("GET", f"_snapshot/{SNAPSHOT_REPOSITORY}/_all")
+    return response.get("snapshots", [])
+
+
+def snapshot_size(client, snapshot):
+    """Return the size in bytes of the files of a snapshot."""
+    response = client.request(
+        "GET", f"_snapshot/{SNAPSHOT_REPOSITORY}/{snapshot}/_status"
+    )
+    stats = response["snapshots"][0]["stats"]
+    if "total" in stats:
+        return stats["total"]["size_in_bytes"]
+    # Elasticsearch < 7.4
+    return stats.get("total_size_in_bytes", 0)
+
+
+def _take_snapshot(client, path, indices):
+    """Snapshot indices at the given path, replacing the snapshot there."""
+    try:
+        client.request("DELETE", path)
+    except SearchError:
+        pass  # no such snapshot yet
+    response = client.request(
+        "PUT",
+        path,
+        body={"indices": indices, "include_global_state": False},
+        params={"wait_for_completion": "true"},
+    )
+    return response["snapshot"]
+
+
+def create_snapshot(client, snapshot, indices):
+    """Snapshot indices, replacing the snapshot of the same name.
+
+    The indices are first snapshotted under a temporary name, the previous
+    snapshot being only replaced once it succeeded. Snapshots are
+    incremental, taking the final one again is then quick.
+
+    :param indices: Index pattern, e.g. ``"*,-.*"``.
+    :returns: The description of the snapshot.
+    """
+    path = f"_snapshot/{SNAPSHOT_REPOSITORY}/{snapshot}"
+    tmp_path = f"{path}-new"
+    description = _take_snapshot(client, tmp_path, indices)
+    if description.get("state") == "SUCCESS":
+        description = _take_snapshot(client, path, indices)
+        if description.get("state") == "SUCCESS":
+            client.request("DELETE", tmp_path)
+    return description
+
+
+def restore_snapshot(client, snapshot, indices):
+    """Replace the indices of an instance by their state in a snapshot.
+
+    All the current indices of the instance are deleted first, not only the
+    ones of the snapshot, so that no alias is left pointing to both an index
+    created since and a restored one.
+
+    :param indices: Index pattern of the instance, e.g. ``"site-*"``.
+    :returns: The description of the restored snapshot.
+    """
+    path = f"_snapshot/{SNAPSHOT_REPOSITORY}/{snapshot}"
+    (description,) = client.request("GET", path)["snapshots"]
+    current = set(client.get_aliases(indices)) | set(description["indices"])
+    if current:
+        # open indices cannot be restored over
+        client.request(
+            "DELETE", ",".join(sorted(current)), params={"ignore_unavailable": "true"}
+        )
+    client.request(
+        "POST",
+        f"{path}/_restore",
+        body={"indices": ",".join(description["indices"]), "include_aliases": True},
+        params={"wait_for_completion": "true"},
+    )
+    return description
+
+
+def instance_indices(prefix):
+    """Pattern of the indices of an instance, all but the hidden ones if no prefix."""
+    return f"{prefix}*" if prefix else "*,-.*"
+
+
+BULK_INDEXING_SETTINGS = {
+    "index.refresh_interval": "-1",
+    "index.number_of_replicas": 0,
+}
+"""Index settings making bulk indexing faster, restored after it."""
+
+
+class BulkIndexingSettings(object):
+    """Apply the bulk indexing settings to indices, then restore them.
+
+    The settings of every index are remembered before they are changed, an
+    index without an explicit value getting back the cluster's default.
+    """
+
+    def __init__(self, client, indices):
+        """Constructor.
+
+        :param client: :class:`SearchClient` instance.
+        :param indices: Index name or pattern, e.g. ``"site-*"``, or a
+                        function returning it, called when they are applied.
+        """
+        self.client = client
+        self.indices = indices
+        self.original = {}
+
+    def apply(self):
+        """Apply the bulk indexing settings to the existing indices.
+
+        A failure is only a warning, the indexing then being slower.
+        """
+        indices = self.indices() if callable(self.indices) else self.indices
+        try:
+            response = self.client.request(
+                "GET",
+                f"{indices}/_settings",
+                params={"flat_settings": "true", "ignore_unavailable": "true"},
+            )
+            self.original = {
+                index: {
+                    key: state["settings"].get(key) for key in BULK_INDEXING_SETTINGS
+                }
+                for index, state in response.items()
+            }
+            if self.original:
+                self.client.request(
+                    "PUT",
+                    f"{','.join(sorted(self.original))}/_settings",
+                    body=BULK_INDEXING_SETTINGS,
+                )
+        except SearchError as e:
+            self.original = {}
+            return ProcessResponse(
+                error=f"Bulk indexing settings not applied: {e}",
+                status_code=0,
+                warning=True,
+            )
+
+        return ProcessResponse(
+            output=f"Bulk indexing settings applied to {len(self.original)} indices.",
+            status_code=0,
+        )
+
+    def restore(self):
+        """Restore the settings of the indices and refresh them."""
+        # indices sharing the same settings are updated at once
+        groups = {}
+        for index, settings in sorted(self.original.items()):
+            groups.setdefault(tuple(settings.items()), []).append(index)
+
+        errors = []
+        for settings, indices in groups.items():
+            try:
+                self.client.request(
+                    "PUT", f"{','.join(indices)}/_settings", body=dict(settings)
+                )
+            except SearchError as e:
+                errors.append(str(e))
+        if self.original:
+            try:
+                self.client.request(
+                    "POST",
+                    f"{','.join(sorted(self.original))}/_refresh",
+                    params={"ignore_unavailable": "true"},
+                )
+            except SearchError as e:
+                errors.append(str(e))
+
+        if errors:
+            return ProcessResponse(
+                error="Index settings not restored: " + "; ".join(errors),
+                status_code=1,
+            )
+        count = len(self.original)
+        self.original = {}
+        return ProcessResponse(
+            output=f"Index settings restored and {count} indices refreshed.",
+            status_code=0,
+        )
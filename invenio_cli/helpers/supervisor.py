@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI process supervisor."""
+
+import os
+import signal
+import threading
+import time
+from subprocess import PIPE, STDOUT
+from subprocess import Popen as popen
+
+import click
+
+COLORS = ["cyan", "magenta", "blue", "yellow", "green", "bright_cyan"]
+
+
+class SupervisedProcess(object):
+    """A child process managed by the :class:`Supervisor`."""
+
+    def __init__(self, name, command, env=None, color="cyan"):
+        """Constructor."""
+        self.name = name
+        self.command = command
+        self.env = env
+        self.color = color
+        self.proc = None
+        self.reader = None
+        self.started_at = None
+        self.restarts = 0
+        self.backoff = 0
+        self.restart_at = None
+
+    @property
+    def running(self):
+        """Whether the process is alive."""
+        return self.proc is not None and self.proc.poll() is None
+
+
+class Supervisor(object):
+    """Run several processes, restart them when they crash and multiplex logs.
+
+    Every child is started in its own process group with its output piped,
+    each line being prefixed with the name of the process. Crashed children
+    are restarted with an exponential backoff, which is reset once they ran
+    for ``stable_after`` seconds. On SIGINT/SIGTERM the process groups are
+    terminated, and killed if they do not exit within ``stop_timeout``.
+    """
+
+    def __init__(
+        self,
+        max_backoff=60,
+        stable_after=30,
+        stop_timeout=10,
+        max_restarts=None,
+        poll_interval=0.5,
+    ):
+        """Constructor."""
+        self.max_backoff = max_backoff
+        self.stable_after = stable_after
+        self.stop_timeout = stop_timeout
+        self.max_restarts = max_restarts
+        self.poll_interval = poll_interval
+        self.processes = []
+        self._stopping = threading.Event()
+        self._output_lock = threading.Lock()
+        self._width = 0
+
+    def add(self, name, command, env=None):
+        """Register a process to supervise."""
+        color = COLORS[len(self.processes) % len(COLORS)]
+        self.processes.append(SupervisedProcess(name, command, env, color))
+        self._width = max(self._width, len(name))
+
+    def _echo(self, name, line, color, err=False):
+        """Output a line prefixed with the process name."""
+        prefix = click.style(f"{name.ljust(self._width)} |", fg=color)
+        with self._output_lock:
+            click.echo(f"{prefix} {line}", err=err)
+
+    def _pipe_output(self, process, stream):
+        """Forward the output of a process line by line."""
+        for raw_line in iter(stream.readline, b""):
+            line = raw_line.decode("utf-8", errors="replace").rstrip("\n")
+            self._echo(process.name, line, process.color)
+        stream.close()
+
+    def _start(self, process):
+        """Start (or restart) a process in its own process group."""
+        env = dict(process.env or os.environ)
+        env.setdefault("PYTHONUNBUFFERED", "1")
+        process.proc = popen(
+            process.command,
+            env=env,
+            stdout=PIPE,
+            stderr=STDOUT,
+            start_new_session=True,
+        )
+        process.started_at = time.monotonic()
+        process.restart_at = None
+        process.reader = threading.Thread(
+            target=self._pipe_output,
+            args=(process, process.proc.stdout),
+            daemon=True,
+        )
+        process.reader.start()
+        self._echo(process.name, f"started (pid {process.proc.pid})", "green")
+
+    def _handle_exit(self, process):
+        """Schedule the restart of a process that exited."""
+        code = process.proc.returncode
+        uptime = time.monotonic() - process.started_at
+        if uptime >= self.stable_after:
+            process.backoff = 0
+
+        if self.max_restarts is not None and process.restarts >= self.max_restarts:
+            self._echo(
+                process.name, f"exited with code {code}, giving up", "red", err=True
+            )
+            return False
+
+        process.backoff = min(max(1, process.backoff * 2), self.max_backoff)
+        process.restarts += 1
+        process.restart_at = time.monotonic() + process.backoff
+        self._echo(
+            process.name,
+            f"exited with code {code}, restarting in {process.backoff}s",
+            "red",
+            err=True,
+        )
+        return True
+
+    def _signal_group(self, process, sig):
+        """Send a signal to the process group of a child."""
+        try:
+            os.killpg(process.proc.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def stop(self, *args):
+        """Request the supervisor to stop all processes."""
+        self._stopping.set()
+
+    def _shutdown(self):
+        """Terminate all process groups, kill them if they do not exit."""
+        alive = [p for p in self.processes if p.running]
+        for process in alive:
+            self._echo(process.name, "stopping...", "yellow")
+            self._signal_group(process, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.stop_timeout
+        while any(p.running for p in alive) and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+        for process in alive:
+            if process.running:
+                self._echo(process.name, "killed", "red", err=True)
+                self._signal_group(process, signal.SIGKILL)
+            process.proc.wait()
+            self._echo(process.name, "stopped", "green")
+
+        # flush what is left of the output
+        for process in self.processes:
+            if process.reader:
+                process.reader.join(timeout=1)
+
+    def run(self):
+        """Start all processes and watch them until stopped.
+
+        :returns: 0 when stopped by a signal, 1 when a process gave up.
+        """
+        previous = {
+            sig: signal.signal(sig, self.stop)
+            for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        exit_code = 0
+        try:
+            for process in self.processes:
+                self._start(process)
+
+            while not self._stopping.wait(self.poll_interval):
+                now = time.monotonic()
+                for process in self.processes:
+                    if process.restart_at is not None:
+                        if now >= process.restart_at:
+                            self._start(process)
+                    elif not process.running:
+                        if not self._handle_exit(process):
+                            exit_code = 1
+                            self.stop()
+        finally:
+            self._shutdown()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+        return exit_code
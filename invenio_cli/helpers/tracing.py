@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2026 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio CLI tracing helper module.
+
+Spans follow the OpenTelemetry data model and are written, once the
+command finished, as one OTLP/JSON ``TracesData`` object per line of the
+trace file. No collector nor OpenTelemetry package is needed. Tracing is
+disabled (and free) unless :func:`configure` was called.
+"""
+
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+
+from .. import __version__
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+_current_span = ContextVar("invenio_cli_current_span", default=None)
+_trace_file = None
+_finished = []
+_lock = Lock()
+
+
+class Span(object):
+    """A timed operation, part of a trace."""
+
+    def __init__(self, name, trace_id, parent_span_id=None, kind=SPAN_KIND_INTERNAL):
+        """Constructor."""
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes = {}
+        self.status_code = STATUS_CODE_OK
+        self.status_message = None
+        self.start_time = time.time_ns()
+        self.end_time = None
+
+    @property
+    def traceparent(self):
+        """W3C trace context of the span, for child processes."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key, value):
+        """Set an attribute, ``None`` values are ignored."""
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, message=None):
+        """Mark the span as failed."""
+        self.status_code = STATUS_CODE_ERROR
+        self.status_message = message
+
+    def set_exception(self, e):
+        """Mark the span as failed by an exception, unless a successful exit."""
+        if isinstance(e, SystemExit) and not e.code:
+            return
+        if getattr(e, "exit_code", None) == 0:  # e.g. click's Exit
+            return
+        self.set_error(f"{e.__class__.__name__}: {e}")
+
+    def to_otlp(self):
+        """Return the OTLP/JSON representation of the span."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": [
+                {"key": k, "value": _otlp_value(v)} for k, v in self.attributes.items()
+            ],
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+def _otlp_value(value):
+    """Return the OTLP/JSON ``AnyValue`` of an attribute value."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def configure(trace_file):
+    """Enable tracing, the spans being exported to ``trace_file``."""
+    global _trace_file
+    _trace_file = trace_file
+
+
+def is_enabled():
+    """Whether tracing is enabled."""
+    return _trace_file is not None
+
+
+def current_span():
+    """Return the active span, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name, kind=SPAN_KIND_INTERNAL, **attributes):
+    """Trace the enclosed block in a child span of the active one.
+
+    The root span continues the trace given in the ``TRACEPARENT``
+    environment variable, if any. Yields ``None`` when tracing is disabled.
+    """
+    if not is_enabled():
+        yield None
+        return
+
+    parent = _current_span.get()
+    if parent:
+        trace_id, parent_span_id = parent.trace_id, parent.span_id
+    else:
+        match = _TRACEPARENT_RE.match(os.environ.get("TRACEPARENT", ""))
+        trace_id, parent_span_id = match.groups() if match else (None, None)
+
+    new_span = Span(name, trace_id or os.urandom(16).hex(), parent_span_id, kind)
+    for key, value in attributes.items():
+        new_span.set_attribute(key, value)
+
+    token = _current_span.set(new_span)
+    try:
+        yield new_span
+    except BaseException as e:
+        new_span.set_exception(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        new_span.end_time = time.time_ns()
+        with _lock:
+            _finished.append(new_span)
+
+
+def propagation_env(env=None):
+    """Return ``env`` with the ``TRACEPARENT`` of the active span added.
+
+    :param env: Dict of environment variables, or ``None``.
+    """
+    active = _current_span.get()
+    if not active:
+        return env
+    return {**(env or {}), "TRACEPARENT": active.traceparent}
+
+
+def flush():
+    """Append the finished spans to the trace file."""
+    with _lock:
+        spans = list(_finished)
+        _finished.clear()
+    if not spans or not is_enabled():
+        return
+
+    resource = {
+        "service.name": "invenio-cli",
+        "service.version": __version__,
+        "process.pid": os.getpid(),
+    }
+    traces_data = {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": k, "value": _otlp_value(v)} for k, v in resource.items()
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "invenio_cli", "version": __version__},
+                        "spans": [s.to_otlp() for s in spans],
+                    }
+                ],
+            }
+        ]
+    }
+    with open(_trace_file, "a") as trace_file:
+        trace_file.write(json.dumps(traces_data) + "\n")
@@ -29,11 +29,12 @@ def mock_cli_config():
                 return ["pipenv", "run"] + list(args)
 
             self.python_package_manager.run_command.side_effect = mock_run_command
+            self.python_package_manager.venv.return_value = None
 
         def get_project_dir(self):
             return Path("project_dir")
 
-        def get_instance_path(self):
+        def get_instance_path(self, throw=True):
             return Path("instance_dir")
 
         def get_services_setup(self):
@@ -51,6 +52,24 @@ def mock_cli_config():
         def get_file_storage(self):
             return "local"
 
+        def get_compose_override_files(self):
+            return []
+
+        def get_search_host(self):
+            return "localhost"
+
+        def get_registry_mirror(self):
+            return None
+
+        def get_search_port(self):
+            return "9200"
+
+        def get_search_index_prefix(self):
+            return None
+
+        def get_services_profile(self):
+            return None
+
     return MockCLIConfig()
 
 
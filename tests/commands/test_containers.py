@@ -9,11 +9,15 @@
 """Module commands/containers.py's tests."""
 
 from pathlib import Path
-from unittest.mock import call, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
+import yaml
 
-from invenio_cli.commands import ContainersCommands
+from invenio_cli.commands import ContainersCommands, ServicesCommands
+from invenio_cli.commands.steps import ContextStep
+from invenio_cli.helpers.images import FINGERPRINT_LABEL, build_fingerprint
+from invenio_cli.helpers.process import ProcessResponse
 
 
 @pytest.fixture(scope="function")
@@ -225,3 +229,185 @@ def test_demo(p_run_cmd, p_docker_helper, mock_cli_config):
     assert commands.docker_helper.execute_cli_command.mock_calls == [
         call("project-shortname", "invenio rdm-records demo")
     ]
+
+
+@patch("invenio_cli.commands.services.ils_version", lambda: None)
+@patch("invenio_cli.commands.services.rdm_version", lambda: [12, 0, 0])
+def test_setup_plan(mock_cli_config, expected_force_calls):
+    """Test the setup steps run in the containers."""
+    commands = ContainersCommands(mock_cli_config, Mock())
+    steps = commands.setup(force=True, demo_data=True, services=False)
+    for step in steps:
+        # the search cluster is not tuned for the bulk steps, only run them
+        for inner_step in getattr(step, "steps", [step]):
+            inner_step.func(**inner_step.args)
+
+    mock_calls = [
+        call(*c.kwargs.values())
+        for c in commands.docker_helper.execute_cli_command.mock_calls
+    ]
+    assert mock_calls[:6] == expected_force_calls + [
+        call("project-shortname", "invenio db init create"),
+        call(
+            "project-shortname",
+            "invenio files location create --default default-location ${INVENIO_INSTANCE_PATH}/data",  # noqa
+        ),
+    ]
+    assert mock_calls[-4:] == [
+        call("project-shortname", "invenio queues declare"),
+        call("project-shortname", "invenio rdm-records fixtures"),
+        call("project-shortname", "invenio index run --raise-on-error"),
+        call("project-shortname", "invenio rdm-records demo"),
+    ]
+    assert mock_cli_config.services_setup is True
+    bulk_steps = [step for step in steps if isinstance(step, ContextStep)]
+    # the queued documents are indexed before the settings are restored
+    assert [[s.message for s in step.steps] for step in bulk_steps] == [
+        ["Creating rdm fixtures...", "Indexing the queued documents..."],
+        ["Creating records fixtures...", "Indexing the queued documents..."],
+    ]
+
+
+@patch("invenio_cli.commands.services.ils_version", lambda: [2, 0, 0])
+@patch("invenio_cli.commands.services.rdm_version", lambda: None)
+def test_setup_plan_ils(mock_cli_config):
+    """Test the setup of ILS containers, whatever the local services status."""
+    mock_cli_config.services_setup = True
+    commands = ContainersCommands(mock_cli_config, Mock())
+    steps = commands.setup(force=True, demo_data=False, services=False)
+
+    # the cleanup steps are skippable, like the ones of the local services
+    assert all(step.skippable for step in steps[:4])
+    assert "Checking services are not setup..." not in [s.message for s in steps]
+    commands_run = [step.args.get("command") for step in steps]
+    assert "invenio setup --verbose --skip-demo-data" in commands_run
+
+
+def test_single_commands(mock_cli_config):
+    """Test the steps of the single setup commands."""
+    commands = ContainersCommands(mock_cli_config, Mock())
+
+    (step,) = commands.fixtures("other-shortname")
+    assert step.args == {
+        "project_shortname": "other-shortname",
+        "command": "invenio rdm-records fixtures",
+    }
+    (step,) = commands.declare_queues()
+    assert step.args["project_shortname"] == "project-shortname"
+    (step,) = ServicesCommands(mock_cli_config, Mock()).rdm_fixtures()
+    assert step.cmd == ["pipenv", "run", "invenio", "rdm", "fixtures"]
+
+
+def test_translations(mock_cli_config):
+    """Test the translations are compiled with the container's environment."""
+    # e.g. a direct command of the host's virtualenv
+    mock_cli_config.python_package_manager.run_command.side_effect = lambda *args: [
+        "sh",
+        "-c",
+        'export VIRTUAL_ENV="$0"; exec "$@"',
+        "/host/project/.venv",
+        *args,
+    ]
+    commands = ContainersCommands(mock_cli_config, Mock())
+
+    (step,) = commands.translations()
+    assert step.args["command"] == (
+        "pybabel compile --directory=${INVENIO_INSTANCE_PATH}/translations"
+    )
+    (step,) = commands.translations(fuzzy=True)
+    assert step.args["command"].endswith(" --use-fuzzy")
+    assert "/host/project" not in step.args["command"]
+
+
+def test_db_template(mock_cli_config):
+    commands = ContainersCommands(mock_cli_config, Mock())
+    # the database of the db service, not named after the project
+    commands.docker_helper.service_environment.return_value = {
+        "POSTGRES_USER": "invenio",
+        "POSTGRES_DB": "site",
+    }
+    exec_service = commands.docker_helper.exec_service
+    exec_service.return_value = ProcessResponse(output="", status_code=0)
+
+    assert commands.restore_db_template().status_code == 1
+    exec_service.assert_called_once()
+
+    exec_service.return_value = ProcessResponse(output="1", status_code=0)
+    assert commands.restore_db_template().status_code == 0
+    service, command = exec_service.call_args.args
+    statements = command[command.index("--command") + 1 :: 2]
+    assert service == "db"
+    assert command[command.index("--username") + 1] == "invenio"
+    assert statements == [
+        "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+        "WHERE datname IN ('site_template', 'site') "
+        "AND pid <> pg_backend_pid()",
+        'DROP DATABASE IF EXISTS "site"',
+        'CREATE DATABASE "site" TEMPLATE "site_template"',
+    ]
+
+    mock_cli_config.get_db_type = lambda: "mysql"
+    assert commands.save_db_template().status_code == 1
+
+
+def test_image_cache(mock_cli_config, tmp_path):
+    mock_cli_config.get_cache_dir = lambda: tmp_path
+    commands = ContainersCommands(mock_cli_config, Mock())
+    docker_helper = commands.docker_helper
+    docker_helper.project_images.return_value = ["my-site", "postgres:14"]
+    docker_helper.image_id.side_effect = lambda image: {"my-site": "sha256:2"}.get(
+        image
+    )
+
+    steps = commands.image_cache("save")
+    assert [step.message for step in steps] == [
+        "Checking for zstd...",
+        "Saving my-site...",
+        "Saving postgres:14...",
+    ]
+    image_cache = steps[1].args["image_cache"]
+    assert image_cache.directory == tmp_path / "images"
+    image_cache.save = Mock(return_value=ProcessResponse(status_code=0))
+    steps[1].execute()
+    image_cache.save.assert_called_once_with("my-site", "sha256:2")
+    assert steps[2].execute().warning  # not present
+
+    image_cache.is_saved = Mock(return_value=True)
+    assert steps[1].execute().output == "my-site is up to date."
+
+
+def test_build_images(mock_cli_config, tmp_path):
+    mock_cli_config.get_cache_dir = lambda: tmp_path / ".invenio.cache"
+    commands = ContainersCommands(mock_cli_config, Mock())
+    docker_helper = commands.docker_helper
+    services = {
+        "web-ui": {"image": "my-site", "build": {"context": str(tmp_path)}},
+        "frontend": {"image": "my-site-frontend", "build": {"context": "nginx"}},
+    }
+    fingerprint = build_fingerprint(services["web-ui"]["build"])
+    labels = {"my-site": {FINGERPRINT_LABEL: fingerprint}}
+    docker_helper.image_labels.side_effect = lambda image: labels.get(image, {})
+
+    with patch("invenio_cli.commands.containers.built_services", lambda f: services):
+        commands.build_images(pull=False, layer_cache_dir=tmp_path / "layers")
+        kwargs = docker_helper.build_images.call_args.kwargs
+        assert kwargs["services"] == ["frontend"]
+        build_file = yaml.safe_load(kwargs["build_files"][0].read_text())
+        assert list(build_file["services"]) == ["frontend"]
+        assert build_file["services"]["frontend"]["build"]["cache_to"] == [
+            f"type=local,dest={tmp_path / 'layers' / 'frontend'},mode=max"
+        ]
+
+        labels["my-site-frontend"] = {
+            FINGERPRINT_LABEL: build_fingerprint(services["frontend"]["build"])
+        }
+        docker_helper.build_images.reset_mock()
+        response = commands.build_images()
+        assert response.output == "The images are up to date, nothing to build."
+        docker_helper.build_images.assert_not_called()
+
+        commands.build_images(cache=False)
+        assert docker_helper.build_images.call_args.kwargs["services"] == [
+            "web-ui",
+            "frontend",
+        ]
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module commands/doctor.py's tests."""
+
+import os
+from unittest.mock import patch
+
+from invenio_cli.commands import DoctorCommands
+from invenio_cli.helpers.doctor import (
+    OK,
+    UNKNOWN,
+    WARNING,
+    available_cpus,
+    max_map_count,
+    write_throughput,
+)
+
+
+@patch("invenio_cli.commands.doctor.doctor")
+def test_perf(p_doctor, mock_cli_config, tmp_path):
+    p_doctor.max_map_count.return_value = 65530
+    p_doctor.docker_info.return_value = {
+        "MemTotal": 16 * 2**30,
+        "NCPU": 2,
+        "DockerRootDir": str(tmp_path / "docker"),
+    }
+    p_doctor.write_throughput.return_value = 500 * 2**20
+    p_doctor.available_cpus.return_value = 8
+    mock_cli_config.get_instance_path = lambda throw: tmp_path
+
+    checks = {check.name: check for check in DoctorCommands(mock_cli_config).perf()}
+
+    assert checks["vm.max_map_count"].status == WARNING
+    assert "vm.max_map_count=262144" in checks["vm.max_map_count"].recommendation
+    assert checks["docker.memory"].status == OK
+    assert checks["docker.cpus"].status == WARNING
+    assert checks["disk.instance.write"].value == 500 * 2**20
+    # the docker root directory is not on this host (e.g. in a VM)
+    assert checks["disk.docker"].status == UNKNOWN
+    assert checks["celery.cpus"].status == OK
+
+
+def test_max_map_count(tmp_path):
+    path = tmp_path / "max_map_count"
+    path.write_text("262144\n")
+    assert max_map_count(path) == 262144
+    assert max_map_count(tmp_path / "missing") is None
+
+
+@patch("invenio_cli.helpers.doctor.os.sched_getaffinity", lambda pid: {0, 1, 2, 3})
+def test_available_cpus(tmp_path):
+    assert available_cpus(tmp_path) == 4
+
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert available_cpus(tmp_path) == 4
+
+    # CPU quota of a CI container
+    (tmp_path / "cpu.max").write_text("200000 100000\n")
+    assert available_cpus(tmp_path) == 2
+
+
+def test_write_throughput(tmp_path):
+    assert write_throughput(tmp_path, size=2**20, chunk_size=2**18) > 0
+    assert os.listdir(tmp_path) == []
+    assert write_throughput(tmp_path / "missing") is None
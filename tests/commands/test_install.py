@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module commands/install.py's tests."""
+
+from unittest.mock import Mock, patch
+
+from invenio_cli.commands import InstallCommands
+from invenio_cli.helpers.process import ProcessResponse
+
+
+@patch("invenio_cli.commands.install.run_cmd")
+def test_update_instance_path(p_run_cmd, mock_cli_config):
+    p_run_cmd.return_value = ProcessResponse(output="/venv/var/instance\n")
+    pkg_man = mock_cli_config.python_package_manager
+    pkg_man.environment_key.return_value = "/venv"
+    mock_cli_config.get_instance_path_key = Mock(return_value=None)
+    mock_cli_config.update_instance_path = Mock()
+    commands = InstallCommands(mock_cli_config)
+
+    assert commands.update_instance_path().status_code == 0
+    # computed by the virtualenv's python, without booting the app
+    assert p_run_cmd.call_count == 1
+    assert p_run_cmd.call_args.args[0][:4] == ["pipenv", "run", "python", "-c"]
+    mock_cli_config.update_instance_path.assert_called_with(
+        "/venv/var/instance", key="/venv:"
+    )
+
+    # cached as long as the virtualenv does not change
+    mock_cli_config.get_instance_path_key.return_value = "/venv:"
+    assert commands.update_instance_path().output == "Instance path up to date."
+    assert p_run_cmd.call_count == 1
+
+
+@patch("invenio_cli.commands.install.run_cmd")
+def test_update_instance_path_app_fallback(p_run_cmd, mock_cli_config):
+    p_run_cmd.side_effect = [
+        ProcessResponse(status_code=3),
+        ProcessResponse(output="/custom/instance"),
+    ]
+    mock_cli_config.python_package_manager.environment_key.return_value = None
+    mock_cli_config.update_instance_path = Mock()
+
+    assert InstallCommands(mock_cli_config).update_instance_path().status_code == 0
+    assert p_run_cmd.call_args.args[0][2:4] == ["invenio", "shell"]
+    mock_cli_config.update_instance_path.assert_called_with(
+        "/custom/instance", key=None
+    )
@@ -16,6 +16,7 @@ import pytest
 from click import UsageError
 
 from invenio_cli.commands import LocalCommands
+from invenio_cli.commands.local import parse_queue_pool
 
 
 @pytest.mark.skip()
@@ -451,3 +452,127 @@ def test_run_worker_version_below_13(p_popen, p_rdm_version, mock_cli_config):
     assert "worker" in called_command
     assert "--beat" in called_command
     assert "--scheduler" not in called_command
+
+
+@patch("invenio_cli.commands.local.rdm_version")
+@patch("invenio_cli.commands.local.popen")
+def test_run_worker_scaling(p_popen, p_rdm_version, mock_cli_config):
+    """Test run_worker with dedicated queue pools and a separate beat."""
+    commands = LocalCommands(mock_cli_config)
+    p_popen.return_value = MagicMock()
+    p_rdm_version.return_value = [12, 0, 0]
+
+    result = commands.run_worker(
+        autoscale=(2, 8),
+        pool="prefork",
+        queue_pools=[parse_queue_pool("low:2")],
+        separate_beat=True,
+    )
+
+    assert len(result) == 3
+    default, low, beat = [call[0][0] for call in p_popen.call_args_list]
+    assert "--beat" not in default
+    assert default[default.index("--queues") + 1] == "celery"
+    assert default[default.index("--autoscale") + 1] == "8,2"
+    assert default[default.index("--pool") + 1] == "prefork"
+    assert low[low.index("--hostname") + 1] == "worker-low@%h"
+    assert low[low.index("--queues") + 1] == "low"
+    assert low[low.index("--concurrency") + 1] == "2"
+    assert "beat" in beat and "--scheduler" not in beat
+
+    # Celery ignores --autoscale with the other pools
+    with pytest.raises(UsageError):
+        commands.run_worker(autoscale=(2, 8), pool="threads")
+
+
+@patch("invenio_cli.commands.local.os.cpu_count", return_value=8)
+def test_worker_commands_concurrency(p_cpu_count, mock_cli_config):
+    """Test the CPU cores are shared by the process pools without a concurrency."""
+    commands = LocalCommands(mock_cli_config)
+
+    def concurrencies(**worker_options):
+        return {
+            name: (
+                command[command.index("--concurrency") + 1]
+                if "--concurrency" in command
+                else None
+            )
+            for name, command in commands._worker_commands(**worker_options)
+        }
+
+    assert concurrencies() == {"worker": "8"}
+    assert concurrencies(queue_pools=[parse_queue_pool("low")]) == {
+        "worker": "4",
+        "worker-low": "4",
+    }
+    assert concurrencies(queue_pools=[parse_queue_pool("low:2")]) == {
+        "worker": "8",
+        "worker-low": "2",
+    }
+    assert concurrencies(concurrency=3, queue_pools=[parse_queue_pool("low")]) == {
+        "worker": "3",
+        "worker-low": "3",
+    }
+
+    # the thread pools are left to the celery default
+    assert concurrencies(pool="solo") == {"worker": "8"}
+    assert concurrencies(pool="threads") == {"worker": None}
+    assert concurrencies(pool="gevent", queue_pools=[parse_queue_pool("low:50")]) == {
+        "worker": None,
+        "worker-low": "50",
+    }
+    assert concurrencies(pool="eventlet", concurrency=100) == {"worker": "100"}
+
+
+def test_parse_queue_pool():
+    """Test the parsing of queue pool definitions."""
+    assert parse_queue_pool("low") == (["low"], None)
+    assert parse_queue_pool("low,bulk:4") == (["low", "bulk"], 4)
+    with pytest.raises(ValueError):
+        parse_queue_pool(":4")
+    with pytest.raises(ValueError):
+        parse_queue_pool("low:0")
+
+
+@patch("invenio_cli.commands.local.popen")
+def test_run_web_gunicorn(p_popen, mock_cli_config):
+    """Test run_web with the gunicorn server."""
+    commands = LocalCommands(mock_cli_config)
+
+    commands.run_web("127.0.0.1", "5000", server="gunicorn", workers=4, threads=2)
+
+    command = p_popen.call_args[0][0]
+    env = p_popen.call_args[1]["env"]
+    assert command[:3] == ["pipenv", "run", "gunicorn"]
+    assert "invenio_app.wsgi:application" in command
+    assert command[command.index("--bind") + 1] == "127.0.0.1:5000"
+    assert command[command.index("--workers") + 1] == "4"
+    assert command[command.index("--threads") + 1] == "2"
+    assert "--preload" in command
+    assert env["FLASK_DEBUG"] == "0"
+
+
+def test_webpack_project_files_editable(tmp_path, mock_cli_config):
+    site_dir = tmp_path / "venv" / "lib" / "python3.12" / "site-packages"
+    dist_info = site_dir / "invenio_app_rdm-13.0.0.dist-info"
+    dist_info.mkdir(parents=True)
+    source = tmp_path / "src" / "invenio-app-rdm"
+    (source / "invenio_app_rdm" / "theme" / "assets" / "js").mkdir(parents=True)
+    (source / "invenio_app_rdm" / "theme" / "webpack.py").write_text("theme = {}")
+    (source / "node_modules" / "dep" / "assets").mkdir(parents=True)
+    (dist_info / "direct_url.json").write_text(
+        f'{{"url": "{source.as_uri()}", "dir_info": {{"editable": true}}}}'
+    )
+    mock_cli_config.python_package_manager.venv = Mock(
+        return_value={"path": str(tmp_path / "venv")}
+    )
+    mock_cli_config.get_instance_path = Mock(return_value=tmp_path / "instance")
+
+    inputs, outputs = LocalCommands(mock_cli_config)._webpack_project_files()
+
+    theme = source / "invenio_app_rdm" / "theme"
+    assert inputs[0] == dist_info
+    assert theme / "webpack.py" in inputs
+    assert theme / "assets" in inputs
+    assert not any("node_modules" in str(path) for path in inputs)
+    assert outputs == [tmp_path / "instance" / "assets" / "package.json"]
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module commands/services.py's tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from invenio_cli.commands import ServicesCommands
+from invenio_cli.errors import InvenioCLIConfigError
+from invenio_cli.helpers.process import ProcessResponse
+
+
+def test_apply_profile(mock_cli_config, tmp_path):
+    mock_cli_config.get_cache_dir = lambda: tmp_path
+    mock_cli_config.get_search_type = lambda: "opensearch2"
+    mock_cli_config.update_services_profile = Mock()
+    mock_cli_config.services_setup = True
+    commands = ServicesCommands(mock_cli_config, Mock(override_files=[]))
+
+    steps = commands.start(profile="fast")
+    assert steps[0].args == {"profile": "fast"}
+    steps[0].execute()
+
+    override_file = tmp_path / "compose" / "profile.yml"
+    assert override_file.exists()
+    assert commands.docker_helper.override_files == [override_file]
+    mock_cli_config.update_services_profile.assert_called_with("fast")
+    # the database starts empty
+    assert mock_cli_config.services_setup is False
+
+    mock_cli_config.get_services_profile = lambda: "fast"
+    assert commands.stop()[-1].args == {"is_setup": False}
+    commands.apply_profile("durable")
+    assert not override_file.exists()
+    assert commands.docker_helper.override_files == []
+
+
+def test_plans_without_instance_path(mock_cli_config):
+    def get_instance_path(throw=True):
+        raise InvenioCLIConfigError("Accessing unset 'instance_path'")
+
+    mock_cli_config.get_instance_path = get_instance_path
+    commands = ServicesCommands(mock_cli_config, Mock(override_files=[]))
+
+    # only the files location needs the instance path
+    for steps in (
+        commands.declare_queues(),
+        commands.demo(),
+        commands.rdm_fixtures(),
+        commands._cleanup(),
+    ):
+        assert steps
+    with pytest.raises(InvenioCLIConfigError):
+        commands._single_command(
+            "invenio files location create {default_location}", "Creating..."
+        )
+
+
+def test_pull_images(mock_cli_config):
+    docker_helper = Mock(override_files=[])
+    docker_helper.missing_images.return_value = ["postgres:14", "redis:7"]
+    docker_helper.pull_image.return_value = ProcessResponse(status_code=0)
+    commands = ServicesCommands(mock_cli_config, docker_helper)
+
+    assert [step.message for step in commands.start()] == [
+        "Pulling the images...",
+        "Making sure containers are up...",
+    ]
+    response = commands.pull_images()
+    assert response.output == "Pulled 2 image(s)."
+    pulled = [c.kwargs["image"] for c in docker_helper.pull_image.mock_calls]
+    assert sorted(pulled) == ["postgres:14", "redis:7"]
+
+    docker_helper.missing_images.return_value = []
+    assert commands.pull_images().output == "All the images are present."
+
+
+def test_enable_search_snapshots(mock_cli_config, tmp_path):
+    mock_cli_config.get_cache_dir = lambda: tmp_path
+    docker_helper = Mock(override_files=[])
+    docker_helper.has_container.return_value = True
+    commands = ServicesCommands(mock_cli_config, docker_helper)
+
+    # the existing search container would be recreated
+    step, _, _ = commands.search_snapshot("create", "daily")
+    assert step.execute().status_code == 1
+    assert docker_helper.override_files == []
+
+    response = commands.enable_search_snapshots(recreate=True)
+    assert response.status_code == 0
+    override_file = tmp_path / "compose" / "search-snapshots.yml"
+    assert docker_helper.override_files == [override_file]
+    # the container has the repository from now on
+    assert commands.enable_search_snapshots().status_code == 0
@@ -7,7 +7,8 @@
 
 """Module for step tests."""
 
-from invenio_cli.commands.steps import FunctionStep
+from invenio_cli.commands.steps import ContextStep, FunctionStep, ParallelStep
+from invenio_cli.helpers import fingerprints, profiling
 from invenio_cli.helpers.process import ProcessResponse
 
 
@@ -29,3 +30,79 @@ def test_skip_func_step():
 
     assert response.status_code == 0
     assert response.warning
+
+
+def test_parallel_step():
+    calls = []
+    ok = FunctionStep(func=lambda: ProcessResponse(output="ok", status_code=0))
+    step = ParallelStep(steps=[ok, ok], progress=lambda: calls.append(1), interval=0)
+    response = step.execute()
+
+    assert response.status_code == 0
+    assert calls
+
+    step = ParallelStep(steps=[ok, FunctionStep(func=func)])
+    response = step.execute()
+
+    assert response.status_code == 1
+
+    # the steps are executed as the sequential ones, e.g. profiled by name
+    names = []
+
+    def record_name():
+        names.append(profiling._step_name.get())
+        return ProcessResponse(status_code=0)
+
+    step = ParallelStep(
+        steps=[
+            FunctionStep(func=record_name, message="Rebuilding records index..."),
+            FunctionStep(func=record_name, message="Rebuilding users index..."),
+        ]
+    )
+    assert step.execute().status_code == 0
+    assert sorted(names) == ["rebuilding-records-index", "rebuilding-users-index"]
+
+
+def test_context_step():
+    calls = []
+
+    def record(name, status_code=0):
+        calls.append(name)
+        return ProcessResponse(output=name, status_code=status_code)
+
+    ok = FunctionStep(func=lambda: record("step"), message="Step...")
+    step = ContextStep(
+        steps=[ok, ok],
+        on_enter=lambda: record("enter"),
+        on_exit=lambda: record("exit"),
+        print_func=calls.append,
+    )
+    assert step.execute().status_code == 0
+    assert calls == ["enter", "Step...", "step", "Step...", "step", "exit"]
+
+    # the context is exited even if a step fails
+    calls.clear()
+    step.steps = [FunctionStep(func=func), ok]
+    response = step.execute()
+    assert response.status_code == 1
+    assert response.error == "test"
+    assert calls == ["enter", "exit"]
+
+
+def test_step_up_to_date(tmp_path, monkeypatch):
+    monkeypatch.setattr(fingerprints, "_store", None)
+    output = tmp_path / "output"
+    output.touch()
+    step = FunctionStep(func=func, message="Creating output...", outputs=[output])
+    uncached = FunctionStep(func=func, message="Creating output...")
+
+    step.record()
+    assert not step.is_up_to_date()  # not enabled
+
+    fingerprints.configure(tmp_path)
+    step.record()
+    assert step.is_up_to_date()
+    assert not uncached.is_up_to_date()
+
+    fingerprints.configure(tmp_path, force=True)
+    assert not step.is_up_to_date()
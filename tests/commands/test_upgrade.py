@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module commands/upgrade.py's tests."""
+
+from unittest.mock import Mock
+
+from invenio_cli.commands import UpgradeCommands
+from invenio_cli.commands.steps import CommandStep, ContextStep, ParallelStep
+from invenio_cli.commands.upgrade import IndexGeneration
+
+
+def test_upgrade_sequential(mock_cli_config):
+    mock_cli_config.get_search_index_prefix = Mock(return_value="")
+    steps = UpgradeCommands(mock_cli_config).upgrade("script.py", parallel=False)
+
+    assert all(isinstance(step, CommandStep) for step in steps[:2])
+    # the prefix is resolved once the database is upgraded
+    assert steps[2].execute().status_code == 0
+    assert all(isinstance(step, CommandStep) for step in steps[3:-1])
+    # the rebuilt indices are filled with the bulk indexing settings
+    bulk = steps[-1]
+    assert isinstance(bulk, ContextStep)
+    indices = bulk.on_enter.__self__.indices().split(",")
+    assert "rdmrecords-*" in indices
+    assert "communities-*" in indices
+    assert [step.cmd[3:] for step in bulk.steps] == [
+        ["rdm-records", "rebuild-index"],
+        ["communities", "rebuild-index"],
+        # the queue is drained before the settings are restored
+        ["index", "run", "--raise-on-error"],
+    ]
+
+
+def test_upgrade_parallel(mock_cli_config):
+    steps = UpgradeCommands(mock_cli_config).upgrade(
+        "script.py", parallel=True, index_workers=3
+    )
+
+    rebuild, index_run = steps[-1].steps
+    assert isinstance(rebuild, ParallelStep)
+    assert len(rebuild.steps) == 2
+    assert isinstance(index_run, ParallelStep)
+    assert len(index_run.steps) == 3
+    assert index_run.progress is not None
+    assert index_run.steps[0].cmd[2:] == ["invenio", "index", "run", "--raise-on-error"]
+
+
+def test_upgrade_zero_downtime(mock_cli_config):
+    mock_cli_config.get_search_index_prefix = Mock(return_value="site-")
+    steps = UpgradeCommands(mock_cli_config).upgrade(
+        "script.py", zero_downtime=True, index_workers=1
+    )
+
+    cmds = [step.cmd for step in steps if isinstance(step, CommandStep)]
+    assert ["pipenv", "run", "invenio", "index", "destroy", "--yes-i-know"] not in cmds
+    # the prefixes are resolved by a step, after the database upgrade
+    generation = steps[2].func.__self__
+    assert generation.new_prefix is None
+    assert steps[2].execute().status_code == 0
+    assert generation.new_prefix.startswith("site-v")
+
+    init = [
+        step for step in steps if getattr(step, "cmd", [])[-2:] == ["index", "init"]
+    ]
+    assert init[0].env["INVENIO_SEARCH_INDEX_PREFIX"] == generation.new_prefix
+    bulk = steps[-3]
+    assert bulk.on_enter.__self__.indices() == f"{generation.new_prefix}*"
+    rebuild, index_run = bulk.steps
+    assert rebuild.steps[0].env is generation.env
+    assert index_run.steps[0].env is generation.env
+    assert [step.func for step in steps[-2:]] == [
+        generation.check_counts,
+        generation.switch,
+    ]
+
+
+class CountingSearchClient(object):
+    def __init__(self, counts):
+        self.counts = counts
+        self.refreshed = []
+
+    def refresh(self, index):
+        self.refreshed.append(index)
+
+    def count(self, index):
+        return self.counts.get(index, 0)
+
+
+def test_index_generation_check_counts():
+    client = CountingSearchClient(
+        {
+            "site-rdmrecords-records*": 10,
+            "site-communities-communities*": 2,
+            "site-v1-rdmrecords-records*": 9,
+            "site-v1-communities-communities*": 2,
+        }
+    )
+    generation = IndexGeneration(client, lambda: "site-", Mock())
+    generation.prefix, generation.new_prefix = "site-", "site-v1-"
+
+    response = generation.check_counts()
+    assert response.status_code == 1
+    assert "records: 9/10 docs" in response.error
+    assert client.refreshed == ["site-v1-*"]
+
+    client.counts["site-v1-rdmrecords-records*"] = 11
+    assert generation.check_counts().status_code == 0
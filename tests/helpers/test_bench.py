@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module bench tests."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from invenio_cli.helpers.bench import HTTPConnection, percentile, run_benchmark
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serve a small body, or a 404 for unknown paths."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """Handle a GET request."""
+        body = b'{"hits": []}'
+        if self.path == "/not-modified":
+            # the length of the cached representation, without body
+            self.send_response(304)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            return
+        self.send_response(200 if self.path.startswith("/api/") else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        """Handle a HEAD request, the headers of the GET response only."""
+        self.send_response(200)
+        self.send_header("Content-Length", "12")
+        self.end_headers()
+
+    def log_message(self, *args):
+        """Silence the logs."""
+
+
+@pytest.fixture()
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_percentile():
+    assert percentile([], 50) is None
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([1, 2, 3, 4], 100) == 4
+
+
+def test_run_benchmark(server):
+    host, port = server
+    results = run_benchmark(
+        host,
+        port,
+        {
+            "search": ("/api/records", "application/json"),
+            "missing": ("/records/1", "text/html"),
+        },
+        concurrency=3,
+        requests=20,
+        scheme="http",
+    )
+
+    assert results["total"]["requests"] == 20
+    assert results["total"]["errors"] == 10
+    search = results["endpoints"]["search"]
+    assert search["statuses"] == {"200": 10}
+    assert search["bytes"] == 120
+    latency = search["latency_ms"]
+    assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert results["endpoints"]["missing"]["statuses"] == {"404": 10}
+
+
+def test_bodyless_responses(server):
+    host, port = server
+
+    async def requests():
+        connection = HTTPConnection(host, port, timeout=5)
+        try:
+            # on the same connection, the next response is read as such
+            return [
+                await connection.request("HEAD", "/api/records"),
+                await connection.get("/not-modified"),
+                await connection.get("/api/records"),
+            ]
+        finally:
+            connection.close()
+
+    assert asyncio.run(requests()) == [(200, 0), (304, 0), (200, 12)]
@@ -119,3 +119,14 @@ def test_cli_config_get_project_shortname(config_dir):
     cli_config = CLIConfig(config_dir)
 
     assert cli_config.get_project_shortname() == "my-site"
+
+
+def test_cli_config_read_only(config_dir):
+    (config_dir / CLIConfig.PRIVATE_CONFIG_FILENAME).unlink()
+    cli_config = CLIConfig(config_dir, write_private=False)
+
+    assert not (config_dir / CLIConfig.PRIVATE_CONFIG_FILENAME).exists()
+    assert cli_config.get_services_setup() is False
+    # relative to the project, even when written as an absolute path
+    cli_config.private_config[CLIConfig.CLI_SECTION]["logfile"] = "/logs/cli.log"
+    assert cli_config.get_log_file() == config_dir / "logs" / "cli.log"
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module compose tests."""
+
+import json
+from unittest.mock import patch
+
+import yaml
+
+from invenio_cli.helpers.compose import (
+    derive_ports,
+    project_images,
+    published_ports,
+    search_heap_size,
+    service_environment,
+    service_images,
+    write_fast_profile_override,
+    write_ports_override,
+    write_search_snapshots_override,
+)
+from invenio_cli.helpers.process import ProcessResponse
+
+PORTS = {"cache": [6379], "db": [5432], "search": [9200, 9600]}
+
+
+@patch("invenio_cli.helpers.compose.run_cmd")
+def test_published_ports(p_run_cmd):
+    config = {
+        "services": {
+            "db": {"ports": [{"target": 5432, "published": "5432"}]},
+            "search": {"ports": [{"target": 9600}, {"target": 9200}]},
+            "app": {"image": "app"},
+        }
+    }
+    p_run_cmd.return_value = ProcessResponse(output=json.dumps(config), status_code=0)
+
+    assert published_ports(["docker-compose.yml"]) == {
+        "db": [5432],
+        "search": [9200, 9600],
+    }
+    p_run_cmd.assert_called_with(
+        ["docker", "compose", "--file", "docker-compose.yml"]
+        + ["config", "--format", "json"]
+    )
+
+
+@patch("invenio_cli.helpers.compose.run_cmd")
+def test_service_images(p_run_cmd):
+    config = {
+        "name": "my-site",
+        "services": {
+            "db": {"image": "postgres:14"},
+            "cache": {"image": "redis:7"},
+            "web-ui": {"image": "my-site", "build": {"context": "."}},
+            "web-api": {"image": "my-site", "build": {"context": "."}},
+            "worker": {"image": "redis:7"},
+            "frontend": {"build": {"context": "./docker/nginx"}},
+        },
+    }
+    p_run_cmd.return_value = ProcessResponse(output=json.dumps(config), status_code=0)
+
+    assert service_images(["docker-compose.full.yml"]) == ["postgres:14", "redis:7"]
+    assert project_images(["docker-compose.full.yml"]) == [
+        "my-site",
+        "my-site-frontend",
+        "postgres:14",
+        "redis:7",
+    ]
+
+
+@patch("invenio_cli.helpers.compose.run_cmd")
+def test_service_environment(p_run_cmd):
+    config = {
+        "services": {
+            "db": {"environment": {"POSTGRES_USER": "invenio", "PGDATA": None}}
+        }
+    }
+    p_run_cmd.return_value = ProcessResponse(output=json.dumps(config), status_code=0)
+
+    assert service_environment(["docker-compose.yml"], "db") == {
+        "POSTGRES_USER": "invenio"
+    }
+    assert service_environment(["docker-compose.yml"], "search") == {}
+
+
+def test_derive_ports():
+    ports = derive_ports("my-site-pool-1", PORTS)
+    # stable, contiguous and in range
+    assert ports == derive_ports("my-site-pool-1", PORTS)
+    host_ports = sorted(p for mapping in ports.values() for p in mapping.values())
+    assert host_ports == list(range(host_ports[0], host_ports[0] + 4))
+    assert 20000 <= host_ports[0] and host_ports[-1] < 60000
+    assert set(ports["search"]) == {"9200", "9600"}
+
+    # taken ports are avoided
+    other = derive_ports("my-site-pool-1", PORTS, taken=host_ports)
+    assert set(host_ports).isdisjoint(
+        p for mapping in other.values() for p in mapping.values()
+    )
+
+
+def test_write_ports_override(tmp_path):
+    path = tmp_path / "pool" / "override.yml"
+    write_ports_override(path, {"db": {"5432": 20010}, "search": {"9600": 20012}})
+
+    assert path.read_text() == (
+        "services:\n"
+        '  "db":\n'
+        "    ports: !override\n"
+        '      - "20010:5432"\n'
+        '  "search":\n'
+        "    ports: !override\n"
+        '      - "20012:9600"\n'
+    )
+
+
+def test_write_search_snapshots_override(tmp_path):
+    path = tmp_path / "compose" / "search-snapshots.yml"
+    write_search_snapshots_override(path, "/project/snapshots", "/mnt/snapshots")
+
+    assert path.read_text() == (
+        "services:\n"
+        '  "search":\n'
+        "    environment:\n"
+        '      - "path.repo=/mnt/snapshots"\n'
+        "    volumes:\n"
+        '      - "/project/snapshots:/mnt/snapshots"\n'
+    )
+
+
+def test_search_heap_size():
+    assert search_heap_size(memory=16 * 2**30) == 4096
+    assert search_heap_size(memory=8 * 2**30) == 2048
+    assert search_heap_size(memory=1 * 2**30) == 512
+
+
+def test_write_fast_profile_override(tmp_path):
+    path = tmp_path / "compose" / "profile.yml"
+    write_fast_profile_override(path, "postgresql", "opensearch2", 2048)
+
+    services = yaml.safe_load(path.read_text())["services"]
+    assert services["db"]["command"][1:] == [
+        "-c",
+        "fsync=off",
+        "-c",
+        "synchronous_commit=off",
+        "-c",
+        "full_page_writes=off",
+    ]
+    assert services["db"]["tmpfs"] == ["/var/lib/postgresql/data"]
+    assert services["cache"]["command"] == [
+        "redis-server",
+        "--save",
+        "",
+        "--appendonly",
+        "no",
+    ]
+    assert services["search"]["environment"] == [
+        "OPENSEARCH_JAVA_OPTS=-Xms2048m -Xmx2048m"
+    ]
+    # the container is not killed when the heap is full
+    assert services["search"]["mem_limit"] == "4096m"
+
+    write_fast_profile_override(path, "mysql", "elasticsearch7", 512)
+    services = yaml.safe_load(path.read_text())["services"]
+    assert services["db"]["tmpfs"] == ["/var/lib/mysql"]
+    assert services["search"]["environment"] == ["ES_JAVA_OPTS=-Xms512m -Xmx512m"]
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module daemon tests."""
+
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+from invenio_cli.helpers import daemon_script
+from invenio_cli.helpers.daemon import socket_path, warm_command
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "send_fds"), reason="requires socket.send_fds"
+)
+
+
+def test_warm_command(tmp_path):
+    command = ["invenio", "index", "init"]
+    fallback = ["pipenv", "run", *command]
+    assert warm_command(tmp_path, command, fallback) is None
+
+    socket_path(tmp_path).touch()
+    warm = warm_command(tmp_path, command, fallback)
+    assert warm[2:] == [
+        "attach",
+        str(socket_path(tmp_path)),
+        json.dumps(fallback),
+        *command,
+    ]
+    assert warm_command(tmp_path, ["invenio", "run"], fallback) is None
+    assert warm_command(tmp_path, ["invenio", "celery", "worker"], fallback) is None
+    assert warm_command(tmp_path, ["pytest"], fallback) is None
+
+
+def test_attach(tmp_path, monkeypatch, capfd):
+    monkeypatch.setattr(daemon_script, "_forward_signals", lambda pid: None)
+    # short path, the length of unix socket paths is limited
+    path = f"/tmp/invenio-cli-test-{os.getpid()}.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    requests = []
+
+    def serve():
+        conn, _ = server.accept()
+        request, fds = daemon_script.receive_request(conn)
+        requests.append(request)
+        os.write(fds[1], b"hello from the daemon\n")
+        for fd in fds:
+            os.close(fd)
+        conn.sendall(b'{"pid": 1}\n{"exit": 3}\n')
+        conn.close()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    try:
+        assert daemon_script.attach(path, ["invenio", "shell"]) == 3
+    finally:
+        thread.join()
+        server.close()
+        os.unlink(path)
+
+    assert requests[0]["argv"] == ["invenio", "shell"]
+    assert requests[0]["cwd"] == os.getcwd()
+    assert "hello from the daemon" in capfd.readouterr().out
+
+
+def test_attach_not_running(tmp_path, capfd):
+    path = str(tmp_path / "daemon.sock")
+    assert daemon_script.main(["attach", path, "[]", "invenio", "shell"]) == 1
+    assert "not running" in capfd.readouterr().err
+
+
+def test_editable_sources(tmp_path):
+    site_dir = tmp_path / "site-packages"
+    project = tmp_path / "invenio-rdm-records"
+    (project / "src").mkdir(parents=True)
+    legacy = tmp_path / "invenio-records"
+    legacy.mkdir()
+    dist_info = site_dir / "invenio_rdm_records-13.0.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "direct_url.json").write_text(
+        json.dumps({"url": project.as_uri(), "dir_info": {"editable": True}})
+    )
+    installed = site_dir / "invenio_vocabularies-6.0.0.dist-info"
+    installed.mkdir()
+    (installed / "direct_url.json").write_text(
+        json.dumps({"url": "https://example.org/pkg.whl", "archive_info": {}})
+    )
+    (site_dir / "__editable__.invenio_rdm_records.pth").write_text(
+        f"{project / 'src'}\n"
+    )
+    (site_dir / "invenio-records.pth").write_text(f"{legacy}\n")
+    (site_dir / "distutils-precedence.pth").write_text("import os\n")
+
+    assert daemon_script.editable_sources([site_dir]) == [
+        str(project),
+        str(legacy),
+    ]
+
+
+def test_watched_paths(tmp_path, monkeypatch):
+    site_dir = tmp_path / "site-packages"
+    record = site_dir / "invenio_app-2.0.0.dist-info" / "RECORD"
+    record.parent.mkdir(parents=True)
+    record.write_text("")
+    source = tmp_path / "invenio-app"
+    (source / "invenio_app" / "__pycache__").mkdir(parents=True)
+    (source / "invenio_app" / "config.py").write_text("")
+    (source / "invenio_app" / "__pycache__" / "config.cpython-312.pyc").write_text("")
+    (site_dir / "invenio-app.pth").write_text(f"{source}\n")
+    monkeypatch.setattr(daemon_script.site, "getsitepackages", lambda: [site_dir])
+
+    watched = daemon_script.watched_paths(["invenio.cfg"])
+    assert watched == [
+        "invenio.cfg",
+        site_dir,
+        str(record),
+        str(source / "invenio_app" / "config.py"),
+    ]
+    mtimes = daemon_script.watched_mtimes(watched)
+    assert mtimes["invenio.cfg"] is None
+    os.utime(source / "invenio_app" / "config.py", ns=(0, 0))
+    assert daemon_script.watched_mtimes(watched) != mtimes
+
+
+def test_receive_request_incomplete(monkeypatch):
+    received = []
+    socket_recv_fds = socket.recv_fds
+
+    def recv_fds(*args):
+        data, fds, flags, address = socket_recv_fds(*args)
+        received.extend(fds)
+        return data, fds, flags, address
+
+    monkeypatch.setattr(daemon_script.socket, "recv_fds", recv_fds)
+    client, server = socket.socketpair()
+    read_fd, write_fd = os.pipe()
+    socket.send_fds(client, [b'{"argv": '], [read_fd, write_fd])
+    client.close()
+    os.close(read_fd)
+    os.close(write_fd)
+
+    with pytest.raises(ConnectionError):
+        daemon_script.receive_request(server)
+    server.close()
+    assert len(received) == 2
+    for fd in received:
+        with pytest.raises(OSError):
+            os.fstat(fd)
@@ -9,8 +9,9 @@
 
 """Module docker_helper tests."""
 
-from unittest.mock import patch
+from unittest.mock import Mock, call, patch
 
+import docker
 import pytest
 
 from invenio_cli.helpers.docker_helper import DockerHelper
@@ -50,3 +51,55 @@ def test_start_containers(p_run_cmd):
             "-d",
         ]
     )
+
+
+@patch("invenio_cli.helpers.docker_helper.docker.from_env", Mock)
+@patch.object(DockerHelper, "_normalize_name", lambda self, name: name)
+def test_pull_image():
+    docker_helper = DockerHelper("project-shortname", local=True)
+    api = docker_helper.docker_client.api
+    api.pull.return_value = [{"status": "Status: Downloaded newer image"}]
+    progress = Mock()
+
+    response = docker_helper.pull_image("postgres:14", "mirror:5000", progress)
+    assert response.status_code == 0
+    api.pull.assert_called_once_with(
+        "mirror:5000/library/postgres", "14", stream=True, decode=True
+    )
+    api.tag.assert_called_once_with("mirror:5000/library/postgres:14", "postgres", "14")
+    progress.assert_called_once_with("postgres:14", api.pull.return_value[0])
+
+    # not on the mirror
+    api.reset_mock()
+    api.pull.side_effect = [docker.errors.APIError("not found"), []]
+    assert docker_helper.pull_image("postgres:14", "mirror:5000").status_code == 0
+    assert api.pull.mock_calls[1] == call("postgres", "14", stream=True, decode=True)
+    api.tag.assert_not_called()
+
+
+@patch("invenio_cli.helpers.docker_helper.docker.from_env", Mock)
+@patch.object(DockerHelper, "_normalize_name", lambda self, name: name)
+def test_get_container_from_service():
+    def container(name, project, service):
+        labels = {
+            "com.docker.compose.project": project,
+            "com.docker.compose.service": service,
+        }
+        container = Mock(labels=labels)
+        container.name = name
+        return container
+
+    pool_db = container("proj-pool-0-db-1", "proj-pool-0", "db")
+    dashboards = container(
+        "proj-opensearch-dashboards-1", "proj", "opensearch-dashboards"
+    )
+    db = container("proj-db-1", "proj", "db")
+    docker_helper = DockerHelper("proj", local=True)
+    docker_helper.docker_client.containers.list.return_value = [
+        pool_db,
+        dashboards,
+        db,
+    ]
+
+    assert docker_helper._get_container_from_service("db") is db
+    assert docker_helper._get_container_from_service("search") is None
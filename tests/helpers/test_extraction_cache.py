@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module extraction_cache tests."""
+
+import os
+
+from invenio_cli.helpers.extraction_cache import extract_messages
+
+
+def _extract(tmp_path):
+    return extract_messages(
+        babel_file=tmp_path / "babel.ini",
+        output_file=tmp_path / "messages.pot",
+        input_dirs=tmp_path / "src",
+        cache_path=tmp_path / "cache.json",
+        msgid_bugs_address="info@my-site.com",
+        copyright_holder="CERN",
+    )
+
+
+def test_extract_messages_cache(tmp_path):
+    (tmp_path / "babel.ini").write_text("[python: **.py]\n")
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    (src / "pkg" / "a.py").write_text('_("Hello")\n')
+    (src / "pkg" / "b.py").write_text('_("World")\n')
+    (src / ".hidden").mkdir()
+    (src / ".hidden" / "c.py").write_text('_("Hidden")\n')
+
+    response = _extract(tmp_path)
+    pot = (tmp_path / "messages.pot").read_text()
+    assert response.status_code == 0
+    assert "2 files parsed, 0 from cache" in response.output
+    assert 'msgid "Hello"' in pot
+    assert 'msgid "World"' in pot
+    assert "Hidden" not in pot
+
+    # Untouched files come from the cache
+    response = _extract(tmp_path)
+    assert "0 files parsed, 2 from cache" in response.output
+    assert (tmp_path / "messages.pot").read_text().count("msgid") == pot.count("msgid")
+
+    # Touched but unchanged files are not parsed again
+    os.utime(src / "pkg" / "a.py", ns=(0, 0))
+    response = _extract(tmp_path)
+    assert "0 files parsed, 2 from cache" in response.output
+
+    # Changed and removed files
+    (src / "pkg" / "a.py").write_text('_("Hello again")\n')
+    (src / "pkg" / "b.py").unlink()
+    response = _extract(tmp_path)
+    pot = (tmp_path / "messages.pot").read_text()
+    assert "1 files parsed, 0 from cache" in response.output
+    assert 'msgid "Hello again"' in pot
+    assert "World" not in pot
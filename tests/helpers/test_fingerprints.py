@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module fingerprints tests."""
+
+import os
+
+from invenio_cli.helpers.fingerprints import FingerprintStore, fingerprint
+
+
+def test_fingerprint(tmp_path):
+    catalogs = tmp_path / "translations"
+    (catalogs / "de").mkdir(parents=True)
+    po_file = catalogs / "de" / "messages.po"
+    po_file.write_text("msgid")
+
+    before = fingerprint([catalogs])
+    assert fingerprint([catalogs]) == before
+    assert fingerprint([catalogs], command="pybabel compile --use-fuzzy") != before
+
+    os.utime(po_file, ns=(0, 0))
+    assert fingerprint([catalogs]) != before
+
+
+def test_fingerprint_store(tmp_path):
+    store = FingerprintStore(tmp_path / "fingerprints.json")
+    source, target = tmp_path / "Pipfile", tmp_path / "Pipfile.lock"
+    source.write_text("[packages]")
+    args = ("lock", [source], [target], "pipenv lock")
+
+    assert not store.is_up_to_date(*args)
+    target.write_text("{}")
+    store.record(*args)
+    assert store.is_up_to_date(*args)
+    # persisted
+    assert FingerprintStore(store.path).is_up_to_date(*args)
+    assert not FingerprintStore(store.path, force=True).is_up_to_date(*args)
+
+    source.write_text("[packages]\ninvenio-app-rdm = '*'")
+    assert not store.is_up_to_date(*args)
+    store.record(*args)
+    target.unlink()
+    assert not store.is_up_to_date(*args)
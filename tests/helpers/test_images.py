@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module images tests."""
+
+import os
+import shutil
+
+import pytest
+
+from invenio_cli.helpers.images import (
+    ImageCache,
+    PullProgress,
+    build_fingerprint,
+    mirror_repository,
+)
+
+FAKE_DOCKER = """#!/bin/sh
+case "$1" in
+  save) echo "layers of $2";;
+  load) cat > "$(dirname "$0")/loaded";;
+esac
+"""
+
+
+def test_mirror_repository():
+    mirror = "localhost:5000/"
+    assert mirror_repository("postgres", mirror) == "localhost:5000/library/postgres"
+    assert (
+        mirror_repository("opensearchproject/opensearch", mirror)
+        == "localhost:5000/opensearchproject/opensearch"
+    )
+    assert mirror_repository("ghcr.io/inveniosoftware/app", mirror) is None
+
+
+def test_pull_progress():
+    progress = PullProgress(["postgres:14", "redis:7"])
+    for layer, current in (("a", 2**20), ("b", 2**19)):
+        progress.update(
+            "postgres:14",
+            {
+                "status": "Downloading",
+                "id": layer,
+                "progressDetail": {"current": current, "total": 2**21},
+            },
+        )
+    progress.update("postgres:14", {"status": "Download complete", "id": "b"})
+    progress.update("redis:7", {"status": "Status: Image is up to date"})
+
+    assert progress.report() == "postgres:14: 3.0/4.0 MB\nredis:7: done"
+
+
+@pytest.mark.skipif(shutil.which("zstd") is None, reason="requires zstd")
+def test_image_cache(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "docker").write_text(FAKE_DOCKER)
+    (bin_dir / "docker").chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    image_cache = ImageCache(tmp_path / "images")
+
+    assert image_cache.check_zstd().status_code == 0
+    assert not image_cache.is_saved("postgres:14", "sha256:1")
+    assert image_cache.save("postgres:14", "sha256:1").status_code == 0
+    assert image_cache.manifest() == {
+        "postgres:14": {"id": "sha256:1", "file": "postgres_14.tar.zst"}
+    }
+    assert image_cache.is_saved("postgres:14", "sha256:1")
+    assert not image_cache.is_saved("postgres:14", "sha256:2")
+
+    assert image_cache.load("postgres:14").status_code == 0
+    assert (bin_dir / "loaded").read_text() == "layers of postgres:14\n"
+
+
+def test_build_fingerprint(tmp_path):
+    project = tmp_path / "project"
+    (project / "logs").mkdir(parents=True)
+    (project / ".dockerignore").write_text("# comment\nlogs\n*.pyc\n!keep.pyc\n")
+    (project / "Pipfile.lock").write_text("{}")
+    build = {"context": str(project), "dockerfile": "Dockerfile"}
+
+    fingerprint = build_fingerprint(build)
+    (project / "logs" / "web.log").write_text("GET /")
+    (project / "module.pyc").write_text("")
+    (project / ".invenio.cache").mkdir()
+    (project / ".invenio.cache" / "build.yml").write_text("")
+    assert build_fingerprint(build) == fingerprint
+    # the same project elsewhere, e.g. on another CI runner
+    shutil.copytree(project, tmp_path / "copy")
+    copy_build = {**build, "context": str(tmp_path / "copy")}
+    assert build_fingerprint(copy_build) == fingerprint
+
+    (project / "keep.pyc").write_text("")
+    assert build_fingerprint(build) != fingerprint
+    fingerprint = build_fingerprint(build)
+    (project / "Pipfile.lock").write_text('{"default": {}}')
+    assert build_fingerprint(build) != fingerprint
+    assert build_fingerprint({**build, "args": {"ENV": "prod"}}) != fingerprint
+
+
+def test_build_fingerprint_docker_patterns(tmp_path):
+    project = tmp_path / "project"
+    (project / "site" / "node_modules").mkdir(parents=True)
+    (project / ".dockerignore").write_text("*.pyc\n**/*.log\n")
+    build = {"context": str(project)}
+
+    fingerprint = build_fingerprint(build)
+    (project / "site" / "web.log").write_text("GET /")
+    assert build_fingerprint(build) == fingerprint
+    # unlike with fnmatch, * does not match the directory separator
+    (project / "site" / "module.pyc").write_text("")
+    assert build_fingerprint(build) != fingerprint
+    # not ignored, so sent to the build context
+    fingerprint = build_fingerprint(build)
+    (project / "site" / "node_modules" / "index.js").write_text("")
+    assert build_fingerprint(build) != fingerprint
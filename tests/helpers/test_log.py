@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module log tests."""
+
+import json
+
+import pytest
+
+from invenio_cli.cli.utils import run_steps
+from invenio_cli.commands.steps import CommandStep, ContextStep
+from invenio_cli.helpers import log
+from invenio_cli.helpers.process import ProcessResponse
+
+
+@pytest.fixture()
+def log_file(tmp_path):
+    log_file = tmp_path / "logs" / "invenio-cli.log"
+    yield log_file
+    log.shutdown()
+
+
+def _records(log_file):
+    return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+
+def test_step_correlated_records(log_file):
+    log.setup(log_file)
+    run_steps([CommandStep(cmd=["true"], message="Running...")], "Failed.", "Done.")
+    # records are buffered
+    assert not log_file.exists()
+    log.shutdown()
+
+    run, start, process, end = _records(log_file)
+    assert run["event"] == "run"
+    assert start["event"] == "step.start"
+    assert start["step_id"].startswith(log.RUN_ID)
+    assert process["event"] == "process"
+    assert process["argv"] == ["true"]
+    assert process["exit_code"] == 0
+    assert process["step_id"] == start["step_id"]
+    assert end["event"] == "step.end"
+    assert end["status_code"] == 0
+    assert end["duration"] >= 0
+
+
+def test_context_step_records(log_file):
+    log.setup(log_file)
+    step = ContextStep(
+        steps=[CommandStep(cmd=["true"], message="Inner...")],
+        on_enter=ProcessResponse,
+        on_exit=ProcessResponse,
+        message="Outer...",
+    )
+    run_steps([step], "Failed.", "Done.")
+    log.shutdown()
+
+    records = _records(log_file)
+    starts = {
+        r["message"][len("Step started: ") :]: r
+        for r in records
+        if r["event"] == "step.start"
+    }
+    (process,) = [r for r in records if r["event"] == "process"]
+    # the inner steps are logged as steps of their own
+    assert process["step_id"] == starts["Inner..."]["step_id"]
+    assert starts["Inner..."]["step_id"] != starts["Outer..."]["step_id"]
+
+
+def test_rotation(log_file):
+    log.setup(log_file, max_bytes=2000, backup_count=2, capacity=1)
+    for i in range(100):
+        log.log_process(["invenio", "index", "run", str(i)], 0, 0.1)
+    log.shutdown()
+
+    rotated = sorted(p.name for p in log_file.parent.iterdir())
+    assert rotated == ["invenio-cli.log", "invenio-cli.log.1", "invenio-cli.log.2"]
+    assert _records(log_file)[-1]["argv"][-1] == "99"
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module package_managers tests."""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from invenio_cli.helpers.package_managers import UV, Pipenv
+
+
+@pytest.fixture()
+def venv(tmp_path):
+    bin_dir = tmp_path / "venv" / "bin"
+    bin_dir.mkdir(parents=True)
+    (bin_dir / "invenio").write_text("#!/bin/sh\n")
+    return tmp_path / "venv"
+
+
+@pytest.fixture()
+def project(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "Pipfile").write_text('[scripts]\nserve = "invenio run"\n')
+    (project / "Pipfile.lock").write_text("{}")
+    return project
+
+
+@patch("invenio_cli.helpers.package_managers.run")
+def test_pipenv_direct_command(p_run, project, venv, tmp_path):
+    p_run.return_value = Mock(stdout=f"{venv}\n".encode())
+    pipenv = Pipenv(project_dir=project, cache_dir=tmp_path / "cache")
+
+    command = pipenv.run_command("invenio", "index", "init")
+    assert command[:2] == ["sh", "-c"]
+    # the PATH is the one of the environment the command runs in
+    assert "$PATH" in command[2] and "PIPENV_ACTIVE=1" in command[2]
+    assert command[3:] == [str(venv), f"{venv}/bin/invenio", "index", "init"]
+
+    # the location is cached, also across instances
+    pipenv = Pipenv(project_dir=project, cache_dir=tmp_path / "cache")
+    assert pipenv.run_command("invenio", "index", "init") == command
+    assert p_run.call_count == 1
+
+    # executables missing from the environment and Pipfile scripts
+    assert pipenv.run_command("celery", "worker") == [
+        "pipenv",
+        "run",
+        "celery",
+        "worker",
+    ]
+    assert pipenv.run_command("serve")[:2] == ["pipenv", "run"]
+
+    # a change of the lock file invalidates the cache
+    os.utime(project / "Pipfile.lock", ns=(0, 0))
+    p_run.return_value = Mock(stdout=b"")
+    assert pipenv.run_command("invenio", "index", "init")[:2] == ["pipenv", "run"]
+    assert p_run.call_count == 2
+
+    # an environment not found yet is looked up again, e.g. once installed
+    p_run.return_value = Mock(stdout=f"{venv}\n".encode())
+    assert pipenv.run_command("invenio", "index", "init") == command
+    assert p_run.call_count == 3
+
+
+def test_pipenv_dotenv_fallback(project, tmp_path):
+    (project / ".env").write_text("INVENIO_SECRET_KEY=secret\n")
+    pipenv = Pipenv(project_dir=project, cache_dir=tmp_path / "cache")
+
+    assert pipenv.run_command("invenio", "shell")[:2] == ["pipenv", "run"]
+    # the values depending on the environment can still be cached
+    key = pipenv.environment_key()
+    assert key == pipenv.environment_key()
+    (project / ".env").write_text("INVENIO_INSTANCE_PATH=/srv/instance\n")
+    os.utime(project / ".env", ns=(0, 0))
+    assert pipenv.environment_key() != key
+
+
+def test_uv_direct_command(tmp_path):
+    project = tmp_path / "project"
+    (project / ".venv" / "bin").mkdir(parents=True)
+    (project / ".venv" / "bin" / "invenio").write_text("#!/bin/sh\n")
+    (project / "pyproject.toml").write_text("[project]\n")
+    uv = UV(project_dir=project, cache_dir=tmp_path / "cache")
+
+    assert uv.run_command("invenio", "shell")[-2:] == [
+        str(project / ".venv" / "bin" / "invenio"),
+        "shell",
+    ]
+    # without project, the wrapper is used
+    assert UV().run_command("invenio", "shell") == [
+        "uv",
+        "run",
+        "--no-sync",
+        "invenio",
+        "shell",
+    ]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module plans tests."""
+
+from unittest.mock import Mock
+
+from invenio_cli.helpers.plans import PlanParams, load_plans, resolve_plan
+
+
+def _commands(name, **facts):
+    return [step.command for step in resolve_plan(name, **facts) if step.command]
+
+
+def test_resolve_setup_plan_per_version():
+    """Test the setup steps of the different RDM versions."""
+    v10 = _commands("setup", rdm=10)
+    assert "invenio rdm-records custom-fields init" in v10
+    assert "invenio rdm fixtures" not in v10
+    assert "invenio rdm-records fixtures" in v10
+
+    v12 = _commands("setup", rdm=12)
+    assert v12[-2:] == [
+        "invenio rdm-records fixtures",
+        "invenio index run --raise-on-error",
+    ]
+    assert "invenio queues declare" in v12
+    assert "invenio rdm fixtures" in v12
+
+    # no RDM, no RDM-specific steps
+    assert _commands("setup") == _commands("setup", rdm=None, ils=None)
+    assert not any("rdm" in command for command in _commands("setup"))
+
+
+def test_resolve_setup_plan_facts():
+    """Test the builtins and the ILS steps of the setup."""
+    steps = resolve_plan("setup", rdm=12, demo_data=True)
+    builtins = [step.builtin for step in steps if step.builtin]
+    assert builtins == [
+        "expect_not_setup",
+        "translations",
+        "save_db_template",
+        "demo",
+        "mark_setup",
+    ]
+
+    assert _commands("setup", ils=2)[-1] == "invenio setup --verbose --skip-demo-data"
+    assert _commands("setup", ils=2, demo_data=True)[-1] == "invenio setup --verbose"
+
+
+def test_resolve_reset_plan():
+    """Test the reset steps of the different versions."""
+    assert _commands("reset", rdm=12)[-2:] == [
+        "invenio rdm rebuild-all-indices",
+        "invenio index run --raise-on-error",
+    ]
+    assert "invenio db destroy --yes-i-know" not in _commands("reset", rdm=12)
+    assert [s.builtin for s in resolve_plan("reset", rdm=12) if s.builtin] == [
+        "restore_db_template"
+    ]
+    # the indices are rebuilt by the commands of the older versions
+    assert _commands("reset", rdm=11)[-3:] == [
+        "invenio rdm-records rebuild-index",
+        "invenio communities rebuild-index",
+        "invenio index run --raise-on-error",
+    ]
+    assert "invenio rdm rebuild-all-indices" not in _commands("reset", rdm=11)
+    assert "invenio communities rebuild-index" not in _commands("reset", rdm=9)
+    # not supported without InvenioRDM
+    assert resolve_plan("reset", ils=2)[0].builtin == "unsupported"
+
+
+def test_plans_are_cached():
+    """Test that the plans are loaded and resolved once."""
+    assert load_plans() is load_plans()
+    assert resolve_plan("setup", rdm=12) is resolve_plan("setup", rdm=12)
+
+
+def test_plan_step_placeholders():
+    """Test the filling of the placeholders of a command."""
+    (step,) = [s for s in resolve_plan("setup") if "location" in (s.command or "")]
+    assert step.args({"default_location": "/a b/data"})[-1] == "/a b/data"
+    assert step.command_line({"default_location": "${INVENIO_INSTANCE_PATH}/data"}) == (
+        "invenio files location create --default default-location "
+        "${INVENIO_INSTANCE_PATH}/data"
+    )
+
+    # the values are computed when used, once
+    location = Mock(return_value="/data")
+    params = PlanParams(default_location=location, unused=Mock(side_effect=KeyError))
+    assert step.args(params)[-1] == step.args(params)[-1] == "/data"
+    location.assert_called_once_with()
+
+
+def test_bulk_steps():
+    """Test the bulk steps of the reset."""
+    bulk = [step.command for step in resolve_plan("reset", rdm=12) if step.bulk]
+    assert bulk == [
+        "invenio rdm rebuild-all-indices",
+        "invenio index run --raise-on-error",
+    ]
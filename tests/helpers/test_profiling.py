@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module profiling tests."""
+
+import itertools
+from unittest.mock import patch
+
+import pytest
+
+from invenio_cli.helpers import profiling
+from invenio_cli.helpers.package_managers import UV, Pipenv
+from invenio_cli.helpers.process import run_cmd, run_interactive
+
+
+@pytest.fixture()
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "_counter", itertools.count(1))
+    profiling.configure(tmp_path / "profiles")
+    yield tmp_path / "profiles"
+    profiling.configure(None)
+
+
+def test_profiling_disabled():
+    assert Pipenv().run_command("invenio", "index", "init") == [
+        "pipenv",
+        "run",
+        "invenio",
+        "index",
+        "init",
+    ]
+
+
+@patch("invenio_cli.helpers.profiling.shutil.which", return_value=None)
+def test_profile_command_cprofile(p_which, profile_dir):
+    command = Pipenv().run_command("invenio", "rdm-records", "fixtures")
+
+    assert command[:5] == ["pipenv", "run", "python", "-c", profiling.PROFILE_RUNNER]
+    assert command[5:] == ["", "rdm-records", "fixtures"]
+    # other commands are not profiled
+    assert UV().run_command("celery", "worker") == [
+        "uv",
+        "run",
+        "--no-sync",
+        "celery",
+        "worker",
+    ]
+
+
+@patch("invenio_cli.helpers.profiling.shutil.which", return_value="/bin/py-spy")
+def test_profile_command_py_spy(p_which, profile_dir):
+    command = UV().run_command("invenio", "shell", "--no-term-title", "script.py")
+
+    assert command[:6] == [
+        "uv",
+        "run",
+        "--no-sync",
+        "python",
+        "-c",
+        profiling.PROFILE_RUNNER,
+    ]
+    assert command[6:] == ["/bin/py-spy", "shell", "--no-term-title", "script.py"]
+
+
+@patch("invenio_cli.helpers.process.run")
+@patch("invenio_cli.helpers.process.popen")
+def test_profile_output(p_popen, p_run, profile_dir):
+    fixtures = Pipenv().run_command("invenio", "rdm-records", "fixtures")
+    demo = Pipenv().run_command("invenio", "rdm-records", "demo")
+    p_popen.return_value.communicate.return_value = (b"", b"")
+    p_popen.return_value.returncode = 0
+
+    # numbered in the order they run, not in the order they are built
+    with profiling.step("Creating demo records..."):
+        run_interactive(demo)
+    run_interactive(fixtures)
+    # the output of py-spy would be mixed with the parsed output
+    run_cmd(fixtures)
+
+    outputs = [
+        call.kwargs["env"].get(profiling.OUTPUT_VARIABLE)
+        for call in p_run.call_args_list
+    ]
+    assert outputs == [
+        str(profile_dir / "01-creating-demo-records"),
+        str(profile_dir / "02-rdm-records-fixtures"),
+    ]
+    assert profiling.OUTPUT_VARIABLE not in p_popen.call_args.kwargs.get("env", {})
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module search tests."""
+
+from invenio_cli.helpers.search import (
+    BulkIndexingSettings,
+    SearchError,
+    create_snapshot,
+    restore_snapshot,
+    snapshot_size,
+    switch_index_generation,
+)
+
+
+class FakeSearchClient(object):
+    def __init__(self, aliases, counts):
+        self.aliases = aliases
+        self.counts = counts
+        self.actions = None
+
+    def get_aliases(self, index="*"):
+        prefix = index.rstrip("*")
+        return {k: v for k, v in self.aliases.items() if k.startswith(prefix)}
+
+    def count(self, index):
+        return self.counts.get(index, 0)
+
+    def update_aliases(self, actions):
+        self.actions = actions
+
+    def delete_templates(self, pattern):
+        pass
+
+
+def test_switch_index_generation():
+    client = FakeSearchClient(
+        aliases={
+            "site-records-v1-1": {"aliases": {"site-records": {}, "site-all": {}}},
+            "site-stats-v1-1": {"aliases": {"site-stats": {}}},
+            "site-v2-records-v2-2": {
+                "aliases": {"site-v2-records": {}, "site-v2-all": {}}
+            },
+            "site-v2-stats-v1-2": {"aliases": {"site-v2-stats": {}}},
+        },
+        counts={
+            "site-records-v1-1": 10,
+            "site-stats-v1-1": 5,
+            "site-v2-records-v2-2": 10,
+        },
+    )
+
+    response = switch_index_generation(client, "site-", "site-v2-")
+
+    assert response.status_code == 0
+    assert "site-stats-v1-1" in response.output
+    actions = client.actions
+    # the rebuilt index takes over the aliases, the old one is dropped
+    assert {
+        "add": {"index": "site-v2-records-v2-2", "alias": "site-records"}
+    } in actions
+    assert {"add": {"index": "site-v2-records-v2-2", "alias": "site-all"}} in actions
+    assert {
+        "remove": {"index": "site-v2-records-v2-2", "alias": "site-v2-records"}
+    } in actions
+    assert {"remove_index": {"index": "site-records-v1-1"}} in actions
+    # the empty (not rebuilt) index is dropped, the old one keeps serving
+    assert {"remove_index": {"index": "site-v2-stats-v1-2"}} in actions
+    assert {"remove_index": {"index": "site-stats-v1-1"}} not in actions
+
+
+class RecordingSearchClient(object):
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def request(self, method, path, body=None, params=None):
+        self.requests.append((method, path, body, params))
+        response = self.responses.get((method, path), {})
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def get_aliases(self, index="*"):
+        return self.request("GET", f"{index}/_alias")
+
+
+def test_create_snapshot():
+    path = "_snapshot/invenio-cli/daily"
+    snapshot = {"snapshot": {"indices": ["a", "b"], "state": "SUCCESS"}}
+    client = RecordingSearchClient(
+        {
+            ("DELETE", path): SearchError("404"),
+            ("PUT", f"{path}-new"): snapshot,
+            ("PUT", path): snapshot,
+            ("GET", f"{path}/_status"): {
+                "snapshots": [{"stats": {"total": {"size_in_bytes": 1024}}}]
+            },
+        }
+    )
+
+    assert create_snapshot(client, "daily", "site-*")["indices"] == ["a", "b"]
+    # the previous snapshot is only replaced once the new one succeeded
+    assert [r[:2] for r in client.requests] == [
+        ("DELETE", f"{path}-new"),
+        ("PUT", f"{path}-new"),
+        ("DELETE", path),
+        ("PUT", path),
+        ("DELETE", f"{path}-new"),
+    ]
+    assert client.requests[1][2:] == (
+        {"indices": "site-*", "include_global_state": False},
+        {"wait_for_completion": "true"},
+    )
+    assert snapshot_size(client, "daily") == 1024
+
+    client.requests.clear()
+    snapshot["snapshot"]["state"] = "PARTIAL"
+    create_snapshot(client, "daily", "site-*")
+    assert ("DELETE", path) not in [r[:2] for r in client.requests]
+
+
+def test_restore_snapshot():
+    path = "_snapshot/invenio-cli/daily"
+    client = RecordingSearchClient(
+        {
+            ("GET", path): {"snapshots": [{"indices": ["a", "b"], "state": "SUCCESS"}]},
+            ("GET", "*,-.*/_alias"): {"b": {}, "c": {}},
+        }
+    )
+
+    restore_snapshot(client, "daily", "*,-.*")
+    # all the current indices are deleted before the restore
+    assert [r[:2] for r in client.requests] == [
+        ("GET", path),
+        ("GET", "*,-.*/_alias"),
+        ("DELETE", "a,b,c"),
+        ("POST", f"{path}/_restore"),
+    ]
+    assert client.requests[-1][2] == {"indices": "a,b", "include_aliases": True}
+
+
+def test_bulk_indexing_settings():
+    client = RecordingSearchClient(
+        {
+            ("GET", "site-*/_settings"): {
+                "site-a": {"settings": {"index.number_of_replicas": "1"}},
+                "site-b": {
+                    "settings": {
+                        "index.number_of_replicas": "1",
+                        "index.refresh_interval": "5s",
+                    }
+                },
+            }
+        }
+    )
+    settings = BulkIndexingSettings(client, "site-*")
+
+    assert settings.apply().status_code == 0
+    assert client.requests[-1][:3] == (
+        "PUT",
+        "site-a,site-b/_settings",
+        {"index.refresh_interval": "-1", "index.number_of_replicas": 0},
+    )
+
+    client.requests.clear()
+    assert settings.restore().status_code == 0
+    assert [r[:3] for r in client.requests] == [
+        (
+            "PUT",
+            "site-a/_settings",
+            {"index.refresh_interval": None, "index.number_of_replicas": "1"},
+        ),
+        (
+            "PUT",
+            "site-b/_settings",
+            {"index.refresh_interval": "5s", "index.number_of_replicas": "1"},
+        ),
+        ("POST", "site-a,site-b/_refresh", None),
+    ]
+
+
+def test_bulk_indexing_settings_unavailable():
+    client = RecordingSearchClient({("GET", "site-*/_settings"): SearchError("down")})
+    settings = BulkIndexingSettings(client, "site-*")
+
+    response = settings.apply()
+    assert response.status_code == 0
+    assert response.warning
+    # nothing to restore
+    assert settings.restore().status_code == 0
+    assert len(client.requests) == 1
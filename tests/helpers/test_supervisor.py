@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module supervisor tests."""
+
+import sys
+
+from invenio_cli.helpers.supervisor import Supervisor
+
+
+def test_supervisor_restarts_and_prefixes_output(capfd):
+    supervisor = Supervisor(max_restarts=1, max_backoff=0.1, poll_interval=0.05)
+    supervisor.add("crashy", [sys.executable, "-c", "print('hello'); exit(3)"])
+
+    exit_code = supervisor.run()
+    out, err = capfd.readouterr()
+
+    assert exit_code == 1
+    assert supervisor.processes[0].restarts == 1
+    assert out.count("crashy | hello") == 2
+    assert "exited with code 3, restarting" in err
+    assert "giving up" in err
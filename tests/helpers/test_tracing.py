@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 CERN.
+#
+# Invenio-Cli is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Module tracing tests."""
+
+import json
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from invenio_cli.cli.cli import COMMAND_NAME_KEY, TracedGroup
+from invenio_cli.helpers import tracing
+from invenio_cli.helpers.process import run_cmd
+
+
+@pytest.fixture()
+def trace_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("TRACEPARENT", raising=False)
+    monkeypatch.setattr(tracing, "_finished", [])
+    trace_file = tmp_path / "trace.json"
+    tracing.configure(trace_file)
+    yield trace_file
+    tracing.configure(None)
+
+
+def test_tracing_disabled():
+    with tracing.span("command") as span:
+        assert span is None
+        assert tracing.propagation_env({"A": "1"}) == {"A": "1"}
+
+
+def test_tracing_spans(trace_file):
+    with tracing.span("invenio-cli services setup") as root:
+        response = run_cmd(["sh", "-c", "echo $TRACEPARENT; exit 3"])
+    tracing.flush()
+
+    (line,) = trace_file.read_text().splitlines()
+    spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    subprocess, command = spans
+    attributes = {a["key"]: a["value"] for a in subprocess["attributes"]}
+
+    assert command["name"] == "invenio-cli services setup"
+    assert "parentSpanId" not in command
+    assert subprocess["parentSpanId"] == root.span_id
+    assert subprocess["traceId"] == root.trace_id
+    assert subprocess["status"]["code"] == tracing.STATUS_CODE_ERROR
+    assert attributes["process.exit_code"] == {"intValue": "3"}
+    assert attributes["process.output_bytes"] == {"intValue": "56"}
+    # the child process gets the context of the subprocess span
+    assert response.output.strip() == (f"00-{root.trace_id}-{subprocess['spanId']}-01")
+
+
+def test_tracing_continues_parent_trace(trace_file, monkeypatch):
+    trace_id, parent_id = "a" * 32, "b" * 16
+    monkeypatch.setenv("TRACEPARENT", f"00-{trace_id}-{parent_id}-01")
+
+    with tracing.span("command") as root:
+        pass
+
+    assert root.trace_id == trace_id
+    assert root.parent_span_id == parent_id
+
+
+def test_traced_group(trace_file):
+    spans = []
+
+    @click.group(cls=TracedGroup)
+    @click.pass_context
+    def cli(ctx):
+        name = ctx.meta[COMMAND_NAME_KEY]
+        spans.append(ctx.with_resource(tracing.span(name)))
+
+    @cli.group()
+    @click.option("--verbose", is_flag=True)
+    def services(verbose):
+        pass
+
+    @services.command()
+    @click.argument("status", type=int)
+    def setup(status):
+        sys.exit(status)
+
+    runner = CliRunner()
+    assert runner.invoke(cli, ["services", "--verbose", "setup", "0"]).exit_code == 0
+    assert runner.invoke(cli, ["services", "setup", "1"]).exit_code == 1
+
+    success, failure = spans
+    assert success.name == failure.name == "cli services setup"
+    assert success.status_code == tracing.STATUS_CODE_OK
+    # e.g. handle_process_response exits with the status of the failed step
+    assert failure.status_code == tracing.STATUS_CODE_ERROR
+    assert failure.status_message == "SystemExit: 1"
@@ -14,6 +14,7 @@ import pytest
 from click.testing import CliRunner
 
 from invenio_cli.cli import cli
+from invenio_cli.cli.cli import invenio_cli
 
 
 @pytest.fixture()
@@ -40,3 +41,25 @@ def test_init_with_arg(runner):
     assert result.exit_code == 0
     assert exists("my-site")
     assert exists("my-site/.invenio")
+
+
+def test_upgrade_index_workers(runner):
+    """Test that there is at least one indexing process."""
+    result = runner.invoke(invenio_cli, ["upgrade", "--index-workers", "0"])
+    assert result.exit_code == 2
+    assert "--index-workers" in result.output
+
+
+def test_run_all_max_restarts(runner):
+    """Test that the number of restarts cannot be negative."""
+    result = runner.invoke(invenio_cli, ["run", "all", "--max-restarts", "-1"])
+    assert result.exit_code == 2
+    assert "--max-restarts" in result.output
+
+
+def test_profile_options(runner):
+    """Test the profiling directory and the services profile are not mixed."""
+    result = runner.invoke(invenio_cli, ["--help"])
+    assert "--profile-dir DIRECTORY" in result.output
+    result = runner.invoke(invenio_cli, ["services", "start", "--help"])
+    assert "--profile [fast|durable]" in result.output